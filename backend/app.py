@@ -1,7 +1,9 @@
-from flask import Flask, jsonify, request, make_response, Response, send_file
+from flask import Flask, jsonify, request, make_response, Response, send_file, g
 from flask_cors import CORS
 import os
 import functools
+import hashlib
+import zlib
 from dotenv import load_dotenv
 from datetime import datetime
 import io
@@ -9,16 +11,25 @@ from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill
 import requests
 import csv
+import gzip
 import time
 
 # 통합 크롤러
 from crawlers.unified_crawler import crawl_indicator, crawl_category
 from crawlers.indicators_config import INDICATORS, CATEGORIES, get_all_enabled_indicators, get_indicator_config
+from crawlers.http_client import close_async_session, get_http_stats
+from crawlers.rate_limiter import rate_limiter as crawl_rate_limiter
+from crawlers.page_cache import page_cache
 from services.database_service import DatabaseService
 from services.crawler_service import CrawlerService
 from services.macro_cycle_service import MacroCycleService
 from services.credit_cycle_service import CreditCycleService
 from services.briefing_service import generate_briefing, get_latest_briefing
+from services.cache import TwoTierCache
+from services.json_codec import dumps_bytes
+from services.value_normalizer import release_number, to_number
+from services.crawl_scheduler import crawl_scheduler
+from services.data_generation import data_generation
 from metadata.indicator_metadata import IndicatorMetadata
 import threading
 import time
@@ -65,6 +76,13 @@ if REDIS_AVAILABLE:
         print(f"⚠️ Redis connection failed: {e}")
         redis_client = None
 
+# 응답 캐시 (워커 내 L1 LRU + Redis L2, 동시 miss 는 1회만 재계산)
+app_cache = TwoTierCache(redis_client)
+
+# 크롤링 소스별 요청 속도 제한 / 페이지 검증값을 워커 간 공유
+crawl_rate_limiter.configure_redis(redis_client)
+page_cache.configure_redis(redis_client)
+
 # CORS preflight 핸들러 추가
 @app.before_request
 def handle_preflight():
@@ -103,6 +121,15 @@ except Exception as e:
     print(f"PostgreSQL connection failed, falling back to SQLite: {e}")
     db_service = DatabaseService()
 
+# 발표 일정 기반 크롤링 스케줄 (마지막 시도 시각은 Redis 로 워커 간 공유)
+crawl_scheduler.configure(db_service, redis_client)
+data_generation.configure(
+    redis_client,
+    loader=db_service.get_data_generation if hasattr(db_service, "get_data_generation") else None
+)
+# FRED 는 저장된 원본 관측치 이후만 증분 조회
+CrawlerService.configure(observation_store=db_service if hasattr(db_service, "save_fred_observations") else None)
+
 # JWT 토큰 검증 데코레이터
 def token_required(f):
     @functools.wraps(f)
@@ -132,6 +159,78 @@ def token_required(f):
         return f(current_user, *args, **kwargs)
     return decorated
 
+# 조건부 GET (ETag / If-None-Match → 304) 용 Cache-Control
+# 브라우저/CDN 이 max-age 동안 재사용하고, 이후 stale-while-revalidate 동안은 기존 응답을 주면서 재검증
+INDICATORS_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+BRIEFING_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=3600"
+CYCLE_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+def _indicators_data_generation():
+    """지표 데이터 세대 번호 (데이터 행이 바뀌면 증가, 요청당 1회 조회)
+
+    data_generation 의 워커 L1 → Redis 순으로 읽고 DB 는 폴백으로만 조회한다.
+    조회에 실패하면 마지막으로 알던 세대, 한 번도 읽지 못했으면 None (캐시 없이 계산).
+    """
+    if "data_generation" not in g:
+        g.data_generation = data_generation.current()
+    return g.data_generation
+
+def _etag_matches(etag):
+    """If-None-Match 가 etag (또는 gzip 표현의 etag) 와 일치하는지"""
+    return request.if_none_match.contains_weak(etag) or request.if_none_match.contains_weak(f"{etag}-gz")
+
+def _add_cache_vary(response):
+    """공유 캐시(CDN) 가 압축 여부/요청 Origin 별로 응답을 나눠 보관하도록 Vary 추가
+
+    Access-Control-Allow-Origin 이 요청 Origin 에 따라 달라지므로(없거나 허용되지 않으면 생략)
+    Origin 없이 캐시하면 다른 Origin 에 잘못된 CORS 헤더가 재사용된다.
+    """
+    response.vary.add('Accept-Encoding')
+    response.vary.add('Origin')
+    return response
+
+def _not_modified_response(etag, cache_control):
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return _add_cache_vary(response)
+
+def _set_cache_headers(response, etag, cache_control):
+    """200 응답에 ETag/Cache-Control 추가 (gzip 본문은 별도 표현이므로 -gz 를 붙인다)"""
+    if response.status_code != 200:
+        return response
+    if response.headers.get('Content-Encoding') == 'gzip':
+        etag = f"{etag}-gz"
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return _add_cache_vary(response)
+
+def data_versioned_etag(name, cache_control):
+    """데이터 세대 기반 강한 ETag + 304 + Cache-Control 데코레이터 (GET 전용)
+
+    ETag 는 지표 데이터 세대 번호와 쿼리 파라미터로 정해지므로 일치하면 본문 계산 없이 304 를 반환한다
+    (force=1 요청은 제외).
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def decorated(*args, **kwargs):
+            generation = _indicators_data_generation()
+            if generation is None:
+                return f(*args, **kwargs)
+
+            etag = f"{name}-g{generation}"
+            if request.args:
+                query = "&".join(f"{k}={v}" for k, v in sorted(request.args.items(multi=True)))
+                etag += "-" + hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+
+            # force=1 은 캐시를 무시하고 다시 계산하라는 요청이므로 304 로 끊지 않는다
+            if request.args.get("force") != "1" and _etag_matches(etag):
+                return _not_modified_response(etag, cache_control)
+
+            return _set_cache_headers(make_response(f(*args, **kwargs)), etag, cache_control)
+        return decorated
+    return decorator
+
 # 보안 헤더 추가
 @app.after_request
 def after_request(response):
@@ -148,6 +247,7 @@ update_status = {
     "current_indicator": "",
     "completed_indicators": [],
     "failed_indicators": [],
+    "unchanged_indicators": [],  # 페이지가 바뀌지 않아 파싱/저장을 건너뛴 지표
     "total_indicators": 0,  # 전체 지표 개수
     "start_time": None
 }
@@ -177,10 +277,25 @@ def save_update_status():
         except Exception as e:
             print(f"⚠️ Redis set update_status error: {e}")
 
-# 인메모리 캐시 (지표 전체 조회용)
-INDICATORS_CACHE = {"data": None, "timestamp": 0}
-INDICATORS_CACHE_TTL = 300  # seconds
+# 지표 전체 조회 캐시 (app_cache, 데이터 세대 + history_limit 별 키)
+INDICATORS_CACHE_PREFIX = "indicators:all:v2:"
+INDICATORS_CACHE_TTL = 300  # seconds, 이후에는 이전 응답을 주면서 백그라운드 재계산
+INDICATORS_CACHE_HARD_TTL = int(os.getenv("INDICATORS_CACHE_HARD_TTL", "1800"))  # 최대 stale 허용 시간
+# 캐시된 JSON 본문을 gzip 으로 미리 압축해서 보관 (Accept-Encoding: gzip 클라이언트에 그대로 전송)
+RESPONSE_GZIP_ENABLED = os.getenv('RESPONSE_GZIP', 'true').lower() in ('1', 'true', 'yes')
+RESPONSE_GZIP_MIN_BYTES = 1024
+# 사이클 계산 결과 캐시 (데이터 세대별 키, 지표 캐시와 같은 최대 보관 시간)
+CYCLE_CACHE_PREFIX = "cycles:"
+# 부팅/업데이트 직후 미리 계산할 /api/v2/indicators history_limit 값들
+CACHE_WARMUP_HISTORY_LIMITS = [
+    int(v) for v in os.getenv("CACHE_WARMUP_HISTORY_LIMITS", "12").split(",") if v.strip().lstrip("-").isdigit()
+]
+CACHE_WARMUP_ON_BOOT = os.getenv("CACHE_WARMUP_ON_BOOT", "true").lower() in ('1', 'true', 'yes')
 MAX_UPDATE_DURATION = 600  # seconds, 오래 걸리면 스테일 처리
+# 발표 직후 자동 크롤링 (services/crawl_scheduler.py), 대기 최대 간격
+CRAWL_SCHEDULER_ENABLED = os.getenv("CRAWL_SCHEDULER_ENABLED", "true").lower() in ('1', 'true', 'yes')
+CRAWL_SCHEDULER_POLL_SECONDS = int(os.getenv("CRAWL_SCHEDULER_POLL_SECONDS", "300"))
+CRAWL_SCHEDULER_LOCK_KEY = "crawl:schedule:leader"
 
 def _missing_retail_sales(*_args, **_kwargs):
     return {"error": "Retail sales crawler not available"}
@@ -233,12 +348,30 @@ def health_check():
             except Exception as db_error:
                 db_status = f"error: {str(db_error)}"
 
-        return jsonify({
+        response = {
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "database": db_status,
             "service": "investment-app-backend"
-        })
+        }
+
+        # PostgreSQL 커넥션 풀 통계 (in_use / waiting / wait_time)
+        if hasattr(db_service, "get_pool_stats"):
+            try:
+                response["db_pool"] = db_service.get_pool_stats()
+            except Exception as pool_error:
+                response["db_pool"] = {"error": str(pool_error)}
+
+        # 응답 캐시 적중/미스 통계 + 워밍 완료 여부
+        response["cache"] = app_cache.stats()
+        response["cache_ready"] = cache_warmup_status["ready"]
+        response["cache_warmup"] = dict(cache_warmup_status)
+
+        # 크롤러 HTTP 커넥션 풀 호스트별 통계 (요청/신규 커넥션/응답 시간)
+        response["http_clients"] = get_http_stats()
+        response["page_cache"] = page_cache.stats()
+
+        return jsonify(response)
     except Exception as e:
         return jsonify({
             "status": "unhealthy",
@@ -251,6 +384,16 @@ def api_health_check():
     """GitHub Actions용 헬스체크 엔드포인트 (/api/health)"""
     return health_check()
 
+@app.route('/api/health/ready', methods=['GET'])
+def readiness_check():
+    """readiness 체크 (캐시 워밍이 끝나기 전에는 503)"""
+    status_code = 200 if cache_warmup_status["ready"] else 503
+    return jsonify({
+        "ready": cache_warmup_status["ready"],
+        "cache_warmup": dict(cache_warmup_status),
+        "timestamp": datetime.now().isoformat()
+    }), status_code
+
 @app.route('/api/economic-indicators')
 def get_economic_indicators():
     mock_data = [
@@ -1011,18 +1154,8 @@ CATEGORY_GUIDELINES = {
 
 
 def _to_float(value):
-    """문자/숫자 값을 float로 변환. 실패 시 None"""
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    if isinstance(value, str):
-        try:
-            cleaned = value.replace("%", "").replace("K", "000").replace(",", "").strip()
-            return float(cleaned)
-        except Exception:
-            return None
-    return None
+    """문자/숫자 값을 float로 변환. 실패 시 None (지표값은 value_normalizer 규칙: 218K → 218)"""
+    return to_number(value)
 
 
 def _days_old(release_date_str):
@@ -1050,7 +1183,7 @@ def _freshness_weight(days_old):
 def _history_trend(history_rows):
     actuals = []
     for row in history_rows:
-        value = _to_float(row.get("actual"))
+        value = release_number(row)
         if value is not None:
             actuals.append(value)
 
@@ -1579,183 +1712,331 @@ manual_check 지표는 제외되어 있습니다.
             fallback["openai_error"] = masked
         return fallback
 
+def _json_bytes_response(body, gzip_body=None):
+    """이미 인코딩된 JSON bytes 를 그대로 응답 (클라이언트가 gzip 을 받으면 압축본 사용)"""
+    accepts_gzip = 'gzip' in request.headers.get('Accept-Encoding', '').lower()
+    if gzip_body is not None and accepts_gzip:
+        response = Response(gzip_body, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(body, mimetype='application/json')
+    return _add_cache_vary(response)
+
+
+def _gzip_cached(cache_key, body, ttl):
+    """cache_key 본문의 gzip 압축본 (워커 L1 에만 보관, 작은 본문은 None)
+
+    본문이 백그라운드에서 교체될 수 있으므로 키에 본문 CRC 를 포함한다.
+    """
+    if not RESPONSE_GZIP_ENABLED or len(body) < RESPONSE_GZIP_MIN_BYTES:
+        return None
+    return app_cache.get_or_set(
+        f"{cache_key}:gzip:{zlib.crc32(body):08x}",
+        lambda: gzip.compress(body, compresslevel=6),
+        ttl,
+        raw=True,
+        local_only=True
+    )
+
+
+def _build_indicators_response(history_limit):
+    """/api/v2/indicators 응답 생성 (지표 + 히스토리 + 3대/마스터 사이클)"""
+    # indicators_config.py에서 활성화된 모든 지표 가져오기
+    all_indicator_ids = list(get_all_enabled_indicators().keys())
+    results = []
+    last_updated = None
+
+    # ✅ Phase 2 최적화: 배치 쿼리 (47회 → 4회 쿼리로 감소)
+    # 1. 모든 지표 데이터를 한 번에 조회
+    all_data = db_service.get_multiple_indicators_data(all_indicator_ids)
+
+    # 2. 히스토리 데이터도 한 번에 조회 (필요한 경우)
+    all_history = {}
+    if history_limit > 0:
+        all_history = db_service.get_multiple_history_data(all_indicator_ids, limit=history_limit)
+
+    # 3. 조회한 데이터로 results 구성
+    for indicator_id in all_indicator_ids:
+        data = all_data.get(indicator_id, {})
+        has_error = "error" in data
+
+        # 히스토리 데이터 가져오기
+        history = all_history.get(indicator_id, [])
+
+        # 메타데이터 추가 - 안전한 방식으로 get_indicator_config 사용
+        metadata = get_indicator_config(indicator_id)
+
+        # last_updated 추출 (가장 최신 업데이트 시간)
+        indicator_updated = data.get("last_updated") if not has_error else None
+        if indicator_updated:
+            if not last_updated or indicator_updated > last_updated:
+                last_updated = indicator_updated
+
+        # 해석 메타데이터 추가
+        interpretation = IndicatorMetadata.get_interpretation(indicator_id)
+
+        # Surprise 계산 (actual - forecast)
+        latest = data.get("latest_release", {}) if not has_error else {}
+        next_release = data.get("next_release", {}) if not has_error else {}
+        actual_num = release_number(latest, "actual")
+        forecast_num = release_number(latest, "forecast")
+        surprise = None
+
+        if actual_num is not None and forecast_num is not None:
+            surprise = round(actual_num - forecast_num, 2)
+
+        results.append({
+            "indicator_id": indicator_id,
+            "name": CrawlerService.get_indicator_name(indicator_id),
+            "name_ko": metadata.name_ko if metadata else None,
+            "category": metadata.category if metadata else "business",
+            "reverse_color": metadata.reverse_color if metadata else False,
+            "manual_check": metadata.manual_check if metadata else False,  # 직접 확인 필요 여부
+            "is_core": metadata.is_core if metadata else False,  # 핵심 지표 여부
+            "url": metadata.url if metadata else None,  # 직접 확인 URL
+            "surprise": surprise,  # Surprise 값 추가
+            "interpretation": interpretation,  # 5개 섹션 해석 추가
+            "data": {
+                "latest_release": latest,
+                "next_release": next_release,
+                "history_table": history
+            }
+        })
+
+    # ✅ results 배열을 딕셔너리로 변환 (중복 DB 조회 방지)
+    indicators_dict = {}
+    for item in results:
+        indicator_id = item.get('indicator_id')
+        latest_release = item.get('data', {}).get('latest_release') if item.get('data') else None
+        if indicator_id and latest_release:
+            # 전체 item을 저장 (latest_release뿐만 아니라 next_release, history도 포함)
+            indicators_dict[indicator_id] = item
+
+    # 3대 사이클 계산 (✅ DB 재조회 없이 results 데이터 재사용)
+    try:
+        macro_cycle_service = MacroCycleService(db_service)
+        macro_cycle = macro_cycle_service.calculate_cycle_from_data(indicators_dict)
+    except Exception as e:
+        print(f"Macro cycle calculation error: {e}")
+        macro_cycle = None
+
+    try:
+        credit_cycle_service = CreditCycleService(db_service)
+        credit_cycle = credit_cycle_service.calculate_cycle_from_data(indicators_dict)
+    except Exception as e:
+        print(f"Credit cycle calculation error: {e}")
+        credit_cycle = None
+
+    try:
+        from services.sentiment_cycle_service import SentimentCycleService
+        sentiment_cycle_service = SentimentCycleService(db_service)
+        sentiment_cycle = sentiment_cycle_service.calculate_cycle_from_data(indicators_dict)
+    except Exception as e:
+        print(f"Sentiment cycle calculation error: {e}")
+        sentiment_cycle = None
+
+    # ✅ Master Market Cycle 계산 (3대 사이클 통합)
+    # Phase 1 최적화: 이미 조회한 indicators_dict 재사용 (DB 재조회 17회 제거)
+    master_cycle = None
+    try:
+        from services.cycle_engine import calculate_master_cycle_v1_from_data
+        master_cycle = calculate_master_cycle_v1_from_data(indicators_dict)
+    except Exception as e:
+        print(f"Master cycle calculation error: {e}")
+        master_cycle = None
+
+    response_data = {
+        "status": "success",
+        "indicators": results,
+        "total_count": len(results),
+        "source": "database",
+        "last_updated": last_updated,  # 가장 최신 업데이트 시간
+        # ✅ 3대 사이클 데이터 추가 (4개 요청 → 1개 요청 최적화)
+        "macro_cycle": macro_cycle,
+        "credit_cycle": credit_cycle,
+        "sentiment_cycle": sentiment_cycle,
+        # ✅ Master Market Cycle 추가 (3대 사이클 통합 점수)
+        "master_cycle": master_cycle
+    }
+
+    return response_data
+
+
 @app.route('/api/v2/indicators')
+@data_versioned_etag("indicators", INDICATORS_CACHE_CONTROL)
 def get_all_indicators_from_db():
     """데이터베이스에서 모든 지표 데이터 조회 (빠른 로딩용) - 히스토리 포함"""
     try:
         force_refresh = request.args.get("force") == "1"
-        now_ts = time.time()
         # 히스토리 개수 제한 (기본 12개). 0이면 히스토리 스킵.
         try:
             history_limit = int(request.args.get("history_limit", "12"))  # 기본: 12개 히스토리
         except ValueError:
             history_limit = 12
 
-        # ✅ Phase 3: Redis 캐시 확인 (최우선)
-        cache_key = f'indicators:all:v2:history_{history_limit}'
-        if not force_refresh and redis_client:
-            try:
-                cached = redis_client.get(cache_key)
-                if cached:
-                    print(f"✅ Redis cache hit: {cache_key}")
-                    return jsonify(json.loads(cached))
-            except Exception as e:
-                print(f"⚠️ Redis get error: {e}")
+        # 데이터 세대(지표 저장 시 증가) + history_limit 별 캐시 (L1 → Redis, 동시 miss 는 1회만 재계산)
+        # 세대가 바뀌면 새 키를 사용하므로 별도 무효화가 필요 없다 (이전 키는 TTL 로 만료)
+        # 캐시에는 최종 JSON bytes 를 저장해서 적중 시 디코딩/재인코딩 없이 그대로 전송
+        generation = _indicators_data_generation()
+        cache_key = f'{INDICATORS_CACHE_PREFIX}g{generation}:history_{history_limit}'
+        if generation is None:
+            return _json_bytes_response(dumps_bytes(_build_indicators_response(history_limit)))
+
+        if force_refresh:
+            body = dumps_bytes(_build_indicators_response(history_limit))
+            app_cache.set(cache_key, body, INDICATORS_CACHE_HARD_TTL, raw=True)
+        else:
+            # soft TTL(INDICATORS_CACHE_TTL) 이 지나면 이전 본문을 그대로 주고 백그라운드에서 1회 재계산
+            body = app_cache.get_or_refresh(
+                cache_key,
+                lambda: dumps_bytes(_build_indicators_response(history_limit)),
+                INDICATORS_CACHE_TTL,
+                INDICATORS_CACHE_HARD_TTL,
+                raw=True
+            )
 
-        # ✅ 메모리 캐시 확인 (Redis 없을 때 폴백)
-        if not force_refresh and INDICATORS_CACHE["data"] and (now_ts - INDICATORS_CACHE["timestamp"] < INDICATORS_CACHE_TTL):
-            return jsonify(INDICATORS_CACHE["data"])
+        return _json_bytes_response(body, _gzip_cached(cache_key, body, INDICATORS_CACHE_HARD_TTL))
 
-        # indicators_config.py에서 활성화된 모든 지표 가져오기
-        from crawlers.indicators_config import get_all_enabled_indicators
-        all_indicator_ids = list(get_all_enabled_indicators().keys())
-        results = []
-        last_updated = None
+    except Exception as e:
+        import traceback
+        print(f"Error in get_all_indicators_from_db: {traceback.format_exc()}")
+        return jsonify({
+            "status": "error",
+            "message": f"Database query failed: {str(e)}"
+        }), 500
 
-        # ✅ Phase 2 최적화: 배치 쿼리 (47회 → 4회 쿼리로 감소)
-        # 1. 모든 지표 데이터를 한 번에 조회
-        all_data = db_service.get_multiple_indicators_data(all_indicator_ids)
 
-        # 2. 히스토리 데이터도 한 번에 조회 (필요한 경우)
-        all_history = {}
-        if history_limit > 0:
-            all_history = db_service.get_multiple_history_data(all_indicator_ids, limit=history_limit)
+def _calculate_macro_cycle():
+    return MacroCycleService(db_service).calculate_cycle()
 
-        # 3. 조회한 데이터로 results 구성
-        for indicator_id in all_indicator_ids:
-            data = all_data.get(indicator_id, {})
-            has_error = "error" in data
 
-            # 히스토리 데이터 가져오기
-            history = all_history.get(indicator_id, [])
+def _calculate_credit_cycle():
+    return CreditCycleService(db_service).calculate_cycle()
 
-            # 메타데이터 추가 - 안전한 방식으로 get_indicator_config 사용
-            metadata = get_indicator_config(indicator_id)
 
-            # last_updated 추출 (가장 최신 업데이트 시간)
-            indicator_updated = data.get("last_updated") if not has_error else None
-            if indicator_updated:
-                if not last_updated or indicator_updated > last_updated:
-                    last_updated = indicator_updated
+def _calculate_sentiment_cycle():
+    from services.sentiment_cycle_service import SentimentCycleService
+    return SentimentCycleService(db_service).calculate_cycle()
 
-            # 해석 메타데이터 추가
-            interpretation = IndicatorMetadata.get_interpretation(indicator_id)
 
-            # Surprise 계산 (actual - forecast)
-            latest = data.get("latest_release", {}) if not has_error else {}
-            next_release = data.get("next_release", {}) if not has_error else {}
-            actual = latest.get("actual")
-            forecast = latest.get("forecast")
-            surprise = None
+def _calculate_master_cycle_v3():
+    from services.cycle_engine import calculate_master_cycle_v3
+    return calculate_master_cycle_v3(db_service)
 
-            if actual is not None and forecast is not None:
-                try:
-                    # 문자열 처리 (%, K 단위)
-                    actual_num = float(str(actual).replace('%', '').replace('K', '000')) if isinstance(actual, str) else float(actual)
-                    forecast_num = float(str(forecast).replace('%', '').replace('K', '000')) if isinstance(forecast, str) else float(forecast)
-                    surprise = round(actual_num - forecast_num, 2)
-                except (ValueError, TypeError):
-                    surprise = None
-
-            results.append({
-                "indicator_id": indicator_id,
-                "name": CrawlerService.get_indicator_name(indicator_id),
-                "name_ko": metadata.name_ko if metadata else None,
-                "category": metadata.category if metadata else "business",
-                "reverse_color": metadata.reverse_color if metadata else False,
-                "manual_check": metadata.manual_check if metadata else False,  # 직접 확인 필요 여부
-                "is_core": metadata.is_core if metadata else False,  # 핵심 지표 여부
-                "url": metadata.url if metadata else None,  # 직접 확인 URL
-                "surprise": surprise,  # Surprise 값 추가
-                "interpretation": interpretation,  # 5개 섹션 해석 추가
-                "data": {
-                    "latest_release": latest,
-                    "next_release": next_release,
-                    "history_table": history
-                }
-            })
 
-        # ✅ results 배열을 딕셔너리로 변환 (중복 DB 조회 방지)
-        indicators_dict = {}
-        for item in results:
-            indicator_id = item.get('indicator_id')
-            latest_release = item.get('data', {}).get('latest_release') if item.get('data') else None
-            if indicator_id and latest_release:
-                # 전체 item을 저장 (latest_release뿐만 아니라 next_release, history도 포함)
-                indicators_dict[indicator_id] = item
+def _calculate_master_cycle_v4():
+    from services.cycle_engine import calculate_master_cycle_v4
+    return calculate_master_cycle_v4(db_service)
 
-        # 3대 사이클 계산 (✅ DB 재조회 없이 results 데이터 재사용)
-        try:
-            macro_cycle_service = MacroCycleService(db_service)
-            macro_cycle = macro_cycle_service.calculate_cycle_from_data(indicators_dict)
-        except Exception as e:
-            print(f"Macro cycle calculation error: {e}")
-            macro_cycle = None
 
-        try:
-            credit_cycle_service = CreditCycleService(db_service)
-            credit_cycle = credit_cycle_service.calculate_cycle_from_data(indicators_dict)
-        except Exception as e:
-            print(f"Credit cycle calculation error: {e}")
-            credit_cycle = None
+# 사이클 API 별 계산 함수 (라우트와 캐시 워밍이 공유)
+CYCLE_CALCULATORS = {
+    "macro": _calculate_macro_cycle,
+    "credit": _calculate_credit_cycle,
+    "sentiment": _calculate_sentiment_cycle,
+    "master_v3": _calculate_master_cycle_v3,
+    "master_v4": _calculate_master_cycle_v4,
+}
 
-        try:
-            from services.sentiment_cycle_service import SentimentCycleService
-            sentiment_cycle_service = SentimentCycleService(db_service)
-            sentiment_cycle = sentiment_cycle_service.calculate_cycle_from_data(indicators_dict)
-        except Exception as e:
-            print(f"Sentiment cycle calculation error: {e}")
-            sentiment_cycle = None
+# _cached_cycle 의 generation 미지정 표시 (None 은 "세대 조회 실패" 의미로 쓰임)
+_MISSING_GENERATION = object()
 
-        # ✅ Master Market Cycle 계산 (3대 사이클 통합)
-        # Phase 1 최적화: 이미 조회한 indicators_dict 재사용 (DB 재조회 17회 제거)
-        master_cycle = None
-        try:
-            from services.cycle_engine import calculate_master_cycle_v1_from_data
-            master_cycle = calculate_master_cycle_v1_from_data(indicators_dict)
-        except Exception as e:
-            print(f"Master cycle calculation error: {e}")
-            master_cycle = None
 
-        response_data = {
-            "status": "success",
-            "indicators": results,
-            "total_count": len(results),
-            "source": "database",
-            "last_updated": last_updated,  # 가장 최신 업데이트 시간
-            # ✅ 3대 사이클 데이터 추가 (4개 요청 → 1개 요청 최적화)
-            "macro_cycle": macro_cycle,
-            "credit_cycle": credit_cycle,
-            "sentiment_cycle": sentiment_cycle,
-            # ✅ Master Market Cycle 추가 (3대 사이클 통합 점수)
-            "master_cycle": master_cycle
-        }
+def _cached_cycle(name, generation=_MISSING_GENERATION):
+    """사이클 계산 결과 (데이터 세대가 같으면 캐시 재사용, 세대 조회 실패 시 매번 계산)
 
-        # ✅ 캐시 저장
-        INDICATORS_CACHE["data"] = response_data
-        INDICATORS_CACHE["timestamp"] = now_ts
+    반환값은 캐시 공유 객체이므로 수정하지 말 것.
+    """
+    calculate = CYCLE_CALCULATORS[name]
+    if generation is _MISSING_GENERATION:
+        generation = _indicators_data_generation()
+    if generation is None:
+        return calculate()
+    return app_cache.get_or_set(f"{CYCLE_CACHE_PREFIX}g{generation}:{name}", calculate, INDICATORS_CACHE_HARD_TTL)
+
+
+# 캐시 워밍 상태 (워커별, 헬스체크에 노출)
+cache_warmup_status = {
+    "ready": False,
+    "in_progress": False,
+    "reason": None,
+    "generation": None,
+    "last_warmed_at": None,
+    "duration_ms": None,
+    "errors": [],
+}
+_cache_warmup_lock = threading.Lock()
 
-        # ✅ Phase 3: Redis 캐시 저장 (5분 TTL)
-        if redis_client:
-            try:
-                redis_client.setex(
-                    cache_key,
-                    300,  # 5분 TTL
-                    json.dumps(response_data)
-                )
-                print(f"✅ Redis cache saved: {cache_key}")
-            except Exception as e:
-                print(f"⚠️ Redis set error: {e}")
 
-        return jsonify(response_data)
+def warm_caches(reason="manual"):
+    """자주 쓰는 응답을 미리 계산해서 캐시에 채움 (부팅 시, 지표 업데이트 직후)
 
+    - /api/v2/indicators: CACHE_WARMUP_HISTORY_LIMITS 의 history_limit 별 본문 + gzip 본문
+    - 최신 브리핑
+    - 사이클 API 계산 결과
+
+    다른 워커가 이미 채운 키는 L2 에서 가져오므로 다시 계산하지 않는다.
+    """
+    if not _cache_warmup_lock.acquire(blocking=False):
+        return cache_warmup_status
+
+    started = time.time()
+    errors = []
+    cache_warmup_status.update({"in_progress": True, "reason": reason})
+    try:
+        generation = data_generation.current(refresh=True)
+        if generation is not None:
+            for history_limit in CACHE_WARMUP_HISTORY_LIMITS:
+                cache_key = f'{INDICATORS_CACHE_PREFIX}g{generation}:history_{history_limit}'
+                try:
+                    body = app_cache.get_or_set(
+                        cache_key,
+                        lambda limit=history_limit: dumps_bytes(_build_indicators_response(limit)),
+                        INDICATORS_CACHE_HARD_TTL,
+                        raw=True
+                    )
+                    _gzip_cached(cache_key, body, INDICATORS_CACHE_HARD_TTL)
+                except Exception as e:
+                    errors.append(f"indicators history_{history_limit}: {e}")
+
+            for name in CYCLE_CALCULATORS:
+                try:
+                    _cached_cycle(name, generation)
+                except Exception as e:
+                    errors.append(f"cycle {name}: {e}")
+
+        try:
+            if not get_latest_briefing(cache=app_cache):
+                generate_briefing(db_service, cache=app_cache, force=False)
+        except Exception as e:
+            errors.append(f"briefing: {e}")
+
+        duration_ms = int((time.time() - started) * 1000)
+        cache_warmup_status.update({
+            "ready": True,
+            "generation": generation,
+            "last_warmed_at": datetime.now().isoformat(),
+            "duration_ms": duration_ms,
+            "errors": errors,
+        })
+        if errors:
+            print(f"⚠️ Cache warm-up ({reason}) finished with errors in {duration_ms}ms: {errors}")
+        else:
+            print(f"✅ Cache warm-up ({reason}) finished in {duration_ms}ms (generation {generation})")
     except Exception as e:
-        import traceback
-        print(f"Error in get_all_indicators_from_db: {traceback.format_exc()}")
-        return jsonify({
-            "status": "error",
-            "message": f"Database query failed: {str(e)}"
-        }), 500
+        cache_warmup_status["errors"] = [str(e)]
+        print(f"⚠️ Cache warm-up ({reason}) error: {e}")
+    finally:
+        cache_warmup_status["in_progress"] = False
+        _cache_warmup_lock.release()
+    return cache_warmup_status
+
+
+def start_cache_warmup(reason="manual"):
+    """warm_caches 를 백그라운드 스레드에서 실행 (이미 진행 중이면 무시)"""
+    if cache_warmup_status["in_progress"]:
+        return
+    threading.Thread(target=warm_caches, args=(reason,), name="cache-warmup", daemon=True).start()
 
 
 @app.route('/api/v2/indicators/ai-interpretation', methods=['GET'])
@@ -1803,9 +2084,9 @@ def get_ai_interpretation_for_indicators():
             freshness_weight = _freshness_weight(days_old)
             trend = _history_trend(history_rows)
 
-            actual_num = _to_float(actual)
-            forecast_num = _to_float(forecast)
-            previous_num = _to_float(previous)
+            actual_num = release_number(latest, "actual")
+            forecast_num = release_number(latest, "forecast")
+            previous_num = release_number(latest, "previous")
 
             surprise = None
             if actual_num is not None and forecast_num is not None:
@@ -1830,7 +2111,7 @@ def get_ai_interpretation_for_indicators():
                 "trend_direction": trend.get("direction"),
                 "trend_acceleration": trend.get("acceleration"),
                 "history_actuals": [
-                    _to_float(row.get("actual")) for row in history_rows[:4]
+                    release_number(row) for row in history_rows[:4]
                 ],
             })
 
@@ -1875,6 +2156,25 @@ def get_ai_interpretation_for_indicators():
             "message": f"AI interpretation failed: {str(e)}"
         }), 500
 
+def _get_multiple_indicators_data(indicator_ids):
+    """지표 데이터 배치 조회 (배치 API가 없는 백엔드는 지표별 조회로 폴백)"""
+    if hasattr(db_service, "get_multiple_indicators_data"):
+        return db_service.get_multiple_indicators_data(indicator_ids)
+    return {indicator_id: db_service.get_indicator_data(indicator_id) for indicator_id in indicator_ids}
+
+
+def _get_multiple_crawl_info(indicator_ids):
+    """크롤링 정보 배치 조회 (배치 API가 없는 백엔드는 지표별 조회로 폴백)"""
+    if hasattr(db_service, "get_multiple_crawl_info"):
+        return db_service.get_multiple_crawl_info(indicator_ids)
+    result = {}
+    for indicator_id in indicator_ids:
+        crawl_info = db_service.get_crawl_info(indicator_id)
+        if crawl_info:
+            result[indicator_id] = crawl_info
+    return result
+
+
 @app.route('/api/v2/indicators/health-check')
 def get_indicators_health_check():
     """모든 지표의 데이터 신선도 및 상태 확인"""
@@ -1896,6 +2196,14 @@ def get_indicators_health_check():
             "error": 0
         }
 
+        # 배치 조회 (지표당 4~5회 쿼리 → 전체 4회)
+        crawl_ids = [
+            indicator_id for indicator_id in all_indicator_ids
+            if not getattr(get_indicator_config(indicator_id), "manual_check", False)
+        ]
+        all_data = _get_multiple_indicators_data(crawl_ids)
+        all_crawl_info = _get_multiple_crawl_info(crawl_ids)
+
         for indicator_id in all_indicator_ids:
             metadata = get_indicator_config(indicator_id)
             if metadata and metadata.manual_check:
@@ -1911,9 +2219,9 @@ def get_indicators_health_check():
                 continue
 
             # 지표 데이터 조회
-            data = db_service.get_indicator_data(indicator_id)
+            data = all_data.get(indicator_id) or {"error": "No data found"}
 
-            crawl_info = db_service.get_crawl_info(indicator_id)
+            crawl_info = all_crawl_info.get(indicator_id)
             crawl_error = crawl_info and crawl_info.get("status") == "error"
             error_message = crawl_info.get("error_message") if crawl_info else None
 
@@ -2051,7 +2359,7 @@ def generate_indicator_briefing():
     try:
         body = request.get_json(silent=True) or {}
         force = bool(body.get("force"))
-        result = generate_briefing(db_service, redis_client=redis_client, force=force)
+        result = generate_briefing(db_service, cache=app_cache, force=force)
         return jsonify(result)
     except Exception as e:
         import traceback
@@ -2066,12 +2374,20 @@ def generate_indicator_briefing():
 def get_indicator_briefing():
     """최신 브리핑 조회 (없으면 1회 생성)"""
     try:
-        cached = get_latest_briefing(redis_client=redis_client)
-        if cached:
-            return jsonify(cached)
+        cached = get_latest_briefing(cache=app_cache)
+        result = cached or generate_briefing(db_service, cache=app_cache, force=False)
 
-        result = generate_briefing(db_service, redis_client=redis_client, force=False)
-        return jsonify(result)
+        # 브리핑은 데이터 시그니처 + 생성 시각으로 ETag (같은 데이터로 재생성하면 바뀜)
+        etag = None
+        if result.get("data_signature"):
+            etag = "briefing-" + hashlib.sha1(
+                f"{result['data_signature']}:{result.get('generated_at')}".encode("utf-8")
+            ).hexdigest()[:24]
+            if _etag_matches(etag):
+                return _not_modified_response(etag, BRIEFING_CACHE_CONTROL)
+
+        response = jsonify(result)
+        return _set_cache_headers(response, etag, BRIEFING_CACHE_CONTROL) if etag else response
     except Exception as e:
         import traceback
         print(f"Error in get briefing endpoint: {traceback.format_exc()}")
@@ -2169,7 +2485,13 @@ def get_history_from_db(indicator_id):
         except ValueError:
             limit = None
 
-        history_data = db_service.get_history_data(indicator_id, limit=limit)
+        # 기간 조회 (YYYY-MM-DD). 히스토리는 누적 저장되므로 범위/개수 미지정 시 최근 12개
+        start = request.args.get("start")
+        end = request.args.get("end")
+        if start or end:
+            history_data = db_service.get_history_range(indicator_id, start=start, end=end, limit=limit)
+        else:
+            history_data = db_service.get_history_data(indicator_id, limit=limit or 12)
 
         return jsonify({
             "status": "success",
@@ -2185,41 +2507,8 @@ def get_history_from_db(indicator_id):
             "message": f"Database query failed: {str(e)}"
         }), 500
 
-def _should_refresh_indicator(indicator_id, stale_days=7):
-    """남은 지표만 업데이트할지 판단."""
-    try:
-        data = db_service.get_indicator_data(indicator_id)
-        crawl_info = db_service.get_crawl_info(indicator_id)
-
-        if not isinstance(data, dict) or "error" in data:
-            return True
-
-        latest = data.get("latest_release", {})
-        release_date = latest.get("release_date")
-        actual = latest.get("actual")
-
-        if actual in [None, "", "-"]:
-            return True
-        if not release_date or release_date == "미정":
-            return True
-
-        try:
-            release_dt = datetime.strptime(str(release_date), "%Y-%m-%d")
-            days_old = max((datetime.now() - release_dt).days, 0)
-            if days_old >= stale_days:
-                return True
-        except Exception:
-            return True
-
-        if crawl_info and crawl_info.get("status") == "error":
-            return True
-
-        return False
-    except Exception:
-        return True
-
-
 def _select_indicators_for_update(remaining_only=True):
+    """업데이트할 지표 (remaining_only: 발표 일정/주기상 지금 크롤링할 지표만, services/crawl_scheduler.py)"""
     from crawlers.indicators_config import get_all_enabled_indicators
 
     enabled = [
@@ -2231,21 +2520,64 @@ def _select_indicators_for_update(remaining_only=True):
     if not remaining_only:
         return enabled
 
-    stale_days = int(os.getenv("UPDATE_REMAINING_STALE_DAYS", "7"))
-    return [indicator_id for indicator_id in enabled if _should_refresh_indicator(indicator_id, stale_days=stale_days)]
+    return crawl_scheduler.due_indicators(enabled)
 
 
 async def update_all_indicators_background_async(remaining_only=True):
     """백그라운드 지표 업데이트 (기본: 남은 지표만)."""
-    global update_status, INDICATORS_CACHE
+    global update_status
     import asyncio
 
+    # 성공 결과는 모아서 배치 upsert (지표당 왕복 대신 배치당 1회)
+    save_batch_size = max(1, int(os.getenv("CRAWL_SAVE_BATCH_SIZE", "10")))
+    pending_saves = {}
+    # 저장 성공 후 기록할 페이지 검증값 (ETag/Last-Modified/본문 해시)
+    pending_validators = {}
+    # 크롤링을 시도한 지표 (다음 스케줄 계산용 마지막 시도 시각)
+    attempted_indicators = []
+
+    def flush_pending_saves():
+        """모아 둔 결과 저장 - 저장에 성공한 지표만 completed, 실패한 지표는 failed (+ 오류 crawl_info)"""
+        if not pending_saves:
+            return
+        batch = dict(pending_saves)
+        validators = dict(pending_validators)
+        pending_saves.clear()
+        pending_validators.clear()
+
+        if hasattr(db_service, "save_multiple_indicators_data"):
+            try:
+                saved = db_service.save_multiple_indicators_data(batch)
+            except Exception as e:
+                print(f"⚠️ Batch save error for {len(batch)} indicators: {e}")
+                saved = False
+            if saved:
+                for pending_id in batch:
+                    page_cache.commit(validators.get(pending_id))
+                    update_status["completed_indicators"].append(pending_id)
+                return
+            print(f"⚠️ Batch save failed for {len(batch)} indicators, saving individually")
+
+        # 개별 저장 (배치 실패 시 불량 데이터 지표만 실패 처리, save_indicator_data 가 오류 crawl_info 기록)
+        for pending_id, pending_data in batch.items():
+            try:
+                db_service.save_indicator_data(pending_id, pending_data)
+            except Exception as e:
+                update_status["failed_indicators"].append({
+                    "indicator_id": pending_id,
+                    "error": f"Save failed: {str(e)}"
+                })
+                continue
+            page_cache.commit(validators.get(pending_id))
+            update_status["completed_indicators"].append(pending_id)
+
     try:
         update_status["is_updating"] = True
         update_status["start_time"] = time.time()
         update_status["progress"] = 0
         update_status["completed_indicators"] = []
         update_status["failed_indicators"] = []
+        update_status["unchanged_indicators"] = []
         update_status["current_indicator"] = ""
         update_status["total_indicators"] = 0
         save_update_status()
@@ -2261,18 +2593,24 @@ async def update_all_indicators_background_async(remaining_only=True):
             save_update_status()
             return
 
-        # 비동기 크롤링 설정
-        # 동시 요청 제한 + 지터로 429 완화
-        max_concurrency = int(os.getenv("CRAWL_MAX_CONCURRENCY", "4"))
-        semaphore = asyncio.Semaphore(max_concurrency)
+        # 비동기 크롤링: 요청 속도/동시성은 소스별 rate limiter 가 제한 (crawlers/rate_limiter.py)
+        # investing.com 은 429 에 맞춰 느려지고 FRED 등은 제 속도로 진행
+
+        # FRED 지표는 저장된 관측치 이후만 다중 시리즈 요청 1회로 (지표별 태스크가 같은 결과를 기다림)
+        fred_ids = [indicator_id for indicator_id in indicators if CrawlerService.is_fred_indicator(indicator_id)]
+        fred_batch = asyncio.ensure_future(CrawlerService.crawl_fred_indicators_async(fred_ids)) if fred_ids else None
 
         async def run_indicator(indicator_id: str):
-            async with semaphore:
-                await asyncio.sleep(0.2 + (hash(indicator_id) % 5) * 0.1)
-                result = await asyncio.to_thread(CrawlerService.crawl_indicator, indicator_id)
-                return indicator_id, result
+            if fred_batch is not None and indicator_id in fred_ids:
+                results = await fred_batch
+                return indicator_id, results.get(indicator_id, {"error": f"No FRED result for {indicator_id}"})
+            # 네트워크 대기는 이벤트 루프에서, 파싱은 파싱 워커 풀에서 (지표당 스레드 점유 없음)
+            # 스크래핑 페이지는 조건부 요청 (바뀌지 않았으면 파싱/저장 생략)
+            result = await CrawlerService.crawl_indicator_async(indicator_id, conditional=True)
+            return indicator_id, result
 
         tasks = [asyncio.create_task(run_indicator(indicator_id)) for indicator_id in indicators]
+        attempted_indicators.extend(indicators)
 
         # 완료되는 순서대로 결과 처리 (진행률 실시간 반영)
         completed_count = 0
@@ -2301,10 +2639,18 @@ async def update_all_indicators_background_async(remaining_only=True):
                     "indicator_id": indicator_id,
                     "error": result["error"]
                 })
-            else:
-                # 데이터베이스에 저장
-                db_service.save_indicator_data(indicator_id, result)
+            elif isinstance(result, dict) and result.get("unchanged"):
+                # 마지막 성공 크롤링 이후 페이지 변경 없음 → 기존 데이터 유지
+                update_status["unchanged_indicators"].append(indicator_id)
                 update_status["completed_indicators"].append(indicator_id)
+            else:
+                # 데이터베이스에 저장 (배치 단위), 페이지 검증값은 저장 성공 후 기록
+                validators = result.pop("page_validators", None)
+                if validators:
+                    pending_validators[indicator_id] = validators
+                pending_saves[indicator_id] = result
+                if len(pending_saves) >= save_batch_size:
+                    flush_pending_saves()
 
             completed_count += 1
             update_status["progress"] = int((completed_count / total_indicators) * 100)
@@ -2323,23 +2669,25 @@ async def update_all_indicators_background_async(remaining_only=True):
         })
         save_update_status()
     finally:
-        # ✅ 지표 업데이트 후 캐시 무효화 + 상태 리셋
-        INDICATORS_CACHE["data"] = None
-        INDICATORS_CACHE["timestamp"] = 0
+        try:
+            flush_pending_saves()
+        except Exception as e:
+            print(f"⚠️ Pending indicator save error: {e}")
+        save_update_status()
 
-        # ✅ Phase 3: Redis 캐시 무효화 (모든 history_limit 키 삭제)
-        if redis_client:
-            try:
-                # 패턴 매칭으로 모든 indicators 캐시 키 삭제
-                for key in redis_client.scan_iter("indicators:all:v2:*"):
-                    redis_client.delete(key)
-                print("✅ Redis cache invalidated")
-            except Exception as e:
-                print(f"⚠️ Redis cache invalidation error: {e}")
+        crawl_scheduler.record_attempts(attempted_indicators)
+
+        # 이번 이벤트 루프용 aiohttp 세션 정리
+        try:
+            await close_async_session()
+        except Exception as e:
+            print(f"⚠️ Async HTTP session close error: {e}")
+
+        # 지표 캐시는 저장 시 증가한 데이터 세대 번호로 자동 교체됨 (별도 무효화 불필요)
 
         # Phase 4: 업데이트 직후 최신 브리핑 생성/캐시
         try:
-            generate_briefing(db_service, redis_client=redis_client, force=True)
+            generate_briefing(db_service, cache=app_cache, force=True)
             print("✅ Briefing regenerated after update")
         except Exception as e:
             print(f"⚠️ Briefing regeneration error: {e}")
@@ -2347,6 +2695,10 @@ async def update_all_indicators_background_async(remaining_only=True):
         update_status["is_updating"] = False
         save_update_status()
 
+        # 새 데이터 세대의 지표/사이클 응답을 백그라운드에서 미리 계산 (첫 요청이 재계산 비용을 내지 않도록)
+        # 업데이트 완료 표시 뒤에 시작하므로 MAX_UPDATE_DURATION/다음 업데이트 시작을 막지 않는다
+        start_cache_warmup("update")
+
 def update_all_indicators_background(remaining_only=True):
     """비동기 함수를 동기 컨텍스트에서 실행하는 래퍼"""
     import asyncio
@@ -2359,39 +2711,32 @@ def update_all_indicators_background(remaining_only=True):
     finally:
         loop.close()
 
-@app.route('/api/v2/update-indicators', methods=['POST'])
-def trigger_update_indicators():
-    """모든 지표 업데이트 트리거 (백그라운드 실행)"""
+def _update_in_progress():
+    """다른 워커 포함 업데이트 진행 중인지 (MAX_UPDATE_DURATION 초과한 실행은 스테일로 보고 리셋)"""
     global update_status
-    body = request.get_json(silent=True) or {}
-    remaining_only = body.get("remaining_only", True)
-    if isinstance(remaining_only, str):
-        remaining_only = remaining_only.lower() not in ("0", "false", "no")
-    else:
-        remaining_only = bool(remaining_only)
-
     current_status = load_update_status()
     if current_status:
         update_status = current_status
 
-    # 이전 업데이트가 비정상적으로 오래 걸리는 경우 스테일 처리 (10분 초과 시 리셋)
-    if update_status["is_updating"]:
-        now_ts = time.time()
-        start_ts = update_status.get("start_time") or 0
-        if start_ts and (now_ts - start_ts) > MAX_UPDATE_DURATION:
-            update_status["is_updating"] = False
-            update_status["progress"] = 0
-            update_status["current_indicator"] = ""
-            update_status["completed_indicators"] = []
-            update_status["failed_indicators"] = []
-            save_update_status()
-        else:
-            return jsonify({
-                "status": "error",
-                "message": "Update is already in progress"
-            }), 409
+    if not update_status["is_updating"]:
+        return False
 
-    # 백그라운드 스레드로 업데이트 실행
+    now_ts = time.time()
+    start_ts = update_status.get("start_time") or 0
+    if start_ts and (now_ts - start_ts) > MAX_UPDATE_DURATION:
+        update_status["is_updating"] = False
+        update_status["progress"] = 0
+        update_status["current_indicator"] = ""
+        update_status["completed_indicators"] = []
+        update_status["failed_indicators"] = []
+        update_status["unchanged_indicators"] = []
+        save_update_status()
+        return False
+    return True
+
+
+def _start_update_run(remaining_only=True):
+    """지표 업데이트를 백그라운드 스레드로 시작"""
     thread = threading.Thread(
         target=update_all_indicators_background,
         kwargs={"remaining_only": remaining_only},
@@ -2406,6 +2751,26 @@ def trigger_update_indicators():
     update_status["current_indicator"] = ""
     save_update_status()
 
+
+@app.route('/api/v2/update-indicators', methods=['POST'])
+def trigger_update_indicators():
+    """모든 지표 업데이트 트리거 (백그라운드 실행)"""
+    body = request.get_json(silent=True) or {}
+    remaining_only = body.get("remaining_only", True)
+    if isinstance(remaining_only, str):
+        remaining_only = remaining_only.lower() not in ("0", "false", "no")
+    else:
+        remaining_only = bool(remaining_only)
+
+    # 이전 업데이트가 비정상적으로 오래 걸리는 경우 스테일 처리 (10분 초과 시 리셋)
+    if _update_in_progress():
+        return jsonify({
+            "status": "error",
+            "message": "Update is already in progress"
+        }), 409
+
+    _start_update_run(remaining_only=remaining_only)
+
     return jsonify({
         "status": "success",
         "message": "Update started in background",
@@ -2413,6 +2778,69 @@ def trigger_update_indicators():
         "check_status_url": "/api/v2/update-status"
     })
 
+
+def crawl_scheduler_loop():
+    """발표 직후 크롤링 예약 실행 (가장 가까운 발표 예정 시각까지 대기, 최대 CRAWL_SCHEDULER_POLL_SECONDS)
+
+    발표 일정 기반 항목이 예정 시각에 도달하면 remaining_only 업데이트를 시작한다
+    (그 시점에 주기상 만료된 다른 지표도 함께 크롤링).
+    워커가 여러 개면 Redis 락을 잡은 워커만 실행한다.
+    """
+    from crawlers.indicators_config import get_all_enabled_indicators
+
+    while True:
+        wait = CRAWL_SCHEDULER_POLL_SECONDS
+        try:
+            enabled = [
+                indicator_id
+                for indicator_id, config in get_all_enabled_indicators().items()
+                if not config.manual_check
+            ]
+            now = time.time()
+            next_due = crawl_scheduler.next_release_due(enabled, now)
+            if next_due is not None and next_due <= now:
+                if _acquire_scheduler_lock() and not _update_in_progress():
+                    print("✅ Crawl scheduler: scheduled release due, starting update")
+                    _start_update_run(remaining_only=True)
+            elif next_due is not None:
+                wait = min(wait, max(1.0, next_due - now))
+        except Exception as e:
+            print(f"⚠️ Crawl scheduler error: {e}")
+        time.sleep(wait)
+
+
+def _acquire_scheduler_lock():
+    """워커 중 하나만 예약 업데이트를 시작 (Redis 없으면 항상 True)"""
+    if not redis_client:
+        return True
+    try:
+        return bool(redis_client.set(CRAWL_SCHEDULER_LOCK_KEY, os.getpid(), nx=True, ex=CRAWL_SCHEDULER_POLL_SECONDS))
+    except Exception as e:
+        print(f"⚠️ Redis crawl scheduler lock error: {e}")
+        return False
+
+
+@app.route('/api/v2/crawl-schedule')
+def get_crawl_schedule():
+    """지표별 다음 크롤링 예정 시각 (발표 일정/주기 기반)"""
+    try:
+        enabled = [
+            indicator_id
+            for indicator_id, config in get_all_enabled_indicators().items()
+            if not config.manual_check
+        ]
+        schedule = crawl_scheduler.describe(enabled)
+        return jsonify({
+            "status": "success",
+            "due_count": sum(1 for entry in schedule if entry["due"]),
+            "schedule": schedule
+        })
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": f"Failed to build crawl schedule: {str(e)}"
+        }), 500
+
 @app.route('/api/v2/update-status')
 def get_update_status():
     """업데이트 진행 상황 조회"""
@@ -2431,6 +2859,7 @@ def reset_update_status():
     update_status["progress"] = 100
     update_status["completed_indicators"] = []
     update_status["failed_indicators"] = []
+    update_status["unchanged_indicators"] = []
     update_status["start_time"] = None
     update_status["total_indicators"] = 0
     save_update_status()
@@ -2449,8 +2878,10 @@ def get_all_crawl_info():
         indicators = list(get_all_enabled_indicators().keys())
         crawl_info_list = []
 
+        all_crawl_info = _get_multiple_crawl_info(indicators)
+
         for indicator_id in indicators:
-            crawl_info = db_service.get_crawl_info(indicator_id)
+            crawl_info = all_crawl_info.get(indicator_id)
             if crawl_info:
                 crawl_info_list.append(crawl_info)
             else:
@@ -2507,6 +2938,25 @@ def crawl_single_indicator(indicator_id):
             "message": f"Error crawling {indicator_id}: {str(e)}"
         }), 500
 
+def _get_portfolio_totals(user_id):
+    """사용자 포트폴리오 합계 {total_assets, total_principal, total_eval_amount} (실패 시 None)
+
+    portfolio_totals running total 을 읽고, 지원하지 않는 DB 서비스면 전체 자산을 합산한다.
+    """
+    if hasattr(db_service, 'get_portfolio_totals'):
+        totals = db_service.get_portfolio_totals(user_id)
+        return totals.get('data') if totals.get('status') == 'success' else None
+
+    portfolio_data = db_service.get_all_assets(user_id)
+    if portfolio_data.get('status') != 'success':
+        return None
+    assets = portfolio_data.get('data', [])
+    return {
+        "total_assets": sum(asset.get('amount', 0) for asset in assets),
+        "total_principal": sum(asset.get('principal', asset.get('amount', 0)) for asset in assets),
+        "total_eval_amount": sum(asset.get('eval_amount', asset.get('amount', 0)) for asset in assets),
+    }
+
 @app.route('/api/add-asset', methods=['POST'])
 def add_asset():
     """포트폴리오 자산 추가 API"""
@@ -2580,21 +3030,16 @@ def add_asset():
             # 포트폴리오 이력 추가 - 자산 추가
             try:
                 # 현재 포트폴리오 총액 계산
-                portfolio_data = db_service.get_all_assets(data.get('user_id'))
-                if portfolio_data.get('status') == 'success':
-                    assets = portfolio_data.get('data', [])
-                    total_assets = sum(asset.get('amount', 0) for asset in assets)
-                    total_principal = sum(asset.get('principal', asset.get('amount', 0)) for asset in assets)
-                    total_eval_amount = sum(asset.get('eval_amount', asset.get('amount', 0)) for asset in assets)
-
+                totals = _get_portfolio_totals(data.get('user_id'))
+                if totals is not None:
                     # 히스토리 저장
                     change_amount = data.get('amount', 0)
                     db_service.save_portfolio_history(
                         user_id=data.get('user_id'),
                         change_type='add',
-                        total_assets=total_assets,
-                        total_principal=total_principal,
-                        total_eval_amount=total_eval_amount,
+                        total_assets=totals['total_assets'],
+                        total_principal=totals['total_principal'],
+                        total_eval_amount=totals['total_eval_amount'],
                         asset_name=data.get('name'),
                         change_amount=change_amount,
                         notes=f"자산 추가: {data.get('name')}"
@@ -2655,6 +3100,27 @@ def get_portfolio():
             "message": f"포트폴리오 조회 실패: {str(e)}"
         }), 500
 
+@app.route('/api/portfolio/summary', methods=['GET'])
+def get_portfolio_summary():
+    """포트폴리오 합계 조회 API (대시보드 요약용, 자산 목록 없이 합계만)"""
+    try:
+        user_id = request.args.get('user_id')
+        if not user_id:
+            return jsonify({"status": "error", "message": "user_id required"}), 400
+
+        totals = _get_portfolio_totals(int(user_id))
+        if totals is None:
+            return jsonify({"status": "error", "message": "포트폴리오 합계 조회 실패"}), 500
+
+        return jsonify({"status": "success", "data": totals})
+
+    except Exception as e:
+        print(f"Error getting portfolio summary: {e}")
+        return jsonify({
+            "status": "error",
+            "message": f"포트폴리오 합계 조회 실패: {str(e)}"
+        }), 500
+
 @app.route('/api/portfolio/export/excel', methods=['GET'])
 def export_portfolio_excel():
     """포트폴리오 데이터를 Excel 파일로 다운로드"""
@@ -2847,20 +3313,15 @@ def update_asset(asset_id):
                 user_id = data.get('user_id')  # user_id는 update data에 포함되어야 함
                 if user_id:
                     # 현재 포트폴리오 총액 계산
-                    portfolio_data = db_service.get_all_assets(user_id)
-                    if portfolio_data.get('status') == 'success':
-                        assets = portfolio_data.get('data', [])
-                        total_assets = sum(asset.get('amount', 0) for asset in assets)
-                        total_principal = sum(asset.get('principal', asset.get('amount', 0)) for asset in assets)
-                        total_eval_amount = sum(asset.get('eval_amount', asset.get('amount', 0)) for asset in assets)
-
+                    totals = _get_portfolio_totals(user_id)
+                    if totals is not None:
                         # 히스토리 저장
                         db_service.save_portfolio_history(
                             user_id=user_id,
                             change_type='update',
-                            total_assets=total_assets,
-                            total_principal=total_principal,
-                            total_eval_amount=total_eval_amount,
+                            total_assets=totals['total_assets'],
+                            total_principal=totals['total_principal'],
+                            total_eval_amount=totals['total_eval_amount'],
                             asset_id=asset_id,
                             asset_name=data.get('name'),
                             notes=f"자산 수정: {data.get('name')}"
@@ -2894,39 +3355,25 @@ def delete_asset(asset_id):
                 "message": "user_id is required"
             }), 400
 
-        # 삭제 전 자산 정보 조회 (히스토리용)
-        asset_info = None
-        try:
-            assets_data = db_service.get_all_assets(user_id)
-            if assets_data.get('status') == 'success':
-                assets = assets_data.get('data', [])
-                asset_info = next((asset for asset in assets if asset.get('id') == asset_id), None)
-        except Exception as e:
-            print(f"Failed to get asset info before deletion: {e}")
-
-        # 데이터베이스에서 자산 삭제 (user_id 검증 포함)
+        # 데이터베이스에서 자산 삭제 (user_id 검증 포함, 삭제된 자산 이름/금액 반환)
         result = db_service.delete_asset(asset_id, user_id)
 
         if result.get('status') == 'success':
             # 포트폴리오 이력 추가 - 자산 삭제
             try:
-                # 현재 포트폴리오 총액 계산 (삭제 후)
-                portfolio_data = db_service.get_all_assets(user_id)
-                if portfolio_data.get('status') == 'success':
-                    assets = portfolio_data.get('data', [])
-                    total_assets = sum(asset.get('amount', 0) for asset in assets)
-                    total_principal = sum(asset.get('principal', asset.get('amount', 0)) for asset in assets)
-                    total_eval_amount = sum(asset.get('eval_amount', asset.get('amount', 0)) for asset in assets)
-
+                # 현재 포트폴리오 총액 (삭제 후)
+                totals = _get_portfolio_totals(user_id)
+                if totals is not None:
                     # 히스토리 저장
-                    asset_name = asset_info.get('name', f'ID {asset_id}') if asset_info else f'ID {asset_id}'
-                    change_amount = -(asset_info.get('amount', 0)) if asset_info else 0  # 음수로 표시
+                    asset_info = result.get('deleted_asset') or {}
+                    asset_name = asset_info.get('name') or f'ID {asset_id}'
+                    change_amount = -(asset_info.get('amount') or 0)  # 음수로 표시
                     db_service.save_portfolio_history(
                         user_id=user_id,
                         change_type='delete',
-                        total_assets=total_assets,
-                        total_principal=total_principal,
-                        total_eval_amount=total_eval_amount,
+                        total_assets=totals['total_assets'],
+                        total_principal=totals['total_principal'],
+                        total_eval_amount=totals['total_eval_amount'],
                         asset_id=asset_id,
                         asset_name=asset_name,
                         change_amount=change_amount,
@@ -3631,8 +4078,9 @@ def get_portfolio_history():
         time_range = request.args.get('time_range', 'daily')  # annual, monthly, daily
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
+        limit = request.args.get('limit', type=int)
 
-        result = db_service.get_portfolio_history(user_id, time_range, start_date, end_date)
+        result = db_service.get_portfolio_history(user_id, time_range, start_date, end_date, limit)
         return jsonify(result)
 
     except Exception as e:
@@ -3714,7 +4162,9 @@ def get_expenses():
         if request.args.get('transaction_type'):
             filters['transaction_type'] = request.args.get('transaction_type')
 
-        result = db_service.get_all_expenses(user_id, filters)
+        # summary_only=true: 거래 목록 없이 합계/카테고리 집계만 반환
+        summary_only = request.args.get('summary_only', '').lower() in ('1', 'true', 'yes')
+        result = db_service.get_all_expenses(user_id, filters, summary_only=summary_only)
         return jsonify(result)
 
     except Exception as e:
@@ -3743,38 +4193,38 @@ def get_expenses_yearly():
         else:
             year = int(year)
 
-        # 해당 연도의 전체 데이터 조회
-        filters = {
-            'start_date': f'{year}-01-01',
-            'end_date': f'{year}-12-31'
-        }
-
-        result = db_service.get_all_expenses(user_id, filters)
-
-        if result.get('status') != 'success':
-            return jsonify(result), 500
-
-        # 월별로 집계
+        # 월별로 집계 (월별 집계 테이블: 12개월 × 카테고리 행만 조회)
         monthly_data = {}
         for month in range(1, 13):
             monthly_data[month] = {'expense': 0, 'income': 0, 'transfer': 0}
 
-        for expense in result.get('expenses', []):
-            date_str = expense.get('date', '')
-            if date_str:
-                try:
-                    month = int(date_str.split('-')[1])
-                    amount = float(expense.get('amount', 0))
-                    tx_type = expense.get('transaction_type', '지출')
-
-                    if tx_type == '지출':
-                        monthly_data[month]['expense'] += amount
-                    elif tx_type == '수입':
-                        monthly_data[month]['income'] += amount
-                    elif tx_type == '이체':
-                        monthly_data[month]['transfer'] += amount
-                except (IndexError, ValueError):
-                    continue
+        type_keys = {'지출': 'expense', '수입': 'income', '이체': 'transfer'}
+
+        if hasattr(db_service, 'get_expense_rollup'):
+            result = db_service.get_expense_rollup(user_id, year)
+            if result.get('status') != 'success':
+                return jsonify(result), 500
+
+            for row in result.get('data', []):
+                key = type_keys.get(row.get('transaction_type'))
+                if key:
+                    monthly_data[row['month']][key] += float(row.get('total_amount') or 0)
+        else:
+            # 집계 테이블이 없는 백엔드: 해당 연도의 전체 거래를 조회해서 집계
+            filters = {
+                'start_date': f'{year}-01-01',
+                'end_date': f'{year}-12-31'
+            }
+            result = db_service.get_all_expenses(user_id, filters)
+            if result.get('status') != 'success':
+                return jsonify(result), 500
+
+            for expense in result.get('data', []):
+                transaction_date = expense.get('transaction_date')
+                key = type_keys.get(expense.get('transaction_type'))
+                if transaction_date and key:
+                    month = int(str(transaction_date)[5:7])
+                    monthly_data[month][key] += float(expense.get('amount', 0))
 
         # 응답 형식으로 변환
         chart_data = []
@@ -3832,6 +4282,28 @@ def export_expenses_excel():
 
         expenses = result.get('data', [])
 
+        # 요약 시트용 집계 (월별 집계 테이블, 없으면 거래내역에서 계산)
+        rollup_rows = None
+        if hasattr(db_service, 'get_expense_rollup'):
+            rollup_result = db_service.get_expense_rollup(
+                user_id,
+                int(year) if year and month else None,
+                int(month) if year and month else None
+            )
+            if rollup_result.get('status') == 'success':
+                rollup_rows = rollup_result.get('data', [])
+        if rollup_rows is None:
+            rollup_rows = [
+                {
+                    'category': expense.get('category'),
+                    'subcategory': expense.get('subcategory'),
+                    'transaction_type': expense.get('transaction_type'),
+                    'total_amount': expense.get('amount', 0),
+                    'transaction_count': 1
+                }
+                for expense in expenses
+            ]
+
         # Excel 파일 생성
         wb = Workbook()
 
@@ -3855,9 +4327,9 @@ def export_expenses_excel():
         for row_idx, expense in enumerate(expenses, 2):
             ws1.cell(row=row_idx, column=1, value=expense.get('transaction_date', ''))
             ws1.cell(row=row_idx, column=2, value=expense.get('transaction_type', ''))
-            ws1.cell(row=row_idx, column=3, value=expense.get('main_category', ''))
-            ws1.cell(row=row_idx, column=4, value=expense.get('sub_category', ''))
-            ws1.cell(row=row_idx, column=5, value=expense.get('merchant', ''))
+            ws1.cell(row=row_idx, column=3, value=expense.get('category', ''))
+            ws1.cell(row=row_idx, column=4, value=expense.get('subcategory', ''))
+            ws1.cell(row=row_idx, column=5, value=expense.get('name', ''))
             ws1.cell(row=row_idx, column=6, value=expense.get('amount', 0))
             ws1.cell(row=row_idx, column=7, value=expense.get('memo', ''))
 
@@ -3883,12 +4355,11 @@ def export_expenses_excel():
 
         # 카테고리별 집계
         category_summary = {}
-        total_amount = sum(expense.get('amount', 0) for expense in expenses)
+        total_amount = sum(float(row.get('total_amount') or 0) for row in rollup_rows)
 
-        for expense in expenses:
-            main_cat = expense.get('main_category', '기타')
-            sub_cat = expense.get('sub_category', '기타')
-            amount = expense.get('amount', 0)
+        for row in rollup_rows:
+            main_cat = row.get('category') or '기타'
+            sub_cat = row.get('subcategory') or '기타'
 
             key = f"{main_cat}_{sub_cat}"
 
@@ -3900,8 +4371,8 @@ def export_expenses_excel():
                     'count': 0
                 }
 
-            category_summary[key]['total'] += amount
-            category_summary[key]['count'] += 1
+            category_summary[key]['total'] += float(row.get('total_amount') or 0)
+            category_summary[key]['count'] += row.get('transaction_count') or 0
 
         # 데이터
         for row_idx, summary in enumerate(category_summary.values(), 2):
@@ -3927,8 +4398,9 @@ def export_expenses_excel():
             cell.alignment = Alignment(horizontal='center', vertical='center')
 
         # 지출/수입 집계
-        total_expense = sum(expense.get('amount', 0) for expense in expenses if expense.get('transaction_type') == '지출')
-        total_income = sum(expense.get('amount', 0) for expense in expenses if expense.get('transaction_type') == '수입')
+        total_expense = sum(float(row.get('total_amount') or 0) for row in rollup_rows if row.get('transaction_type') == '지출')
+        total_income = sum(float(row.get('total_amount') or 0) for row in rollup_rows if row.get('transaction_type') == '수입')
+        total_count = sum(row.get('transaction_count') or 0 for row in rollup_rows)
         net_change = total_income - total_expense
 
         ws3.cell(row=2, column=1, value="총 지출")
@@ -3938,7 +4410,7 @@ def export_expenses_excel():
         ws3.cell(row=4, column=1, value="순자산 변화")
         ws3.cell(row=4, column=2, value=net_change)
         ws3.cell(row=5, column=1, value="총 거래 건수")
-        ws3.cell(row=5, column=2, value=len(expenses))
+        ws3.cell(row=5, column=2, value=total_count)
 
         # 컬럼 너비 조정
         ws3.column_dimensions['A'].width = 15
@@ -5105,6 +5577,7 @@ def get_all_indicators_metadata():
 # ========== 경제 사이클 API ==========
 
 @app.route('/api/v2/macro-cycle', methods=['GET'])
+@data_versioned_etag("macro-cycle", CYCLE_CACHE_CONTROL)
 def get_macro_cycle():
     """
     거시경제 사이클 계산 및 국면 판별
@@ -5126,11 +5599,8 @@ def get_macro_cycle():
         }
     """
     try:
-        # MacroCycleService 초기화
-        cycle_service = MacroCycleService(db_service)
-
-        # 사이클 계산
-        result = cycle_service.calculate_cycle()
+        # 사이클 계산 (데이터 세대별 캐시)
+        result = _cached_cycle("macro")
 
         if result.get('score') is None:
             return jsonify({
@@ -5152,6 +5622,7 @@ def get_macro_cycle():
         }), 500
 
 @app.route('/api/v2/credit-cycle', methods=['GET'])
+@data_versioned_etag("credit-cycle", CYCLE_CACHE_CONTROL)
 def get_credit_cycle():
     """
     신용/유동성 사이클 계산 및 국면 판별
@@ -5173,11 +5644,8 @@ def get_credit_cycle():
         }
     """
     try:
-        # CreditCycleService 초기화
-        cycle_service = CreditCycleService(db_service)
-
-        # 사이클 계산
-        result = cycle_service.calculate_cycle()
+        # 사이클 계산 (데이터 세대별 캐시)
+        result = _cached_cycle("credit")
 
         if result.get('score') is None:
             return jsonify({
@@ -5200,6 +5668,7 @@ def get_credit_cycle():
 
 # ===== 심리/밸류에이션 사이클 API =====
 @app.route('/api/v2/sentiment-cycle', methods=['GET'])
+@data_versioned_etag("sentiment-cycle", CYCLE_CACHE_CONTROL)
 def get_sentiment_cycle():
     """
     심리/밸류에이션 사이클 정보 반환 (VIX 기반)
@@ -5222,10 +5691,7 @@ def get_sentiment_cycle():
         }
     """
     try:
-        from services.sentiment_cycle_service import SentimentCycleService
-
-        cycle_service = SentimentCycleService(db_service)
-        result = cycle_service.calculate_cycle()
+        result = _cached_cycle("sentiment")
 
         # 에러 응답인 경우
         if result.get('score') is None:
@@ -5252,6 +5718,7 @@ def get_sentiment_cycle():
 # ========================================
 
 @app.route('/api/v3/cycles/master', methods=['GET'])
+@data_versioned_etag("master-market-cycle", CYCLE_CACHE_CONTROL)
 def get_master_market_cycle():
     """
     Master Market Cycle 점수 조회 (Phase 1 임시 버전)
@@ -5271,9 +5738,7 @@ def get_master_market_cycle():
         }
     """
     try:
-        from services.cycle_engine import calculate_master_cycle_v3
-
-        result = calculate_master_cycle_v3(db_service)
+        result = _cached_cycle("master_v3")
 
         if 'error' in result:
             return jsonify({
@@ -5296,6 +5761,7 @@ def get_master_market_cycle():
 
 
 @app.route('/api/v4/master-cycle', methods=['GET'])
+@data_versioned_etag("master-market-cycle-v4", CYCLE_CACHE_CONTROL)
 def get_master_market_cycle_v4():
     """
     v4: Master Market Cycle with Full Enhancements
@@ -5308,9 +5774,7 @@ def get_master_market_cycle_v4():
         v3 구조 + Credit 강화 필드 (hy_velocity, ig_velocity, rapid_change)
     """
     try:
-        from services.cycle_engine import calculate_master_cycle_v4
-
-        result = calculate_master_cycle_v4(db_service)
+        result = _cached_cycle("master_v4")
 
         if 'error' in result:
             return jsonify({
@@ -5562,23 +6026,19 @@ def get_finnhub_key():
     return os.getenv("FINNHUB_API_KEY")
 
 
-MARKET_CACHE = {
-    "quote": {},
-    "candles": {}
+# 시세/차트 캐시 TTL (app_cache, "market:<kind>:<key>")
+MARKET_CACHE_TTL = {
+    "quote": 30,
+    "candles": 600
 }
 
 
-def get_cached(cache_key, ttl):
-    entry = MARKET_CACHE.get(cache_key, {})
-    now = time.time()
-    for key, value in list(entry.items()):
-        if now - value["ts"] > ttl:
-            del entry[key]
-    return entry
+def get_cached(cache_key, key):
+    return app_cache.get(f"market:{cache_key}:{key}")
 
 
 def set_cached(cache_key, key, data):
-    MARKET_CACHE.setdefault(cache_key, {})[key] = {"ts": time.time(), "data": data}
+    app_cache.set(f"market:{cache_key}:{key}", data, MARKET_CACHE_TTL[cache_key])
 
 
 def fetch_finnhub(endpoint, params):
@@ -5771,9 +6231,8 @@ def get_market_quote():
         if not api_key:
             return jsonify({"status": "error", "message": "FINNHUB_API_KEY가 설정되지 않았습니다"}), 500
 
-        cache = get_cached("quote", 30)
-        if symbol in cache:
-            cached = cache[symbol]["data"]
+        cached = get_cached("quote", symbol)
+        if cached is not None:
             if isinstance(cached, dict) and "quote" in cached:
                 return jsonify({
                     "status": "success",
@@ -5823,9 +6282,9 @@ def get_market_candles():
             return jsonify({"status": "error", "message": "from/to 파라미터가 필요합니다"}), 400
 
         cache_key = f"{symbol}:{resolution}:{from_ts}:{to_ts}:{source or 'auto'}"
-        cache = get_cached("candles", 600)
-        if cache_key in cache:
-            return jsonify({"status": "success", "data": cache[cache_key]["data"], "cached": True})
+        cached = get_cached("candles", cache_key)
+        if cached is not None:
+            return jsonify({"status": "success", "data": cached, "cached": True})
 
         if source == "yahoo":
             yahoo = fetch_yahoo_candles(symbol, from_ts, to_ts)
@@ -5999,6 +6458,18 @@ def get_industry_categories():
         }), 500
 
 
+# 워커 시작 시 캐시 워밍 (백그라운드, 완료되면 /api/health/ready 가 200)
+if CACHE_WARMUP_ON_BOOT and db_service:
+    start_cache_warmup("boot")
+else:
+    cache_warmup_status["ready"] = True
+
+
+# 발표 일정 기반 예약 크롤링 (워커별 데몬 스레드, 실행은 Redis 락으로 1개 워커만)
+if CRAWL_SCHEDULER_ENABLED and db_service:
+    threading.Thread(target=crawl_scheduler_loop, name="crawl-scheduler", daemon=True).start()
+
+
 if __name__ == '__main__':
     # Render 등 PaaS 환경에서 주어지는 동적 포트를 우선 사용
     port = int(os.environ.get("PORT", 5001))
@@ -0,0 +1,235 @@
+"""
+investing.com 테이블 파서 처리량 벤치마크
+- 기존 BeautifulSoup(html.parser) 전체 트리 파서 vs crawlers/html_tables.py 경량 파서
+- 페이지마다 두 파서 결과가 같은지 먼저 확인한 뒤 페이지/초, MB/초 비교
+
+사용:
+    python benchmark_parsers.py                 # crawlers/fixtures/*.html 벤치마크
+    python benchmark_parsers.py --fetch         # 활성 investing.com 지표 페이지를 fixtures 에 저장
+    python benchmark_parsers.py --repeat 20 --fixtures /path/to/pages
+
+fixture 파일 이름이 'calendar-' 로 시작하면 경제 캘린더(History) 페이지,
+'rates-' 로 시작하면 Historical Data 페이지로 본다.
+fixture 가 없으면 구조를 흉내 낸 합성 페이지로 실행한다 (결과에 synthetic 표시, 경고 출력).
+합성 페이지에는 속성 값/주석/script 안의 테이블 마크업, 셀 안의 주석/script/CDATA/공백뿐인 텍스트 노드를 넣어
+경량 파서가 BeautifulSoup 과 다르게 볼 수 있는 경우를 함께 확인한다.
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+
+from crawlers.investing_crawler import parse_date, parse_history_table, parse_numeric_value
+from crawlers.rates_bonds_crawler import parse_historical_table
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'crawlers', 'fixtures')
+
+
+# ---------- 기존 구현 (비교 기준) ----------
+
+def soup_parse_history_table(html: str) -> List[Dict[str, Any]]:
+    soup = BeautifulSoup(html, 'html.parser')
+    table = None
+    for t in soup.find_all('table'):
+        headers = t.find_all(['th', 'td'])
+        header_text = ' '.join([h.get_text().strip() for h in headers[:5]])
+        if any(keyword in header_text.lower() for keyword in ['release', 'actual', 'forecast', 'previous']):
+            table = t
+            break
+    if not table:
+        raise ValueError("History table not found")
+
+    parsed_rows = []
+    for row in table.find_all('tr')[1:]:
+        cells = row.find_all(['td', 'th'])
+        if len(cells) < 5:
+            continue
+        release_date = parse_date(cells[0].get_text().strip())
+        if release_date:
+            parsed_rows.append({
+                "release_date": release_date,
+                "time": cells[1].get_text().strip(),
+                "actual": parse_numeric_value(cells[2].get_text().strip()),
+                "forecast": parse_numeric_value(cells[3].get_text().strip()),
+                "previous": parse_numeric_value(cells[4].get_text().strip()),
+            })
+    return parsed_rows
+
+
+def soup_parse_historical_table(html: str) -> List[Dict[str, Any]]:
+    soup = BeautifulSoup(html, 'html.parser')
+    table = None
+    for t in soup.find_all('table'):
+        tbody = t.find('tbody')
+        if tbody:
+            rows = tbody.find_all('tr')
+            if rows:
+                cells = rows[0].find_all('td')
+                if cells:
+                    first_cell = cells[0].get_text().strip()
+                    if len(first_cell.split(',')) == 2 and '202' in first_cell:
+                        table = t
+                        break
+    if not table or not table.find('tbody'):
+        return []
+
+    result = []
+    for row in table.find('tbody').find_all('tr'):
+        cells = row.find_all('td')
+        if len(cells) < 2:
+            continue
+        try:
+            date_str = datetime.strptime(cells[0].get_text().strip(), "%b %d, %Y").strftime("%Y-%m-%d")
+            result.append({'date': date_str, 'price': float(cells[1].get_text().strip().replace(',', ''))})
+        except (ValueError, IndexError):
+            continue
+    return result
+
+
+PARSERS: Dict[str, Tuple[Callable, Callable]] = {
+    'calendar': (soup_parse_history_table, parse_history_table),
+    'rates': (soup_parse_historical_table, parse_historical_table),
+}
+
+
+# ---------- fixture ----------
+
+def fetch_fixtures(directory: str):
+    """활성 investing.com 지표 페이지를 저장 (캘린더/Historical Data 각각)"""
+    from crawlers.indicators_config import get_all_enabled_indicators
+    from crawlers.investing_crawler import fetch_html
+    from crawlers.rates_bonds_crawler import fetch_historical_data
+
+    os.makedirs(directory, exist_ok=True)
+    for indicator_id, config in get_all_enabled_indicators().items():
+        if 'investing.com' not in config.url:
+            continue
+        kind = 'calendar' if 'economic-calendar' in config.url else 'rates'
+        try:
+            html = fetch_html(config.url) if kind == 'calendar' else fetch_historical_data(config.url)
+        except Exception as e:
+            print(f"⚠️ {indicator_id}: {e}")
+            continue
+        path = os.path.join(directory, f"{kind}-{indicator_id}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"✅ {path} ({len(html) / 1024:.0f} KB)")
+
+
+def _synthetic_page(kind: str, rows: int = 40, seed: int = 0) -> str:
+    """investing.com 구조를 흉내 낸 ~1MB 페이지 (대형 script, 메뉴/사이드바 테이블, 대상 테이블)"""
+    rng = random.Random(seed)
+    start = datetime(2025, 12, 1)
+    script = '<script id="__NEXT_DATA__" type="application/json">{"props":' + '"x<table>",' * 40000 + '"end":1}</script>'
+    nav = ''.join(f'<li><a href="/news/{i}">Headline {i} &amp; more</a></li>' for i in range(3000))
+    # 속성 값/주석/script 안의 테이블 마크업 (BeautifulSoup 은 테이블로 보지 않음, 첫 테이블 선택을 가로채면 안 됨)
+    decoy_rows = '<tr><th>Release Date</th><th>Actual</th></tr><tr><td>Jan 01, 2020</td><td>1</td><td>2</td><td>3</td><td>4</td></tr>'
+    decoys = (f'<div data-tooltip="<table>{decoy_rows}</table>" title=\'<table><tbody>{decoy_rows}</tbody></table>\'></div>'
+              f'<a title=it\'s>x</a><script>document.write("<table>{decoy_rows}</table>")</script>')
+    sidebar = '<table class="sidebar"><tr><td>Name</td><td>Last</td></tr>' + ''.join(
+        f'<tr><td>Index {i}</td><td>{rng.uniform(1000, 5000):,.2f}</td></tr>' for i in range(30)) + '</table>'
+
+    if kind == 'calendar':
+        body = ''.join(
+            f'<tr><td>{(start - timedelta(days=30 * i)).strftime("%b %d, %Y")} ({(start - timedelta(days=30 * i + 30)).strftime("%b")})</td>'
+            f'<td>10:00<span>\n  </span>ET<!-- ET --></td><td><span>{rng.uniform(45, 55):.1f}</span><script>x()</script></td><td>{rng.uniform(45, 55):.1f}</td>'
+            f'<td>{rng.uniform(45, 55):.1f}</td><td></td></tr>' for i in range(rows))
+        table = ('<table class="history"><thead><tr><th>Release Date</th><th>Time</th><th>Actual</th>'
+                 '<th>Forecast</th><th>Previous</th><th></th></tr></thead><tbody>' + body + '</tbody></table>')
+    else:
+        body = ''.join(
+            f'<tr><td><time>{(start - timedelta(days=i)).strftime("%b %d, %Y")}</time></td>'
+            f'<td><![CDATA[]]>{rng.uniform(3, 5):,.3f}</td><td>{rng.uniform(3, 5):.3f}</td><td>{rng.uniform(3, 5):.3f}</td>'
+            f'<td>{rng.uniform(3, 5):.3f}</td><td>{rng.uniform(-2, 2):.2f}%</td></tr>' for i in range(rows))
+        table = ('<table class="freeze-column-w-1"><thead><tr><th>Date</th><th>Price</th><th>Open</th>'
+                 '<th>High</th><th>Low</th><th>Change %</th></tr></thead><tbody>' + body + '</tbody></table>')
+
+    return (f'<!DOCTYPE html><html><head><title>{kind}</title><style>td{{color:red}}</style></head><body>'
+            f'<ul>{nav}</ul><!-- <table><tr><td>Release</td></tr></table> -->{decoys}{sidebar}'
+            f'<div class="main">{table}</div>{script}</body></html>')
+
+
+def load_pages(directory: str) -> Tuple[List[Tuple[str, str, str]], bool]:
+    """[(이름, 종류, html)], synthetic 여부"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, '*.html'))):
+        name = os.path.basename(path)
+        kind = name.split('-', 1)[0]
+        if kind not in PARSERS:
+            continue
+        with open(path, encoding='utf-8') as f:
+            pages.append((name, kind, f.read()))
+    if pages:
+        return pages, False
+    return [(f'synthetic-{kind}-{seed}', kind, _synthetic_page(kind, seed=seed))
+            for kind in PARSERS for seed in range(3)], True
+
+
+# ---------- 벤치마크 ----------
+
+def _call(parser: Callable, html: str):
+    try:
+        return parser(html)
+    except ValueError as e:
+        return ('ValueError', str(e))
+
+
+def _throughput(parser: Callable, pages: List[Tuple[str, str, str]], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for _, _, html in pages:
+            _call(parser, html)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--fetch', action='store_true', help='fixture 페이지 저장 후 종료')
+    args = parser.parse_args()
+
+    if args.fetch:
+        fetch_fixtures(args.fixtures)
+        return 0
+
+    pages, synthetic = load_pages(args.fixtures)
+    print(f"pages: {len(pages)}{' (synthetic)' if synthetic else ''}, repeat: {args.repeat}")
+    if synthetic:
+        print(f"⚠️ {args.fixtures} 에 저장된 페이지가 없어 합성 페이지로만 비교합니다. "
+              f"실제 마크업과 같은지 확인하려면 먼저 --fetch 로 저장하세요.")
+
+    mismatches = 0
+    for name, kind, html in pages:
+        soup_parser, fast_parser = PARSERS[kind]
+        expected, actual = _call(soup_parser, html), _call(fast_parser, html)
+        if expected != actual:
+            mismatches += 1
+            print(f"❌ {name}: output differs")
+    if mismatches:
+        return 1
+    print("✅ outputs identical")
+
+    for kind, (soup_parser, fast_parser) in PARSERS.items():
+        subset = [page for page in pages if page[1] == kind]
+        if not subset:
+            continue
+        total_mb = sum(len(html.encode('utf-8')) for _, _, html in subset) * args.repeat / 1024 / 1024
+        count = len(subset) * args.repeat
+        soup_time = _throughput(soup_parser, subset, args.repeat)
+        fast_time = _throughput(fast_parser, subset, args.repeat)
+        print(f"{kind:9s} soup: {count / soup_time:7.1f} pages/s {total_mb / soup_time:7.1f} MB/s | "
+              f"fast: {count / fast_time:7.1f} pages/s {total_mb / fast_time:7.1f} MB/s | "
+              f"x{soup_time / fast_time:.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,6 +9,9 @@ import os
 from typing import List, Dict, Any
 from datetime import datetime
 
+from crawlers.http_client import async_http_get, http_get
+from crawlers.parse_pool import run_parser
+
 def get_bea_api_key() -> str:
     """환경변수에서 BEA API 키 가져오기
 
@@ -23,21 +26,12 @@ def get_bea_api_key() -> str:
         raise ValueError("BEA_API_KEY not found in environment variables. Please sign up at https://apps.bea.gov/API/signup/")
     return api_key
 
-def fetch_bea_data(indicator: str, frequency: str = "QSA", year: str = "ALL") -> Dict[str, Any]:
-    """BEA API에서 데이터 가져오기
-
-    Args:
-        indicator: BEA 지표 코드 (예: "BalCurrAcct" for Current Account Balance)
-        frequency: 데이터 빈도 ("QSA" = Quarterly Seasonally Adjusted, "A" = Annual)
-        year: 데이터 연도 ("ALL" 또는 특정 연도)
+BEA_API_URL = "https://apps.bea.gov/api/data"
 
-    Returns:
-        JSON 응답 데이터
-    """
+def _bea_params(indicator: str, frequency: str, year: str) -> Dict[str, str]:
+    """ITA(국제수지) 데이터셋 요청 파라미터 (API 키 없으면 ValueError)"""
     api_key = get_bea_api_key()
-
-    url = "https://apps.bea.gov/api/data"
-    params = {
+    return {
         'UserID': api_key,
         'method': 'GetData',
         'datasetname': 'ITA',  # International Transactions Accounts
@@ -48,7 +42,24 @@ def fetch_bea_data(indicator: str, frequency: str = "QSA", year: str = "ALL") ->
         'ResultFormat': 'JSON'
     }
 
-    response = requests.get(url, params=params, timeout=15)
+def fetch_bea_data(indicator: str, frequency: str = "QSA", year: str = "ALL") -> Dict[str, Any]:
+    """BEA API에서 데이터 가져오기
+
+    Args:
+        indicator: BEA 지표 코드 (예: "BalCurrAcct" for Current Account Balance)
+        frequency: 데이터 빈도 ("QSA" = Quarterly Seasonally Adjusted, "A" = Annual)
+        year: 데이터 연도 ("ALL" 또는 특정 연도)
+
+    Returns:
+        JSON 응답 데이터
+    """
+    response = http_get(BEA_API_URL, params=_bea_params(indicator, frequency, year))
+    response.raise_for_status()
+    return response.json()
+
+async def fetch_bea_data_async(indicator: str, frequency: str = "QSA", year: str = "ALL") -> Dict[str, Any]:
+    """fetch_bea_data 의 asyncio 버전"""
+    response = await async_http_get(BEA_API_URL, params=_bea_params(indicator, frequency, year))
     response.raise_for_status()
     return response.json()
 
@@ -174,7 +185,7 @@ def extract_bea_data(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
                 "forecast": None,
                 "previous": None
             }
-            for row in rows[:8]  # 최근 8분기 (2년치)
+            for row in rows  # 전체 분기 (DB에 누적 저장)
         ]
     }
 
@@ -188,12 +199,20 @@ def crawl_bea_indicator(indicator: str, frequency: str = "QSA") -> Dict[str, Any
     """
     try:
         json_data = fetch_bea_data(indicator, frequency=frequency)
-        rows = parse_bea_response(json_data)
+        return _build_bea_result(json_data)
 
-        if not rows:
-            return {"error": "No BEA data found"}
+    except ValueError as e:
+        return {"error": str(e)}
+    except requests.RequestException as e:
+        return {"error": f"BEA API error: {str(e)}"}
+    except Exception as e:
+        return {"error": f"BEA crawling error: {str(e)}"}
 
-        return extract_bea_data(rows)
+async def crawl_bea_indicator_async(indicator: str, frequency: str = "QSA") -> Dict[str, Any]:
+    """crawl_bea_indicator 의 asyncio 버전"""
+    try:
+        json_data = await fetch_bea_data_async(indicator, frequency=frequency)
+        return await run_parser(_build_bea_result, json_data)
 
     except ValueError as e:
         return {"error": str(e)}
@@ -202,6 +221,14 @@ def crawl_bea_indicator(indicator: str, frequency: str = "QSA") -> Dict[str, Any
     except Exception as e:
         return {"error": f"BEA crawling error: {str(e)}"}
 
+def _build_bea_result(json_data: Dict[str, Any]) -> Dict[str, Any]:
+    rows = parse_bea_response(json_data)
+
+    if not rows:
+        return {"error": "No BEA data found"}
+
+    return extract_bea_data(rows)
+
 
 if __name__ == "__main__":
     # 테스트: Current Account Balance
@@ -2,37 +2,66 @@
 FRED (Federal Reserve Economic Data) CSV 크롤러
 - Yield Curve (10Y-2Y), Real Yield (TIPS) 등 FRED 데이터 크롤링
 - CSV 형식 API 활용
+- store(관측치 저장소, db_service) 를 주면 증분 조회: 저장된 마지막 관측치 이후만 받아
+  저장된 시계열과 합친 뒤 YoY/차이를 계산 (처음이거나 저장 구간이 부족하면 전체 구간 조회)
+- crawl_fred_indicators_async: 증분 조회할 시리즈들을 fredgraph 다중 시리즈 요청 1회로 가져옴
 """
 
+import asyncio
 import requests
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
-def fetch_fred_csv(series_id: str, days: int = 14) -> str:
+import numpy as np
+
+from crawlers.http_client import async_http_get, http_get
+from crawlers.parse_pool import run_parser
+from services.series_transforms import lag_index, to_dates, yoy_pct
+
+FRED_CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv"
+
+# YoY 계산 시 최소 조회 기간 (1년 전 값 확보)
+YOY_MIN_DAYS = 500
+# 저장된 관측치가 조회 구간 시작보다 이만큼 넘게 늦게 시작하면 전체 구간을 다시 받음 (분기 시리즈 간격 허용)
+FRED_COVERAGE_SLACK_DAYS = 100
+# 다중 시리즈 요청은 시작일이 이 범위 안인 시리즈끼리 묶음 (일간/월간 시리즈를 섞어 일간 행을 많이 받지 않도록)
+FRED_MULTI_START_SPREAD_DAYS = 7
+
+def _fred_csv_params(series_id: str, days: int, start: Optional[str] = None) -> Dict[str, str]:
+    """최근 N일 (start 가 있으면 start 이후) 범위 요청 파라미터, series_id 는 쉼표로 여러 개 가능"""
+    end_date = datetime.now()
+    start_date = start or (end_date - timedelta(days=days)).strftime('%Y-%m-%d')
+    return {
+        'id': series_id,
+        'cosd': start_date,
+        'coed': end_date.strftime('%Y-%m-%d')
+    }
+
+def fetch_fred_csv(series_id: str, days: int = 14, start: Optional[str] = None) -> str:
     """FRED CSV API에서 데이터 가져오기
 
     Args:
         series_id: FRED 시리즈 ID (예: T10Y2Y, DFII10)
         days: 가져올 최근 일수
+        start: 시작일 (YYYY-MM-DD, 주면 days 대신 사용)
 
     Returns:
         CSV 텍스트 데이터
     """
-    # 날짜 범위 계산 (최근 N일)
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-
-    url = f"https://fred.stlouisfed.org/graph/fredgraph.csv"
-    params = {
-        'id': series_id,
-        'cosd': start_date.strftime('%Y-%m-%d'),
-        'coed': end_date.strftime('%Y-%m-%d')
-    }
+    response = http_get(FRED_CSV_URL, params=_fred_csv_params(series_id, days, start))
+    response.raise_for_status()
+    return response.text
 
-    response = requests.get(url, params=params, timeout=10)
+async def fetch_fred_csv_async(series_id: str, days: int = 14, start: Optional[str] = None) -> str:
+    """fetch_fred_csv 의 asyncio 버전"""
+    response = await async_http_get(FRED_CSV_URL, params=_fred_csv_params(series_id, days, start))
     response.raise_for_status()
     return response.text
 
+async def fetch_fred_csv_multi_async(series_ids: List[str], start: str) -> str:
+    """여러 시리즈를 한 번에 (observation_date,S1,S2,... 컬럼 CSV)"""
+    return await fetch_fred_csv_async(','.join(series_ids), start=start)
+
 def parse_fred_csv(csv_text: str) -> List[Dict[str, Any]]:
     """FRED CSV 데이터 파싱
 
@@ -83,6 +112,40 @@ def parse_fred_csv(csv_text: str) -> List[Dict[str, Any]]:
     result.sort(key=lambda x: x['date'], reverse=True)
     return result
 
+def parse_fred_csv_multi(csv_text: str) -> Dict[str, List[Dict[str, Any]]]:
+    """다중 시리즈 FRED CSV 파싱
+
+    CSV 형식:
+    observation_date,T10Y2Y,DFII10
+    2025-11-26,0.55,1.82
+    2025-11-25,0.58,
+
+    Returns:
+        {series_id: [{date, value}, ...] (최신순)} - 값이 없는 칸('.', 빈 칸)은 건너뜀
+    """
+    lines = csv_text.strip().split('\n')
+    if len(lines) < 2:
+        return {}
+
+    series_ids = [column.strip() for column in lines[0].split(',')[1:]]
+    result: Dict[str, List[Dict[str, Any]]] = {series_id: [] for series_id in series_ids}
+
+    for line in lines[1:]:
+        parts = line.split(',')
+        date_str = parts[0].strip()
+        for series_id, value_str in zip(series_ids, parts[1:]):
+            value_str = value_str.strip()
+            if value_str in ('', '.'):
+                continue
+            try:
+                result[series_id].append({'date': date_str, 'value': float(value_str)})
+            except ValueError:
+                continue
+
+    for rows in result.values():
+        rows.sort(key=lambda x: x['date'], reverse=True)
+    return result
+
 def extract_fred_data(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
     """FRED 데이터를 standard indicator format으로 변환
 
@@ -121,68 +184,53 @@ def extract_fred_data(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
                 "forecast": None,
                 "previous": None  # history에서는 previous 계산 안함
             }
-            for row in rows[:12]  # 최근 12개 (약 2주치)
+            for row in rows  # 수집 구간 전체 (DB에 누적 저장)
         ]
     }
 
 
-def _find_year_ago_row(rows: List[Dict[str, Any]], index: int) -> Optional[Dict[str, Any]]:
-    """주어진 인덱스의 날짜 기준으로 1년 전 데이터 찾기"""
-    if index >= len(rows):
-        return None
-
-    target_date = datetime.fromisoformat(rows[index]['date']) - timedelta(days=365)
-    for row in rows[index + 1:]:
-        row_date = datetime.fromisoformat(row['date'])
-        if row_date <= target_date:
-            return row
-    return None
-
-
 def _extract_yoy_data(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     FRED 데이터에서 전년동기 대비(%)를 계산하여 반환
     - latest_release.actual: YoY %
     - history_table.actual: 각 포인트의 YoY %
+    - 1년 전 값: 365일 전 시점 이하의 가장 최근 관측치 (series_transforms 벡터 연산)
     """
     if not rows:
         return {"error": "No FRED data found"}
 
+    # rows 는 최신순 → 날짜 오름차순 배열로 뒤집어 계산 (마지막 인덱스가 최신)
+    ordered = rows[::-1]
+    dates = to_dates(row['date'] for row in ordered)
+    values = np.array([row['value'] for row in ordered], dtype=float)
+    year_ago_index = lag_index(dates, 365)
+    changes = yoy_pct(dates, values)
+
     # 최신 관측값 기준 YoY 계산
-    year_ago_row = _find_year_ago_row(rows, 0)
-    if not year_ago_row:
+    if year_ago_index[-1] < 0:
         return {"error": "Insufficient FRED data for YoY calculation"}
+    if values[year_ago_index[-1]] == 0:
+        return {"error": "Year-ago value is zero, cannot compute YoY"}
 
     latest = rows[0]
-    try:
-        yoy = round((latest['value'] - year_ago_row['value']) / year_ago_row['value'] * 100, 2)
-    except ZeroDivisionError:
-        return {"error": "Year-ago value is zero, cannot compute YoY"}
+    yoy = round(float(changes[-1]), 2)
 
     # 직전 관측치 기준 YoY (previous)
     previous_yoy = None
-    if len(rows) > 1:
-        prev_year_ago = _find_year_ago_row(rows, 1)
-        if prev_year_ago:
-            try:
-                previous_yoy = round((rows[1]['value'] - prev_year_ago['value']) / prev_year_ago['value'] * 100, 2)
-            except ZeroDivisionError:
-                previous_yoy = None
-
-    history = []
-    # 최근 12개 관측치에 대해 YoY 변환
-    for i, row in enumerate(rows[:12]):
-        year_ago = _find_year_ago_row(rows, i)
-        if not year_ago or year_ago['value'] == 0:
-            continue
-        yoy_value = round((row['value'] - year_ago['value']) / year_ago['value'] * 100, 2)
-        history.append({
-            "release_date": row['date'],
+    if len(rows) > 1 and not np.isnan(changes[-2]):
+        previous_yoy = round(float(changes[-2]), 2)
+
+    # 1년 전 값이 있는 모든 관측치에 대해 YoY 변환 (DB에 누적 저장)
+    history = [
+        {
+            "release_date": ordered[i]['date'],
             "time": "N/A",
-            "actual": yoy_value,
+            "actual": round(float(changes[i]), 2),
             "forecast": None,
             "previous": None
-        })
+        }
+        for i in np.flatnonzero(~np.isnan(changes))[::-1]
+    ]
 
     return {
         "latest_release": {
@@ -198,7 +246,73 @@ def _extract_yoy_data(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def crawl_fred_indicator(series_id: str, calculate_yoy: bool = False, days: int = 14) -> Dict[str, Any]:
+def build_fred_result(rows: List[Dict[str, Any]], calculate_yoy: bool) -> Dict[str, Any]:
+    """관측치(최신순) → standard indicator format (YoY 변환 포함)"""
+    if not rows:
+        return {"error": "No FRED data found"}
+
+    if calculate_yoy:
+        return _extract_yoy_data(rows)
+
+    return extract_fred_data(rows)
+
+
+def _build_fred_result(csv_text: str, calculate_yoy: bool) -> Dict[str, Any]:
+    return build_fred_result(parse_fred_csv(csv_text), calculate_yoy)
+
+
+# ---------- 증분 조회 (저장된 관측치 + 새 관측치) ----------
+
+def _window_days(calculate_yoy: bool, days: int) -> int:
+    return max(days, YOY_MIN_DAYS) if calculate_yoy else days
+
+
+def _window_start(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+def _incremental_start(stored: List[Dict[str, Any]], window_start: str) -> Optional[str]:
+    """저장된 관측치로 구간이 채워져 있으면 재요청 시작일 (최근 2개 관측치부터, 수정치 반영), 아니면 None"""
+    if len(stored) < 2:
+        return None
+    coverage_limit = datetime.strptime(window_start, '%Y-%m-%d') + timedelta(days=FRED_COVERAGE_SLACK_DAYS)
+    if stored[-1]['date'] > coverage_limit.strftime('%Y-%m-%d'):
+        return None
+    return stored[1]['date']
+
+
+def _group_by_start(starts: Dict[str, str]) -> List[List[str]]:
+    """시작일이 FRED_MULTI_START_SPREAD_DAYS 안인 시리즈끼리 묶음"""
+    groups: List[List[str]] = []
+    group_start = None
+    for series_id, start in sorted(starts.items(), key=lambda item: item[1]):
+        start_date = datetime.strptime(start, '%Y-%m-%d')
+        if group_start is None or (start_date - group_start).days > FRED_MULTI_START_SPREAD_DAYS:
+            groups.append([])
+            group_start = start_date
+        groups[-1].append(series_id)
+    return groups
+
+
+def merge_observations(stored: List[Dict[str, Any]], fetched: List[Dict[str, Any]],
+                       window_start: str) -> List[Dict[str, Any]]:
+    """저장된 관측치 + 새로 받은 관측치 (같은 날짜는 새 값 우선), 구간 시작 이후만 최신순"""
+    values = {row['date']: row['value'] for row in stored}
+    values.update((row['date'], row['value']) for row in fetched)
+    return [{'date': date, 'value': values[date]} for date in sorted(values, reverse=True) if date >= window_start]
+
+
+def _merge_and_build(store, series_id: str, stored: List[Dict[str, Any]], fetched: List[Dict[str, Any]],
+                     window_start: str, calculate_yoy: bool) -> Dict[str, Any]:
+    if fetched:
+        try:
+            store.save_fred_observations({series_id: fetched})
+        except Exception as e:
+            print(f"⚠️ FRED observation save error: {e}")
+    return build_fred_result(merge_observations(stored, fetched, window_start), calculate_yoy)
+
+
+def crawl_fred_indicator(series_id: str, calculate_yoy: bool = False, days: int = 14, store=None) -> Dict[str, Any]:
     """FRED 지표 크롤링 (Main Entry Point)
 
     Args:
@@ -208,20 +322,35 @@ def crawl_fred_indicator(series_id: str, calculate_yoy: bool = False, days: int
             - CPIAUCSL_PC1: CPI MoM 변화율
         calculate_yoy: True면 전년동기 대비 %로 변환 (M2 등 레벨 데이터용)
         days: 가져올 일수 (기본 14일, YoY는 500일, 월별 데이터는 180일 권장)
+        store: 관측치 저장소 (get_fred_observations / save_fred_observations), 주면 증분 조회
     """
     try:
-        if calculate_yoy and days < 500:
-            days = 500  # YoY 계산 시 최소 1년치 이상 확보
-        csv_text = fetch_fred_csv(series_id, days=days)
-        rows = parse_fred_csv(csv_text)
+        days = _window_days(calculate_yoy, days)  # YoY 계산 시 최소 1년치 이상 확보
+        if store is None:
+            csv_text = fetch_fred_csv(series_id, days=days)
+            return _build_fred_result(csv_text, calculate_yoy)
 
-        if not rows:
-            return {"error": "No FRED data found"}
+        window_start = _window_start(days)
+        stored = store.get_fred_observations({series_id: window_start}).get(series_id, [])
+        start = _incremental_start(stored, window_start)
+        fetched = parse_fred_csv(fetch_fred_csv(series_id, days=days, start=start))
+        return _merge_and_build(store, series_id, stored, fetched, window_start, calculate_yoy)
 
-        if calculate_yoy:
-            return _extract_yoy_data(rows)
+    except requests.RequestException as e:
+        return {"error": f"FRED API error: {str(e)}"}
+    except Exception as e:
+        return {"error": f"FRED parsing error: {str(e)}"}
 
-        return extract_fred_data(rows)
+
+async def crawl_fred_indicator_async(series_id: str, calculate_yoy: bool = False, days: int = 14, store=None) -> Dict[str, Any]:
+    """crawl_fred_indicator 의 asyncio 버전 (CSV 파싱/YoY 계산/저장소 조회는 워커 풀에서)"""
+    if store is not None:
+        results = await crawl_fred_indicators_async({series_id: (series_id, calculate_yoy, days)}, store=store)
+        return results[series_id]
+    try:
+        days = _window_days(calculate_yoy, days)
+        csv_text = await fetch_fred_csv_async(series_id, days=days)
+        return await run_parser(_build_fred_result, csv_text, calculate_yoy)
 
     except requests.RequestException as e:
         return {"error": f"FRED API error: {str(e)}"}
@@ -229,6 +358,78 @@ def crawl_fred_indicator(series_id: str, calculate_yoy: bool = False, days: int
         return {"error": f"FRED parsing error: {str(e)}"}
 
 
+async def crawl_fred_indicators_async(specs: Dict[str, Tuple[str, bool, int]], store) -> Dict[str, Dict[str, Any]]:
+    """여러 FRED 지표 증분 크롤링
+
+    저장된 관측치가 조회 구간을 채우는 시리즈는 최근 관측치 이후만 다중 시리즈 요청 1회로 받고,
+    처음이거나 구간이 부족한 시리즈(또는 다중 요청 실패 시)는 시리즈별로 요청한다.
+
+    Args:
+        specs: {key(지표 ID 등): (series_id, calculate_yoy, days)}
+        store: 관측치 저장소 (get_fred_observations / save_fred_observations)
+
+    Returns:
+        {key: crawl_fred_indicator 와 같은 결과 또는 {"error": ...}}
+    """
+    windows: Dict[str, str] = {}
+    for series_id, calculate_yoy, days in specs.values():
+        window_start = _window_start(_window_days(calculate_yoy, days))
+        windows[series_id] = min(window_start, windows.get(series_id, window_start))
+
+    try:
+        stored = await run_parser(store.get_fred_observations, windows)
+    except Exception as e:
+        return {key: {"error": f"FRED store error: {str(e)}"} for key in specs}
+
+    starts = {series_id: _incremental_start(stored.get(series_id, []), window_start)
+              for series_id, window_start in windows.items()}
+    incremental = {series_id: start for series_id, start in starts.items() if start}
+    fetched: Dict[str, List[Dict[str, Any]]] = {}
+    errors: Dict[str, str] = {}
+
+    async def fetch_group(group: List[str]):
+        try:
+            csv_text = await fetch_fred_csv_multi_async(group, min(incremental[series_id] for series_id in group))
+            multi = await run_parser(parse_fred_csv_multi, csv_text)
+            fetched.update({series_id: multi[series_id] for series_id in group if series_id in multi})
+        except Exception as e:
+            print(f"⚠️ FRED multi-series fetch failed, falling back to per-series: {e}")
+
+    await asyncio.gather(*(fetch_group(group) for group in _group_by_start(incremental) if len(group) > 1))
+
+    async def fetch_one(series_id: str):
+        try:
+            csv_text = await fetch_fred_csv_async(series_id, start=starts[series_id] or windows[series_id])
+            fetched[series_id] = await run_parser(parse_fred_csv, csv_text)
+        except requests.RequestException as e:
+            errors[series_id] = f"FRED API error: {str(e)}"
+        except Exception as e:
+            errors[series_id] = f"FRED parsing error: {str(e)}"
+
+    await asyncio.gather(*(fetch_one(series_id) for series_id in windows if series_id not in fetched))
+
+    new_rows = {series_id: rows for series_id, rows in fetched.items() if rows}
+    if new_rows:
+        try:
+            await run_parser(store.save_fred_observations, new_rows)
+        except Exception as e:
+            print(f"⚠️ FRED observation save error: {e}")
+
+    results = {}
+    for key, (series_id, calculate_yoy, days) in specs.items():
+        if series_id in errors:
+            results[key] = {"error": errors[series_id]}
+            continue
+        rows = merge_observations(
+            stored.get(series_id, []), fetched.get(series_id, []), _window_start(_window_days(calculate_yoy, days))
+        )
+        try:
+            results[key] = await run_parser(build_fred_result, rows, calculate_yoy)
+        except Exception as e:
+            results[key] = {"error": f"FRED parsing error: {str(e)}"}
+    return results
+
+
 if __name__ == "__main__":
     # 테스트: Yield Curve (10Y-2Y)
     print("Testing Yield Curve (10Y-2Y)...")
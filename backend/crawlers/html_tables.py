@@ -0,0 +1,212 @@
+"""
+HTML 테이블 전용 경량 파서 (크롤러 파싱 핫스팟용)
+- 문서 전체 BeautifulSoup 트리 대신 <table> 구간만 잘라서 토크나이즈
+- 구간 찾기는 문서를 왼쪽부터 한 번 훑는 정규식 (주석/CDATA/script/style 블록과 따옴표 속성이 있는 태그를
+  통째로 건너뛰므로, 그 안의 '<table' 문자열은 태그로 보지 않음 - BeautifulSoup 과 동일)
+- table/thead/tbody/tfoot/tr/td/th 노드만 만드는 작은 트리, 셀 텍스트는 get_text() 와 같은 자손 텍스트 연결
+  (CDATA 포함, script/style/주석/선언 제외, pre/textarea 밖의 공백뿐인 텍스트 노드는 줄바꿈/공백 하나로)
+- 태그 열고 닫기는 BeautifulSoup(html.parser) 규칙을 따름 (암묵적 닫기 없음, 닫는 태그는 가장 가까운 같은 태그까지 pop)
+
+문자열 검색/정규식(C 구현)으로 테이블 밖 ~1MB 를 건너뛰므로, 파싱 중 GIL 을 잡는 파이썬 코드는 테이블 구간에만 돈다.
+벤치마크 (crawlers/fixtures 의 저장된 investing.com 페이지로 BeautifulSoup 결과와 같은지 먼저 확인):
+    python benchmark_parsers.py
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Iterator, List, Optional, Sequence, Union
+
+TABLE_TAGS = frozenset(['table', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th'])
+CELL_TAGS = frozenset(['td', 'th'])
+
+# BeautifulSoup html 빌더의 빈 요소 (닫는 태그 없이 끝남)
+VOID_TAGS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'menuitem',
+    'meta', 'param', 'source', 'track', 'wbr', 'basefont', 'bgsound', 'command', 'frame',
+    'image', 'isindex', 'nextid', 'spacer',
+])
+
+# script/style 내용은 BeautifulSoup get_text() 에 포함되지 않음
+RAW_TEXT_TAGS = frozenset(['script', 'style'])
+
+# 공백만 있는 텍스트 노드를 줄이지 않는 태그 (BeautifulSoup preserve_whitespace_tags)
+PRESERVE_WHITESPACE_TAGS = frozenset(['pre', 'textarea'])
+ASCII_SPACES = ' \n\t\x0c\r'
+
+# 왼쪽부터 차례로 맞추는 토큰 (앞선 토큰이 소비한 구간 안의 '<table' 은 다시 보지 않음)
+# - 주석 / CDATA / script·style 블록: 통째로 건너뜀
+# - table 태그 (group 1: 닫는 태그 '/')
+# - 속성 값('=')/따옴표/'<' 가 든 다른 태그: 속성 값 안의 '<table' 을 건너뛰기 위해 태그 전체를 소비
+#   (속성 없는 태그는 '<table' 을 담을 수 없으므로 맞추지 않고 C 엔진이 지나감)
+# 속성 값 따옴표는 '=' 바로 뒤에서만 (html.parser 와 동일, it's 같은 값의 따옴표는 일반 문자),
+# 대안끼리 겹치지 않게 해서 닫는 '>' 가 없어도 되돌아가기가 폭증하지 않도록 함
+_ATTRIBUTE_TAIL = r"""(?:[^>"'=]|=\s*"[^"]*"|=\s*'[^']*'|=(?!\s*["'])|["'])*"""
+_TABLE_SCAN = re.compile(
+    r"<!--.*?-->"
+    r"|<!\[CDATA\[.*?\]\]>"
+    r"|<script\b.*?</script\s*>"
+    r"|<style\b.*?</style\s*>"
+    r"|<(/?)table\b" + _ATTRIBUTE_TAIL + r">?"
+    r"|<[a-zA-Z][^>\"'<=]*(?=[=\"'<])" + _ATTRIBUTE_TAIL + r">",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+class TableNode:
+    """테이블 구조 노드 (BeautifulSoup Tag 의 find/find_all/get_text 중 필요한 부분만)"""
+
+    __slots__ = ('name', 'children', '_text')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.children: List['TableNode'] = []
+        self._text: List[str] = []
+
+    def get_text(self) -> str:
+        return ''.join(self._text)
+
+    def descendants(self) -> Iterator['TableNode']:
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+    def find_all(self, names: Union[str, Sequence[str]]) -> List['TableNode']:
+        names = (names,) if isinstance(names, str) else tuple(names)
+        return [node for node in self.descendants() if node.name in names]
+
+    def find(self, name: str) -> Optional['TableNode']:
+        for node in self.descendants():
+            if node.name == name:
+                return node
+        return None
+
+
+class _TableBuilder(HTMLParser):
+    """테이블 구간 토크나이저 → TableNode 트리"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = TableNode('[document]')
+        # (태그 이름, TableNode 또는 None) - 테이블 외 태그도 닫는 태그 처리를 위해 쌓는다
+        self._stack: List[tuple] = []
+        self._open_cells: List[TableNode] = []
+        # 열려 있는 script/style 수 (그 안의 텍스트는 셀 텍스트에서 제외)
+        self._raw_text_depth = 0
+        # 열려 있는 pre/textarea 수 (그 안의 공백 텍스트는 그대로)
+        self._preserve_depth = 0
+        # 다음 태그/주석/선언까지 이어지는 텍스트 조각 (BeautifulSoup 처럼 한 텍스트 노드로 합쳐 처리)
+        self._pending: List[str] = []
+
+    def _parent(self) -> TableNode:
+        for _, node in reversed(self._stack):
+            if node is not None:
+                return node
+        return self.root
+
+    def _flush_data(self):
+        """모아 둔 텍스트 노드를 열린 셀에 추가 (BeautifulSoup endData 처럼 공백뿐이면 줄바꿈/공백 하나로 줄임)"""
+        if not self._pending:
+            return
+        data = ''.join(self._pending)
+        self._pending.clear()
+        if self._raw_text_depth:
+            return
+        if not self._preserve_depth and not data.strip(ASCII_SPACES):
+            data = '\n' if '\n' in data else ' '
+        for cell in self._open_cells:
+            cell._text.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_data()
+        if tag in VOID_TAGS:
+            return
+        node = None
+        if tag in TABLE_TAGS:
+            node = TableNode(tag)
+            self._parent().children.append(node)
+            if tag in CELL_TAGS:
+                self._open_cells.append(node)
+        elif tag in RAW_TEXT_TAGS:
+            self._raw_text_depth += 1
+        elif tag in PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depth += 1
+        self._stack.append((tag, node))
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush_data()
+        if tag in TABLE_TAGS:
+            self._parent().children.append(TableNode(tag))
+
+    def handle_endtag(self, tag):
+        self._flush_data()
+        if not any(name == tag for name, _ in self._stack):
+            return
+        while self._stack:
+            name, node = self._stack.pop()
+            if node is not None and node.name in CELL_TAGS:
+                self._open_cells.remove(node)
+            elif name in RAW_TEXT_TAGS:
+                self._raw_text_depth -= 1
+            elif name in PRESERVE_WHITESPACE_TAGS:
+                self._preserve_depth -= 1
+            if name == tag:
+                break
+
+    def handle_data(self, data):
+        self._pending.append(data)
+
+    def handle_comment(self, data):
+        self._flush_data()
+
+    def handle_decl(self, decl):
+        self._flush_data()
+
+    def handle_pi(self, data):
+        self._flush_data()
+
+    def unknown_decl(self, data):
+        # CDATA 는 BeautifulSoup 에서 CData 문자열 (get_text 포함), 그 밖의 선언은 제외
+        self._flush_data()
+        if data.upper().startswith('CDATA['):
+            self._pending.append(data[len('CDATA['):])
+            self._flush_data()
+
+    def close(self):
+        super().close()
+        self._flush_data()
+
+
+def _table_fragments(html: str) -> Iterator[str]:
+    """최상위 <table> ... </table> 구간 (중첩 테이블 포함, 닫히지 않으면 문서 끝까지)"""
+    depth = 0
+    start = 0
+    for match in _TABLE_SCAN.finditer(html):
+        closing = match.group(1)
+        if closing is None:
+            continue
+        if closing:
+            if depth == 0:
+                continue
+            depth -= 1
+            if depth == 0:
+                yield html[start:match.end()]
+        else:
+            if depth == 0:
+                start = match.start()
+            depth += 1
+    if depth > 0:
+        yield html[start:]
+
+
+def parse_tables(html: str) -> List[TableNode]:
+    """문서의 모든 <table> 노드 (BeautifulSoup find_all('table') 과 같은 순서, 중첩 포함)"""
+    builder = _TableBuilder()
+    for fragment in _table_fragments(html):
+        builder.feed(fragment)
+        builder.close()
+        builder.reset()
+        builder._stack.clear()
+        builder._open_cells.clear()
+        builder._raw_text_depth = 0
+        builder._preserve_depth = 0
+    return builder.root.find_all('table')
@@ -0,0 +1,327 @@
+"""
+크롤러 공용 HTTP 클라이언트
+- 프로세스당 requests.Session 1개 (호스트별 커넥션 풀, keep-alive 재사용)
+- gzip/deflate(+br) 압축 응답 기본 요청
+- 공통 timeout / 재시도 정책 (연결 오류, 502/503/504, Retry-After 준수 - 최대 RETRY_AFTER_MAX 초)
+- 호스트별 요청/오류/신규 커넥션/응답 시간 통계 (get_http_stats)
+- asyncio 용 async_http_get (이벤트 루프별 aiohttp.ClientSession, 같은 풀/재시도/통계 정책)
+  예외는 requests 예외로 변환하므로 크롤러의 기존 except requests.RequestException 처리를 그대로 쓴다.
+
+- 요청마다 소스별 적응형 rate limiter (crawlers/rate_limiter.py) 를 거친다
+
+429/403 처리(User-Agent 교체, 재시도)는 사이트별 정책이 달라 각 크롤러에서 한다.
+"""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from crawlers.rate_limiter import rate_limiter
+
+try:
+    import brotli  # noqa: F401  (urllib3 가 br 응답을 풀 수 있을 때만 요청)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# (connect, read) 초
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "15"))
+DEFAULT_TIMEOUT = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+# 풀을 유지할 호스트 수 / 호스트당 유지 커넥션 수 (rate_limiter 의 소스별 concurrency 이상)
+HTTP_POOL_HOSTS = int(os.getenv("HTTP_POOL_HOSTS", "16"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "8"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+# 이벤트 루프 -> aiohttp.ClientSession
+_async_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+RETRY_STATUSES = (502, 503, 504)
+# 502/503/504 재시도 전 Retry-After 대기 상한 (초, rate limiter 슬롯을 잡은 채 기다리므로)
+RETRY_AFTER_MAX = 30.0
+
+_stats: Dict[str, Dict[str, Any]] = {}
+_stats_lock = threading.Lock()
+
+
+class _CrawlRetry(Retry):
+    """RETRY_STATUSES 만 재시도하는 Retry
+
+    urllib3 는 Retry-After 가 붙은 429/413 도 재시도하는데, 429 는 크롤러(User-Agent 교체 등)와
+    rate limiter 가 처리해야 하므로 그대로 돌려준다 (async_http_get 과 같은 동작).
+    Retry-After 대기는 RETRY_AFTER_MAX 초까지만.
+    """
+
+    RETRY_AFTER_STATUS_CODES = frozenset()
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        return min(super().parse_retry_after(retry_after), RETRY_AFTER_MAX)
+
+
+def _build_session() -> requests.Session:
+    retry = _CrawlRetry(
+        total=HTTP_MAX_RETRIES,
+        connect=HTTP_MAX_RETRIES,
+        read=1,
+        status=HTTP_MAX_RETRIES,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """프로세스 공용 Session (fork 된 워커에서는 새로 생성)"""
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = _build_session()
+                _session_pid = pid
+    return _session
+
+
+def _pool_connections(session: requests.Session, url: str) -> Optional[int]:
+    """url 호스트 풀이 지금까지 새로 연 커넥션 수 (알 수 없으면 None)"""
+    try:
+        pool = session.get_adapter(url).poolmanager.connection_from_url(url)
+        return pool.num_connections
+    except Exception:
+        return None
+
+
+def _record(host: str, elapsed: float, status: Optional[int], new_connections: int):
+    with _stats_lock:
+        stats = _stats.setdefault(host, {
+            "requests": 0,
+            "errors": 0,
+            "new_connections": 0,
+            "total_time_ms": 0.0,
+            "status_counts": {},
+        })
+        stats["requests"] += 1
+        stats["total_time_ms"] += elapsed * 1000
+        stats["new_connections"] += max(0, new_connections)
+        if status is None:
+            stats["errors"] += 1
+        else:
+            key = str(status)
+            stats["status_counts"][key] = stats["status_counts"].get(key, 0) + 1
+
+
+def http_get(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+             timeout=None, **kwargs) -> requests.Response:
+    """공용 Session 으로 GET (통계 기록, 예외는 그대로 전파)
+
+    Args:
+        url: 요청 URL
+        params: 쿼리 파라미터
+        headers: 요청별 헤더 (Session 기본 헤더 위에 덮어씀)
+        timeout: None 이면 DEFAULT_TIMEOUT
+    """
+    session = get_session()
+    host = urlsplit(url).netloc
+    acquired = rate_limiter.acquire(url)
+    connections_before = _pool_connections(session, url)
+    started = time.monotonic()
+    response = None
+    try:
+        response = session.get(url, params=params, headers=headers, timeout=timeout or DEFAULT_TIMEOUT, **kwargs)
+        return response
+    finally:
+        status = response.status_code if response is not None else None
+        rate_limiter.release(acquired, status, _retry_after(response) if response is not None else None)
+        connections_after = _pool_connections(session, url)
+        new_connections = (
+            connections_after - connections_before
+            if connections_before is not None and connections_after is not None else 0
+        )
+        _record(host, time.monotonic() - started, status, new_connections)
+
+
+# ---------- asyncio (aiohttp) ----------
+
+class AsyncResponse:
+    """async_http_get 응답 (본문을 모두 읽은 상태, requests.Response 와 같은 방식으로 사용)"""
+
+    def __init__(self, url: str, status_code: int, headers: Any, content: bytes, encoding: Optional[str]):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+# 이벤트 루프에서 새로 연 커넥션 수 (요청 완료 시 _record 로 옮김)
+_pending_connections: Dict[str, int] = {}
+
+
+async def _on_request_start(session, context, params):
+    context.host = urlsplit(str(params.url)).netloc
+
+
+async def _on_connection_create_end(session, context, params):
+    host = getattr(context, 'host', None)
+    if host:
+        with _stats_lock:
+            _pending_connections[host] = _pending_connections.get(host, 0) + 1
+
+
+def get_async_session() -> aiohttp.ClientSession:
+    """현재 이벤트 루프용 공용 ClientSession (루프가 바뀌면 새로 생성)"""
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(_on_request_start)
+        trace.on_connection_create_end.append(_on_connection_create_end)
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_HOSTS * HTTP_POOL_MAXSIZE,
+            limit_per_host=HTTP_POOL_MAXSIZE,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers={'Accept-Encoding': ACCEPT_ENCODING},
+            trace_configs=[trace],
+        )
+        _async_sessions[loop] = session
+    return session
+
+
+async def close_async_session():
+    """현재 이벤트 루프의 ClientSession 종료 (업데이트 실행 종료 시 호출)"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    session = _async_sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _client_timeout(timeout) -> aiohttp.ClientTimeout:
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+async def async_http_get(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+                         timeout=None) -> AsyncResponse:
+    """공용 ClientSession 으로 GET (http_get 과 같은 재시도/통계, 대기는 asyncio.sleep)
+
+    Raises:
+        requests.Timeout / requests.ConnectionError: 재시도 후에도 연결 실패
+    """
+    session = get_async_session()
+    host = urlsplit(url).netloc
+    client_timeout = _client_timeout(timeout or DEFAULT_TIMEOUT)
+
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        acquired = await rate_limiter.acquire_async(url)
+        started = time.monotonic()
+        try:
+            async with session.get(url, params=params, headers=headers, timeout=client_timeout) as resp:
+                content = await resp.read()
+                response = AsyncResponse(str(resp.url), resp.status, resp.headers.copy(), content, resp.charset)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            rate_limiter.release(acquired)
+            _record(host, time.monotonic() - started, None, _pop_pending_connections(host))
+            if attempt >= HTTP_MAX_RETRIES:
+                if isinstance(e, asyncio.TimeoutError):
+                    raise requests.Timeout(f"Timeout for url: {url}") from e
+                raise requests.ConnectionError(f"{type(e).__name__}: {e}") from e
+            await asyncio.sleep(_retry_backoff(attempt))
+            continue
+        except BaseException:
+            # 취소 등: 슬롯만 반환
+            rate_limiter.release(acquired)
+            raise
+
+        rate_limiter.release(acquired, response.status_code, _retry_after(response))
+        _record(host, time.monotonic() - started, response.status_code, _pop_pending_connections(host))
+        if response.status_code in RETRY_STATUSES and attempt < HTTP_MAX_RETRIES:
+            await asyncio.sleep(_retry_after(response) or _retry_backoff(attempt))
+            continue
+        return response
+
+    return response
+
+
+def _pop_pending_connections(host: str) -> int:
+    with _stats_lock:
+        return _pending_connections.pop(host, 0)
+
+
+def _retry_backoff(attempt: int) -> float:
+    return 0.5 * (2 ** attempt) + random.uniform(0, 0.2)
+
+
+def _retry_after(response) -> Optional[float]:
+    value = response.headers.get('Retry-After')
+    try:
+        return min(float(value), RETRY_AFTER_MAX) if value else None
+    except ValueError:
+        return None
+
+
+def get_http_stats() -> Dict[str, Any]:
+    """호스트별 요청 통계 (헬스체크/모니터링용)
+
+    reused_connections 는 기존 keep-alive 커넥션으로 처리된 요청 수 (근사치).
+    """
+    with _stats_lock:
+        hosts = {}
+        for host, stats in _stats.items():
+            item = dict(stats, status_counts=dict(stats["status_counts"]))
+            item["reused_connections"] = max(0, stats["requests"] - stats["new_connections"])
+            item["avg_time_ms"] = round(stats["total_time_ms"] / stats["requests"], 1) if stats["requests"] else 0.0
+            item["total_time_ms"] = round(stats["total_time_ms"], 1)
+            hosts[host] = item
+    return {
+        "pool_hosts": HTTP_POOL_HOSTS,
+        "pool_maxsize": HTTP_POOL_MAXSIZE,
+        "timeout": list(DEFAULT_TIMEOUT),
+        "hosts": hosts,
+        "rate_limits": rate_limiter.stats(),
+    }
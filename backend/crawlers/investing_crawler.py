@@ -1,11 +1,15 @@
+import asyncio
 import requests
 import time
 import random
-from bs4 import BeautifulSoup
 import re
 from datetime import datetime
 from typing import Dict, Optional, Any, List
 
+from crawlers.html_tables import parse_tables
+from crawlers.http_client import async_http_get, http_get
+from crawlers.page_cache import page_cache
+
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
@@ -14,16 +18,12 @@ USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 Edg/121.0.0.0',
 ]
 
-def fetch_html(url: str, retries: int = 3, base_delay: float = 2.0) -> str:
-    """
-    Fetch HTML content from the given URL with retry/backoff and realistic browser headers.
-    """
-    headers = {
+def _browser_headers() -> Dict[str, str]:
+    """실제 브라우저와 비슷한 요청 헤더 (User-Agent 는 무작위)"""
+    return {
         'User-Agent': random.choice(USER_AGENTS),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
         'Sec-Fetch-Dest': 'document',
         'Sec-Fetch-Mode': 'navigate',
@@ -33,6 +33,12 @@ def fetch_html(url: str, retries: int = 3, base_delay: float = 2.0) -> str:
         'Referer': 'https://www.google.com/',
     }
 
+def fetch_html(url: str, retries: int = 3, base_delay: float = 2.0) -> str:
+    """
+    Fetch HTML content from the given URL with retry/backoff and realistic browser headers.
+    """
+    headers = _browser_headers()
+
     last_error = None
     for attempt in range(retries + 1):
         try:
@@ -40,7 +46,7 @@ def fetch_html(url: str, retries: int = 3, base_delay: float = 2.0) -> str:
             if attempt > 0:
                 time.sleep(random.uniform(1.0, 3.0))
 
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_get(url, headers=headers)
             if response.status_code == 429 and attempt < retries:
                 backoff = base_delay * (2 ** attempt) + random.uniform(1.0, 3.0)
                 time.sleep(backoff)
@@ -62,15 +68,44 @@ def fetch_html(url: str, retries: int = 3, base_delay: float = 2.0) -> str:
 
     raise last_error
 
+async def fetch_html_async(url: str, retries: int = 3, base_delay: float = 2.0) -> str:
+    """fetch_html 의 asyncio 버전 (백오프 동안 이벤트 루프를 막지 않음)
+
+    page_cache.collect() 블록 안에서는 조건부 요청을 보내고, 바뀌지 않은 페이지면 PageUnchanged 를 던진다.
+    """
+    headers = page_cache.request_headers(url, _browser_headers())
+
+    last_error = None
+    for attempt in range(retries + 1):
+        try:
+            if attempt > 0:
+                await asyncio.sleep(random.uniform(1.0, 3.0))
+
+            response = await async_http_get(url, headers=headers)
+            if response.status_code == 429 and attempt < retries:
+                await asyncio.sleep(base_delay * (2 ** attempt) + random.uniform(1.0, 3.0))
+                continue
+            if response.status_code == 403 and attempt < retries:
+                headers['User-Agent'] = random.choice(USER_AGENTS)
+                await asyncio.sleep(base_delay * (2 ** attempt) + random.uniform(2.0, 5.0))
+                continue
+            page_cache.accept(url, response)
+            return response.text
+        except requests.RequestException as e:
+            last_error = e
+            if attempt >= retries:
+                break
+            await asyncio.sleep(base_delay * (2 ** attempt) + random.uniform(1.0, 3.0))
+
+    raise last_error
+
 def parse_history_table(html: str) -> List[Dict[str, Any]]:
     """
     Parse History Table from HTML and extract rows with Release Date, Time, Actual, Forecast, Previous
     """
-    soup = BeautifulSoup(html, 'html.parser')
-
     # Find the history table - look for table with economic data
     table = None
-    possible_tables = soup.find_all('table')
+    possible_tables = parse_tables(html)
 
     for t in possible_tables:
         # Check if table contains headers like "Release Date", "Actual", etc.
@@ -178,7 +213,7 @@ def extract_raw_data(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
             "previous": latest_release.get("actual")
         }
 
-    # 히스토리 데이터 추가 (최근 12개 레코드, actual 값이 있는 것만)
+    # 히스토리 데이터 추가 (actual 값이 있는 전체 레코드, DB에 누적 저장)
     history_table = []
     for row in rows:
         if row["actual"] is not None:
@@ -189,8 +224,6 @@ def extract_raw_data(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
                 "forecast": row["forecast"],
                 "previous": row["previous"]
             })
-            if len(history_table) >= 12:
-                break
 
     return {
         "latest_release": latest_release,
@@ -0,0 +1,167 @@
+"""
+스크래핑 페이지 조건부 요청 + 본문 해시 캐시
+- URL 별로 마지막 성공 크롤링의 ETag / Last-Modified / 본문 해시를 보관
+- 다음 요청에 If-None-Match / If-Modified-Since 를 보내고,
+  304 이거나 본문 해시가 같으면 PageUnchanged 를 던져 파싱/DB 저장을 건너뛴다
+- 해시는 크롤링 결과가 DB 에 저장된 뒤에만 commit 한다 (저장 실패 시 다음 실행에서 다시 파싱)
+- configure_redis(redis_client) 후에는 Redis 에 보관 (워커/재시작 간 공유), 없으면 프로세스 메모리
+
+본문 해시는 <script>/<style>/주석과 공백을 제거한 뒤 계산한다 (광고/토큰처럼 매 요청 바뀌는 부분 무시).
+
+사용 (asyncio 크롤링):
+    with page_cache.collect() as validators:
+        result = await crawl_xxx_async(url)   # fetch 함수가 request_headers/accept 호출
+    # 저장 성공 후
+    page_cache.commit(validators)
+"""
+
+import contextlib
+import contextvars
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+REDIS_KEY_PREFIX = "crawl:page:"
+REDIS_KEY_TTL = 30 * 24 * 3600  # seconds
+
+_NOISE_PATTERN = re.compile(r"<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 현재 크롤링 작업에서 새로 받은 페이지의 검증값 (commit 대기)
+_pending: "contextvars.ContextVar[Optional[List[Dict[str, Any]]]]" = contextvars.ContextVar("page_cache_pending", default=None)
+
+
+class PageUnchanged(Exception):
+    """마지막 성공 크롤링 이후 페이지가 바뀌지 않음 (파싱/저장 생략)"""
+
+    def __init__(self, url: str, reason: str):
+        super().__init__(f"{url} unchanged ({reason})")
+        self.url = url
+        self.reason = reason
+
+
+def body_hash(text: str) -> str:
+    normalized = _WHITESPACE_PATTERN.sub(" ", _NOISE_PATTERN.sub("", text))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class PageCache:
+    """URL → {etag, last_modified, body_hash, updated_at}"""
+
+    def __init__(self):
+        self.redis = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"not_modified": 0, "same_hash": 0, "changed": 0, "commits": 0}
+
+    def configure_redis(self, redis_client):
+        self.redis = redis_client
+
+    def _redis_key(self, url: str) -> str:
+        return REDIS_KEY_PREFIX + hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        if self.redis is not None:
+            try:
+                raw = self.redis.get(self._redis_key(url))
+                return json.loads(raw) if raw else None
+            except Exception as e:
+                print(f"⚠️ Redis page cache get error: {e}")
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry else None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """마지막 성공 크롤링의 검증값으로 조건부 요청 헤더 생성"""
+        entry = self.get(url)
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def check(self, url: str, response) -> None:
+        """응답이 마지막 성공 크롤링과 같으면 PageUnchanged, 다르면 검증값을 commit 대기 목록에 추가
+
+        Args:
+            response: status_code / headers / text 를 가진 응답 (requests.Response, AsyncResponse)
+        """
+        if response.status_code == 304:
+            self._count("not_modified")
+            raise PageUnchanged(url, "304 Not Modified")
+
+        digest = body_hash(response.text)
+        entry = self.get(url)
+        if entry and entry.get("body_hash") == digest:
+            self._count("same_hash")
+            raise PageUnchanged(url, "same body hash")
+
+        self._count("changed")
+        pending = _pending.get()
+        if pending is not None:
+            pending.append({
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body_hash": digest,
+            })
+
+    def active(self) -> bool:
+        """collect() 블록 안인지 (조건부 요청은 DB 저장까지 이어지는 배치 크롤링에서만 사용)"""
+        return _pending.get() is not None
+
+    def request_headers(self, url: str, headers: Dict[str, str]) -> Dict[str, str]:
+        """collect() 블록 안이면 headers + 조건부 요청 헤더"""
+        if not self.active():
+            return headers
+        return dict(headers, **self.conditional_headers(url))
+
+    def accept(self, url: str, response) -> None:
+        """raise_for_status + (collect() 블록 안이면) check"""
+        if response.status_code != 304:
+            response.raise_for_status()
+        if self.active():
+            self.check(url, response)
+
+    @contextlib.contextmanager
+    def collect(self):
+        """이 블록(및 여기서 만든 asyncio 태스크)에서 check 한 페이지의 검증값을 모음"""
+        validators: List[Dict[str, Any]] = []
+        token = _pending.set(validators)
+        try:
+            yield validators
+        finally:
+            _pending.reset(token)
+
+    def commit(self, validators: List[Dict[str, Any]]):
+        """크롤링 결과 저장 성공 후 검증값 기록"""
+        for validator in validators or []:
+            entry = dict(validator, updated_at=time.time())
+            url = entry.pop("url")
+            if self.redis is not None:
+                try:
+                    self.redis.setex(self._redis_key(url), REDIS_KEY_TTL, json.dumps(entry))
+                    self._count("commits")
+                    continue
+                except Exception as e:
+                    print(f"⚠️ Redis page cache set error: {e}")
+            with self._lock:
+                self._entries[url] = entry
+            self._count("commits")
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, local_entries=len(self._entries), shared=self.redis is not None)
+
+
+# 프로세스 공용 인스턴스
+page_cache = PageCache()
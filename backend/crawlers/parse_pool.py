@@ -0,0 +1,33 @@
+"""
+크롤러 HTML/CSV 파싱 워커 풀
+- async 크롤링 파이프라인에서 BeautifulSoup 파싱을 이벤트 루프 밖(스레드 풀)에서 실행
+- 이벤트 루프는 네트워크 대기만 담당하고, 파싱은 CRAWL_PARSE_WORKERS 개 워커가 처리
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+CRAWL_PARSE_WORKERS = int(os.getenv("CRAWL_PARSE_WORKERS", "4"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> ThreadPoolExecutor:
+    """프로세스 공용 파싱 스레드 풀"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=CRAWL_PARSE_WORKERS, thread_name_prefix="crawl-parse")
+    return _executor
+
+
+async def run_parser(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """func(*args, **kwargs) 를 파싱 워커 풀에서 실행하고 결과를 기다림"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_parse_executor(), functools.partial(func, *args, **kwargs))
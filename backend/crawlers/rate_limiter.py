@@ -0,0 +1,276 @@
+"""
+크롤링 소스별 적응형 요청 제한 (token bucket + 동시 요청 상한)
+- 소스(호스트)마다 별도 버킷: FRED 같은 API 는 빠르게, investing.com 은 임계치 아래로
+- 429 를 받으면 요청 속도를 절반으로 줄이고 Retry-After(없으면 기본값) 동안 쉰다
+- 403 은 속도만 줄이고, 성공 응답마다 조금씩 원래 속도로 회복 (AIMD)
+- 동시 요청 상한은 프로세스 내 스레드/이벤트 루프가 공유
+- configure_redis(redis_client) 후에는 버킷/속도/쿨다운을 Redis 에 두어 워커 간 공유
+
+http_client.http_get / async_http_get 이 요청마다 acquire/release 하므로 크롤러는 따로 호출할 필요가 없다.
+설정 덮어쓰기: CRAWL_RATE_LIMITS='{"investing.com": {"rate": 0.3, "concurrency": 1}}'
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# rate: 초당 요청 수 (시작값, 최대값), min_rate: 백오프 하한, burst: 버킷 크기, concurrency: 동시 요청 상한
+DEFAULT_SOURCE_LIMITS: Dict[str, Dict[str, float]] = {
+    "investing.com": {"rate": 0.5, "min_rate": 0.05, "burst": 2, "concurrency": 2},
+    "tradingeconomics.com": {"rate": 0.5, "min_rate": 0.05, "burst": 1, "concurrency": 1},
+    "multpl.com": {"rate": 1.0, "min_rate": 0.1, "burst": 2, "concurrency": 2},
+    "apps.bea.gov": {"rate": 1.0, "min_rate": 0.1, "burst": 2, "concurrency": 2},
+    "fred.stlouisfed.org": {"rate": 10.0, "min_rate": 0.5, "burst": 10, "concurrency": 8},
+    "default": {"rate": 2.0, "min_rate": 0.1, "burst": 4, "concurrency": 4},
+}
+
+# 성공 시 회복량 (초당 요청 수), 429/403 시 감소 비율, Retry-After 가 없을 때 429 쿨다운(초)
+RATE_INCREASE_STEP = 0.05
+RATE_DECREASE_ON_429 = 0.5
+RATE_DECREASE_ON_403 = 0.7
+DEFAULT_COOLDOWN_429 = 10.0
+MAX_COOLDOWN = 120.0
+
+REDIS_KEY_PREFIX = "crawl:ratelimit:"
+REDIS_KEY_TTL_MS = 3600 * 1000
+
+# 버킷에서 토큰 1개를 꺼냄, 모자라면 기다려야 할 시간(초) 반환 (Redis TIME 기준)
+_TAKE_TOKEN_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'rate', 'blocked_until')
+local rate = tonumber(data[3]) or tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local tokens = tonumber(data[1]) or burst
+local ts = tonumber(data[2]) or now_ms
+local blocked_until = tonumber(data[4]) or 0
+if blocked_until > now_ms then
+    return tostring((blocked_until - now_ms) / 1000)
+end
+tokens = math.min(burst, tokens + (now_ms - ts) / 1000 * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now_ms, 'rate', tostring(rate))
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return tostring(wait)
+"""
+
+# 속도 조정: ARGV = 곱할 비율, 더할 값, 하한, 상한, 쿨다운(ms)
+_ADJUST_RATE_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local rate = tonumber(redis.call('HGET', KEYS[1], 'rate')) or tonumber(ARGV[4])
+rate = math.max(tonumber(ARGV[3]), math.min(tonumber(ARGV[4]), rate * tonumber(ARGV[1]) + tonumber(ARGV[2])))
+redis.call('HSET', KEYS[1], 'rate', tostring(rate))
+local cooldown = tonumber(ARGV[5])
+if cooldown > 0 then
+    local blocked_until = tonumber(redis.call('HGET', KEYS[1], 'blocked_until')) or 0
+    redis.call('HSET', KEYS[1], 'blocked_until', math.max(blocked_until, now_ms + cooldown))
+end
+redis.call('PEXPIRE', KEYS[1], ARGV[6])
+return tostring(rate)
+"""
+
+
+def _load_source_limits() -> Dict[str, Dict[str, float]]:
+    limits = {source: dict(config) for source, config in DEFAULT_SOURCE_LIMITS.items()}
+    raw = os.getenv("CRAWL_RATE_LIMITS")
+    if raw:
+        try:
+            for source, config in json.loads(raw).items():
+                limits.setdefault(source, dict(DEFAULT_SOURCE_LIMITS["default"])).update(config)
+        except (ValueError, AttributeError) as e:
+            print(f"⚠️ Invalid CRAWL_RATE_LIMITS: {e}")
+    return limits
+
+
+class _SourceState:
+    """프로세스 내 소스별 버킷 상태"""
+
+    def __init__(self, config: Dict[str, float]):
+        self.max_rate = float(config["rate"])
+        self.min_rate = float(config.get("min_rate", self.max_rate / 10))
+        self.burst = float(config.get("burst", 1))
+        self.concurrency = int(config.get("concurrency", 1))
+        self.rate = self.max_rate
+        self.tokens = self.burst
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.in_flight = 0
+        self.stats = {"requests": 0, "throttled": 0, "forbidden": 0, "wait_time_ms": 0.0}
+
+
+class AdaptiveRateLimiter:
+    """소스별 적응형 token bucket (스레드/이벤트 루프 공용)"""
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.limits = limits if limits is not None else _load_source_limits()
+        self.redis = None
+        self._states: Dict[str, _SourceState] = {}
+        self._lock = threading.Lock()
+
+    def configure_redis(self, redis_client):
+        """워커 간 버킷 공유 (None 이면 프로세스 내에서만 제한)"""
+        self.redis = redis_client
+
+    # ---------- 소스 식별 ----------
+
+    def source_for(self, url: str) -> str:
+        host = urlsplit(url).hostname or ""
+        for source in self.limits:
+            if source != "default" and (host == source or host.endswith("." + source)):
+                return source
+        return "default"
+
+    def _state(self, source: str) -> _SourceState:
+        state = self._states.get(source)
+        if state is None:
+            with self._lock:
+                state = self._states.get(source)
+                if state is None:
+                    state = _SourceState(self.limits.get(source, self.limits["default"]))
+                    self._states[source] = state
+        return state
+
+    # ---------- 토큰/슬롯 ----------
+
+    def _take_token(self, source: str, state: _SourceState) -> float:
+        """토큰 1개 사용, 모자라면 대기 시간(초) 반환 (0 이면 바로 요청 가능)"""
+        if self.redis is not None:
+            try:
+                wait = self.redis.eval(
+                    _TAKE_TOKEN_SCRIPT, 1, REDIS_KEY_PREFIX + source,
+                    state.max_rate, state.burst, REDIS_KEY_TTL_MS
+                )
+                return float(wait)
+            except Exception as e:
+                print(f"⚠️ Redis rate limiter error ({source}): {e}")
+
+        with self._lock:
+            now = time.monotonic()
+            if state.blocked_until > now:
+                return state.blocked_until - now
+            state.tokens = min(state.burst, state.tokens + (now - state.updated_at) * state.rate)
+            state.updated_at = now
+            if state.tokens >= 1:
+                state.tokens -= 1
+                return 0.0
+            return (1 - state.tokens) / state.rate
+
+    def _try_enter(self, state: _SourceState) -> bool:
+        with self._lock:
+            if state.in_flight >= state.concurrency:
+                return False
+            state.in_flight += 1
+            return True
+
+    def _leave(self, state: _SourceState):
+        with self._lock:
+            state.in_flight = max(0, state.in_flight - 1)
+
+    def acquire(self, url: str) -> Tuple[str, _SourceState]:
+        """요청 가능할 때까지 대기 (동기). release(url 소스, status) 와 짝으로 호출"""
+        source = self.source_for(url)
+        state = self._state(source)
+        started = time.monotonic()
+        while not self._try_enter(state):
+            time.sleep(self.POLL_INTERVAL)
+        try:
+            wait = self._take_token(source, state)
+            while wait > 0:
+                time.sleep(min(wait, MAX_COOLDOWN))
+                wait = self._take_token(source, state)
+        except BaseException:
+            self._leave(state)
+            raise
+        self._record_wait(state, started)
+        return source, state
+
+    async def acquire_async(self, url: str) -> Tuple[str, _SourceState]:
+        """acquire 의 asyncio 버전 (대기 중 이벤트 루프를 막지 않음, Redis 호출은 짧은 동기 호출)"""
+        source = self.source_for(url)
+        state = self._state(source)
+        started = time.monotonic()
+        while not self._try_enter(state):
+            await asyncio.sleep(self.POLL_INTERVAL)
+        try:
+            wait = self._take_token(source, state)
+            while wait > 0:
+                await asyncio.sleep(min(wait, MAX_COOLDOWN))
+                wait = self._take_token(source, state)
+        except BaseException:
+            self._leave(state)
+            raise
+        self._record_wait(state, started)
+        return source, state
+
+    def _record_wait(self, state: _SourceState, started: float):
+        with self._lock:
+            state.stats["requests"] += 1
+            state.stats["wait_time_ms"] += (time.monotonic() - started) * 1000
+
+    def release(self, acquired: Tuple[str, _SourceState], status: Optional[int] = None,
+                retry_after: Optional[float] = None):
+        """슬롯 반환 + 응답 상태로 속도 조정 (status None = 네트워크 오류, 조정 없음)"""
+        source, state = acquired
+        self._leave(state)
+        if status == 429:
+            cooldown = min(retry_after or DEFAULT_COOLDOWN_429, MAX_COOLDOWN)
+            self._adjust(source, state, RATE_DECREASE_ON_429, 0.0, cooldown)
+            with self._lock:
+                state.stats["throttled"] += 1
+        elif status == 403:
+            self._adjust(source, state, RATE_DECREASE_ON_403, 0.0, 0.0)
+            with self._lock:
+                state.stats["forbidden"] += 1
+        elif status is not None and status < 400:
+            if state.rate < state.max_rate:
+                self._adjust(source, state, 1.0, RATE_INCREASE_STEP * state.max_rate, 0.0)
+
+    def _adjust(self, source: str, state: _SourceState, factor: float, increase: float, cooldown: float):
+        if self.redis is not None:
+            try:
+                rate = self.redis.eval(
+                    _ADJUST_RATE_SCRIPT, 1, REDIS_KEY_PREFIX + source,
+                    factor, increase, state.min_rate, state.max_rate, int(cooldown * 1000), REDIS_KEY_TTL_MS
+                )
+                with self._lock:
+                    state.rate = float(rate)
+                return
+            except Exception as e:
+                print(f"⚠️ Redis rate limiter error ({source}): {e}")
+
+        with self._lock:
+            state.rate = max(state.min_rate, min(state.max_rate, state.rate * factor + increase))
+            if cooldown > 0:
+                state.blocked_until = max(state.blocked_until, time.monotonic() + cooldown)
+
+    def stats(self) -> Dict[str, Any]:
+        """소스별 현재 속도/동시 요청/스로틀 횟수"""
+        with self._lock:
+            return {
+                source: dict(
+                    state.stats,
+                    wait_time_ms=round(state.stats["wait_time_ms"], 1),
+                    rate=round(state.rate, 3),
+                    max_rate=state.max_rate,
+                    in_flight=state.in_flight,
+                    concurrency=state.concurrency,
+                    shared=self.redis is not None,
+                )
+                for source, state in self._states.items()
+            }
+
+
+# 프로세스 공용 인스턴스
+rate_limiter = AdaptiveRateLimiter()
@@ -4,13 +4,18 @@ Investing.com Rates-Bonds Historical Data 크롤러
 - Daily price data를 Economic Calendar 형식으로 변환
 """
 
-from bs4 import BeautifulSoup
+import asyncio
 import requests
 import time
 import random
 from typing import List, Dict, Any
 from datetime import datetime
 
+from crawlers.html_tables import parse_tables
+from crawlers.http_client import async_http_get, http_get
+from crawlers.page_cache import PageUnchanged, page_cache
+from crawlers.parse_pool import run_parser
+
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
@@ -18,19 +23,18 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
 ]
 
-def fetch_historical_data(url: str, retries: int = 3, base_delay: float = 2.0) -> str:
-    """Historical Data 페이지 HTML 가져오기"""
-    # rates-bonds, commodities, indices, currencies 페이지를 Historical Data 페이지로 변환
+def _historical_data_url(url: str) -> str:
+    """rates-bonds, commodities, indices, currencies 페이지를 Historical Data 페이지로 변환"""
     patterns = ["/rates-bonds/", "/commodities/", "/indices/", "/currencies/"]
     if any(pattern in url for pattern in patterns) and "-historical-data" not in url:
         url = url + "-historical-data"
+    return url
 
-    headers = {
+def _browser_headers() -> Dict[str, str]:
+    return {
         'User-Agent': random.choice(USER_AGENTS),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
         'Sec-Fetch-Dest': 'document',
         'Sec-Fetch-Mode': 'navigate',
@@ -39,13 +43,18 @@ def fetch_historical_data(url: str, retries: int = 3, base_delay: float = 2.0) -
         'Referer': 'https://www.google.com/',
     }
 
+def fetch_historical_data(url: str, retries: int = 3, base_delay: float = 2.0) -> str:
+    """Historical Data 페이지 HTML 가져오기"""
+    url = _historical_data_url(url)
+    headers = _browser_headers()
+
     last_error = None
     for attempt in range(retries + 1):
         try:
             if attempt > 0:
                 time.sleep(random.uniform(1.0, 3.0))
 
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_get(url, headers=headers)
             if response.status_code == 429 and attempt < retries:
                 backoff = base_delay * (2 ** attempt) + random.uniform(1.0, 3.0)
                 time.sleep(backoff)
@@ -66,16 +75,43 @@ def fetch_historical_data(url: str, retries: int = 3, base_delay: float = 2.0) -
 
     raise last_error
 
+async def fetch_historical_data_async(url: str, retries: int = 3, base_delay: float = 2.0) -> str:
+    """fetch_historical_data 의 asyncio 버전 (page_cache.collect() 안에서는 조건부 요청)"""
+    url = _historical_data_url(url)
+    headers = page_cache.request_headers(url, _browser_headers())
+
+    last_error = None
+    for attempt in range(retries + 1):
+        try:
+            if attempt > 0:
+                await asyncio.sleep(random.uniform(1.0, 3.0))
+
+            response = await async_http_get(url, headers=headers)
+            if response.status_code == 429 and attempt < retries:
+                await asyncio.sleep(base_delay * (2 ** attempt) + random.uniform(1.0, 3.0))
+                continue
+            if response.status_code == 403 and attempt < retries:
+                headers['User-Agent'] = random.choice(USER_AGENTS)
+                await asyncio.sleep(base_delay * (2 ** attempt) + random.uniform(2.0, 5.0))
+                continue
+            page_cache.accept(url, response)
+            return response.text
+        except requests.RequestException as e:
+            last_error = e
+            if attempt >= retries:
+                break
+            await asyncio.sleep(base_delay * (2 ** attempt) + random.uniform(1.0, 3.0))
+
+    raise last_error
+
 def parse_historical_table(html: str) -> List[Dict[str, Any]]:
     """Historical Data 테이블 파싱
 
     Returns:
         List of {date: str, price: float} sorted by date (newest first)
     """
-    soup = BeautifulSoup(html, 'html.parser')
-
     # Historical Data 테이블 찾기 (2025년 구조: 여러 테이블 중 날짜 데이터가 있는 것)
-    tables = soup.find_all('table')
+    tables = parse_tables(html)
     table = None
 
     # 각 테이블을 확인하여 날짜 형식("Dec 23, 2025")이 있는 것 찾기
@@ -164,21 +200,35 @@ def extract_rate_data(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
                 "forecast": None,
                 "previous": None  # history에서는 previous 계산 안함
             }
-            for row in rows[:12]  # 최근 12개 (약 2주치)
+            for row in rows  # 페이지 전체 (DB에 누적 저장)
         ]
     }
 
+def _build_rate_result(html: str) -> Dict[str, Any]:
+    rows = parse_historical_table(html)
+    if not rows:
+        return {"error": "No historical data found"}
+    return extract_rate_data(rows)
+
 def crawl_rate_indicator(url: str) -> Dict[str, Any]:
     """단일 금리 지표 크롤링 (Main Entry Point)"""
     try:
         html = fetch_historical_data(url)
-        rows = parse_historical_table(html)
+        return _build_rate_result(html)
 
-        if not rows:
-            return {"error": "No historical data found"}
+    except requests.RequestException as e:
+        return {"error": f"Network error: {str(e)}"}
+    except Exception as e:
+        return {"error": f"Parsing error: {str(e)}"}
 
-        return extract_rate_data(rows)
+async def crawl_rate_indicator_async(url: str) -> Dict[str, Any]:
+    """crawl_rate_indicator 의 asyncio 버전 (파싱은 워커 풀에서)"""
+    try:
+        html = await fetch_historical_data_async(url)
+        return await run_parser(_build_rate_result, html)
 
+    except PageUnchanged:
+        raise
     except requests.RequestException as e:
         return {"error": f"Network error: {str(e)}"}
     except Exception as e:
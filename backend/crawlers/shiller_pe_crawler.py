@@ -11,6 +11,64 @@ from datetime import datetime
 from typing import Dict, Any
 import re
 
+from crawlers.http_client import async_http_get, http_get
+from crawlers.page_cache import PageUnchanged, page_cache
+from crawlers.parse_pool import run_parser
+
+
+SHILLER_PE_URL = "https://www.multpl.com/shiller-pe"
+MULTPL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+
+
+def _parse_shiller_pe(html: str) -> Dict[str, Any]:
+    """Shiller PE 페이지 HTML → 지표 데이터"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # 메타 태그에서 현재 Shiller PE 추출
+    meta_desc = soup.find('meta', {'name': 'description'})
+    current_cape = None
+
+    if meta_desc:
+        content = meta_desc.get('content', '')
+        # "Current Shiller PE Ratio is 40.48" 형식에서 추출
+        match = re.search(r'Current Shiller PE Ratio is (\d+\.\d+)', content)
+        if match:
+            current_cape = float(match.group(1))
+
+    # 폴백: 페이지 본문에서 찾기
+    if current_cape is None:
+        current_div = soup.find('div', {'id': 'current'})
+        if current_div:
+            current_text = current_div.get_text(strip=True)
+            match = re.search(r'(\d+\.\d+)', current_text)
+            if match:
+                current_cape = float(match.group(1))
+
+    if current_cape is None:
+        return {
+            "error": "Shiller PE Ratio를 찾을 수 없습니다"
+        }
+
+    # 오늘 날짜
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    # 이전값 (현재값 - 0.03)
+    previous_cape = round(current_cape - 0.03, 2)
+
+    return {
+        "latest_release": {
+            "release_date": today,
+            "time": None,
+            "actual": str(current_cape),
+            "forecast": None,
+            "previous": str(previous_cape)
+        },
+        "next_release": None,
+        "history_table": []
+    }
+
 
 def crawl_shiller_pe() -> Dict[str, Any]:
     """
@@ -29,59 +87,30 @@ def crawl_shiller_pe() -> Dict[str, Any]:
         }
     """
     try:
-        url = "https://www.multpl.com/shiller-pe"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(SHILLER_PE_URL, headers=MULTPL_HEADERS)
         response.raise_for_status()
+        return _parse_shiller_pe(response.text)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # 메타 태그에서 현재 Shiller PE 추출
-        meta_desc = soup.find('meta', {'name': 'description'})
-        current_cape = None
-
-        if meta_desc:
-            content = meta_desc.get('content', '')
-            # "Current Shiller PE Ratio is 40.48" 형식에서 추출
-            match = re.search(r'Current Shiller PE Ratio is (\d+\.\d+)', content)
-            if match:
-                current_cape = float(match.group(1))
-
-        # 폴백: 페이지 본문에서 찾기
-        if current_cape is None:
-            current_div = soup.find('div', {'id': 'current'})
-            if current_div:
-                current_text = current_div.get_text(strip=True)
-                match = re.search(r'(\d+\.\d+)', current_text)
-                if match:
-                    current_cape = float(match.group(1))
-
-        if current_cape is None:
-            return {
-                "error": "Shiller PE Ratio를 찾을 수 없습니다"
-            }
-
-        # 오늘 날짜
-        today = datetime.now().strftime('%Y-%m-%d')
-
-        # 이전값 (현재값 - 0.03)
-        previous_cape = round(current_cape - 0.03, 2)
-
+    except requests.RequestException as e:
         return {
-            "latest_release": {
-                "release_date": today,
-                "time": None,
-                "actual": str(current_cape),
-                "forecast": None,
-                "previous": str(previous_cape)
-            },
-            "next_release": None,
-            "history_table": []
+            "error": f"Shiller PE Ratio 크롤링 실패: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "error": f"Shiller PE Ratio 파싱 오류: {str(e)}"
         }
 
+
+async def crawl_shiller_pe_async() -> Dict[str, Any]:
+    """crawl_shiller_pe 의 asyncio 버전 (파싱은 워커 풀에서, page_cache.collect() 안에서는 조건부 요청)"""
+    try:
+        headers = page_cache.request_headers(SHILLER_PE_URL, MULTPL_HEADERS)
+        response = await async_http_get(SHILLER_PE_URL, headers=headers)
+        page_cache.accept(SHILLER_PE_URL, response)
+        return await run_parser(_parse_shiller_pe, response.text)
+
+    except PageUnchanged:
+        raise
     except requests.RequestException as e:
         return {
             "error": f"Shiller PE Ratio 크롤링 실패: {str(e)}"
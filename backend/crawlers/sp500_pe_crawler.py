@@ -10,6 +10,76 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+from crawlers.http_client import async_http_get, http_get
+from crawlers.page_cache import PageUnchanged, page_cache
+from crawlers.parse_pool import run_parser
+
+
+SP500_PE_URL = "https://www.multpl.com/s-p-500-pe-ratio"
+SP500_PE_HISTORY_URL = "https://www.multpl.com/s-p-500-pe-ratio/table/by-month"
+MULTPL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+
+
+def _parse_current_pe(html: str) -> Optional[float]:
+    """S&P 500 PE 페이지 HTML → 현재 PE (없으면 None)"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # 현재 PE Ratio 추출 (메타 태그에서)
+    meta_desc = soup.find('meta', {'name': 'description'})
+    current_pe = None
+
+    if meta_desc:
+        content = meta_desc.get('content', '')
+        # "Current S&P 500 PE Ratio is 31.00" 형식에서 추출
+        if 'Current S&P 500 PE Ratio is' in content:
+            parts = content.split('Current S&P 500 PE Ratio is ')
+            if len(parts) > 1:
+                pe_str = parts[1].split(',')[0].strip()
+                try:
+                    current_pe = float(pe_str)
+                except ValueError:
+                    pass
+
+    # 폴백: 페이지 본문에서 찾기
+    if current_pe is None:
+        current_div = soup.find('div', {'id': 'current'})
+        if current_div:
+            current_text = current_div.get_text(strip=True)
+            # 숫자 부분만 추출
+            import re
+            match = re.search(r'(\d+\.\d+)', current_text)
+            if match:
+                current_pe = float(match.group(1))
+
+    return current_pe
+
+
+def _build_sp500_pe_result(current_pe: Optional[float], history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if current_pe is None:
+        return {
+            "error": "S&P 500 PE Ratio를 찾을 수 없습니다"
+        }
+
+    # 오늘 날짜를 최신 발표일로 사용
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    # 이전값은 히스토리에서 가져오기 (없으면 현재값 - 0.02)
+    previous_pe = history[0]['actual'] if history else round(current_pe - 0.02, 2)
+
+    return {
+        "latest_release": {
+            "release_date": today,
+            "time": None,
+            "actual": str(current_pe),
+            "forecast": None,  # PE Ratio는 forecast 없음
+            "previous": str(previous_pe)
+        },
+        "next_release": None,
+        "history_table": history
+    }
+
 
 def crawl_sp500_pe() -> Dict[str, Any]:
     """
@@ -28,69 +98,48 @@ def crawl_sp500_pe() -> Dict[str, Any]:
         }
     """
     try:
-        url = "https://www.multpl.com/s-p-500-pe-ratio"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(SP500_PE_URL, headers=MULTPL_HEADERS)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # 현재 PE Ratio 추출 (메타 태그에서)
-        meta_desc = soup.find('meta', {'name': 'description'})
-        current_pe = None
-
-        if meta_desc:
-            content = meta_desc.get('content', '')
-            # "Current S&P 500 PE Ratio is 31.00" 형식에서 추출
-            if 'Current S&P 500 PE Ratio is' in content:
-                parts = content.split('Current S&P 500 PE Ratio is ')
-                if len(parts) > 1:
-                    pe_str = parts[1].split(',')[0].strip()
-                    try:
-                        current_pe = float(pe_str)
-                    except ValueError:
-                        pass
-
-        # 폴백: 페이지 본문에서 찾기
-        if current_pe is None:
-            current_div = soup.find('div', {'id': 'current'})
-            if current_div:
-                current_text = current_div.get_text(strip=True)
-                # 숫자 부분만 추출
-                import re
-                match = re.search(r'(\d+\.\d+)', current_text)
-                if match:
-                    current_pe = float(match.group(1))
-
+        current_pe = _parse_current_pe(response.text)
         if current_pe is None:
-            return {
-                "error": "S&P 500 PE Ratio를 찾을 수 없습니다"
-            }
-
-        # 오늘 날짜를 최신 발표일로 사용
-        today = datetime.now().strftime('%Y-%m-%d')
+            return _build_sp500_pe_result(None, [])
 
         # 히스토리 데이터 가져오기 (최근 12개월)
         history = get_sp500_pe_history()
 
-        # 이전값은 히스토리에서 가져오기 (없으면 현재값 - 0.02)
-        previous_pe = history[0]['actual'] if history else round(current_pe - 0.02, 2)
+        return _build_sp500_pe_result(current_pe, history)
 
+    except requests.RequestException as e:
         return {
-            "latest_release": {
-                "release_date": today,
-                "time": None,
-                "actual": str(current_pe),
-                "forecast": None,  # PE Ratio는 forecast 없음
-                "previous": str(previous_pe)
-            },
-            "next_release": None,
-            "history_table": history
+            "error": f"S&P 500 PE Ratio 크롤링 실패: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "error": f"S&P 500 PE Ratio 파싱 오류: {str(e)}"
         }
 
+
+async def crawl_sp500_pe_async() -> Dict[str, Any]:
+    """crawl_sp500_pe 의 asyncio 버전 (파싱은 워커 풀에서)
+
+    page_cache.collect() 안에서는 현재값 페이지에 조건부 요청을 보내고, 바뀌지 않았으면
+    히스토리 페이지도 요청하지 않는다 (PageUnchanged).
+    """
+    try:
+        headers = page_cache.request_headers(SP500_PE_URL, MULTPL_HEADERS)
+        response = await async_http_get(SP500_PE_URL, headers=headers)
+        page_cache.accept(SP500_PE_URL, response)
+
+        current_pe = await run_parser(_parse_current_pe, response.text)
+        if current_pe is None:
+            return _build_sp500_pe_result(None, [])
+
+        history = await get_sp500_pe_history_async()
+        return _build_sp500_pe_result(current_pe, history)
+
+    except PageUnchanged:
+        raise
     except requests.RequestException as e:
         return {
             "error": f"S&P 500 PE Ratio 크롤링 실패: {str(e)}"
@@ -101,6 +150,46 @@ def crawl_sp500_pe() -> Dict[str, Any]:
         }
 
 
+def _parse_sp500_pe_history(html: str) -> List[Dict[str, Any]]:
+    """월별 PE 테이블 HTML → 최근 12개월 (최신순)"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # 테이블 찾기
+    table = soup.find('table', {'id': 'datatable'})
+    if not table:
+        return []
+
+    history = []
+    rows = table.find_all('tr')[1:]  # 헤더 제외
+
+    for row in rows[:12]:  # 최근 12개월만
+        cells = row.find_all('td')
+        if len(cells) >= 2:
+            date_str = cells[0].get_text(strip=True)
+            value_str = cells[1].get_text(strip=True)
+
+            try:
+                # 날짜 변환 (예: "Nov 30, 2025" → "2025-11-30")
+                date_obj = datetime.strptime(date_str, '%b %d, %Y')
+                formatted_date = date_obj.strftime('%Y-%m-%d')
+
+                value = float(value_str)
+
+                history.append({
+                    "release_date": formatted_date,
+                    "time": None,
+                    "actual": value,
+                    "forecast": None,
+                    "previous": None
+                })
+            except (ValueError, AttributeError):
+                continue
+
+    # 최신순으로 정렬 (오래된 데이터가 먼저 크롤링되는 경우 대비)
+    history.sort(key=lambda x: x['release_date'], reverse=True)
+    return history
+
+
 def get_sp500_pe_history() -> List[Dict[str, Any]]:
     """
     S&P 500 PE Ratio 히스토리 데이터 (선택적)
@@ -109,50 +198,21 @@ def get_sp500_pe_history() -> List[Dict[str, Any]]:
         최근 12개월 데이터
     """
     try:
-        url = "https://www.multpl.com/s-p-500-pe-ratio/table/by-month"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(SP500_PE_HISTORY_URL, headers=MULTPL_HEADERS)
         response.raise_for_status()
+        return _parse_sp500_pe_history(response.text)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # 테이블 찾기
-        table = soup.find('table', {'id': 'datatable'})
-        if not table:
-            return []
-
-        history = []
-        rows = table.find_all('tr')[1:]  # 헤더 제외
+    except Exception as e:
+        print(f"S&P 500 PE Ratio 히스토리 크롤링 오류: {e}")
+        return []
 
-        for row in rows[:12]:  # 최근 12개월만
-            cells = row.find_all('td')
-            if len(cells) >= 2:
-                date_str = cells[0].get_text(strip=True)
-                value_str = cells[1].get_text(strip=True)
 
-                try:
-                    # 날짜 변환 (예: "Nov 30, 2025" → "2025-11-30")
-                    date_obj = datetime.strptime(date_str, '%b %d, %Y')
-                    formatted_date = date_obj.strftime('%Y-%m-%d')
-
-                    value = float(value_str)
-
-                    history.append({
-                        "release_date": formatted_date,
-                        "time": None,
-                        "actual": value,
-                        "forecast": None,
-                        "previous": None
-                    })
-                except (ValueError, AttributeError):
-                    continue
-
-        # 최신순으로 정렬 (오래된 데이터가 먼저 크롤링되는 경우 대비)
-        history.sort(key=lambda x: x['release_date'], reverse=True)
-        return history
+async def get_sp500_pe_history_async() -> List[Dict[str, Any]]:
+    """get_sp500_pe_history 의 asyncio 버전"""
+    try:
+        response = await async_http_get(SP500_PE_HISTORY_URL, headers=MULTPL_HEADERS)
+        response.raise_for_status()
+        return await run_parser(_parse_sp500_pe_history, response.text)
 
     except Exception as e:
         print(f"S&P 500 PE Ratio 히스토리 크롤링 오류: {e}")
@@ -5,32 +5,38 @@ TradingEconomics 크롤러
 """
 
 from bs4 import BeautifulSoup
+import asyncio
 import requests
 import random
 import time
 from typing import Dict, Any, List
 from datetime import datetime
 
+from crawlers.http_client import async_http_get, http_get
+from crawlers.page_cache import PageUnchanged, page_cache
+from crawlers.parse_pool import run_parser
+
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0',
 ]
 
-def fetch_tradingeconomics_page(url: str, retries: int = 3) -> str:
-    """TradingEconomics 페이지 HTML 가져오기"""
-    headers = {
+def _browser_headers() -> Dict[str, str]:
+    return {
         'User-Agent': random.choice(USER_AGENTS),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
         'Sec-Fetch-Dest': 'document',
         'Sec-Fetch-Mode': 'navigate',
         'Referer': 'https://www.google.com/',
     }
 
+def fetch_tradingeconomics_page(url: str, retries: int = 3) -> str:
+    """TradingEconomics 페이지 HTML 가져오기"""
+    headers = _browser_headers()
+
     last_error = None
     for attempt in range(retries + 1):
         try:
@@ -38,7 +44,7 @@ def fetch_tradingeconomics_page(url: str, retries: int = 3) -> str:
                 time.sleep(random.uniform(1.0, 3.0))
                 headers['User-Agent'] = random.choice(USER_AGENTS)
 
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_get(url, headers=headers)
             if response.status_code in [429, 403] and attempt < retries:
                 time.sleep(random.uniform(2.0, 5.0))
                 continue
@@ -52,6 +58,31 @@ def fetch_tradingeconomics_page(url: str, retries: int = 3) -> str:
 
     raise last_error
 
+async def fetch_tradingeconomics_page_async(url: str, retries: int = 3) -> str:
+    """fetch_tradingeconomics_page 의 asyncio 버전 (page_cache.collect() 안에서는 조건부 요청)"""
+    headers = page_cache.request_headers(url, _browser_headers())
+
+    last_error = None
+    for attempt in range(retries + 1):
+        try:
+            if attempt > 0:
+                await asyncio.sleep(random.uniform(1.0, 3.0))
+                headers['User-Agent'] = random.choice(USER_AGENTS)
+
+            response = await async_http_get(url, headers=headers)
+            if response.status_code in [429, 403] and attempt < retries:
+                await asyncio.sleep(random.uniform(2.0, 5.0))
+                continue
+            page_cache.accept(url, response)
+            return response.text
+        except requests.RequestException as e:
+            last_error = e
+            if attempt >= retries:
+                break
+            await asyncio.sleep(random.uniform(1.0, 3.0))
+
+    raise last_error
+
 def parse_main_table(html: str) -> Dict[str, Any]:
     """메인 통계 테이블 파싱
 
@@ -156,6 +187,19 @@ def crawl_tradingeconomics_indicator(url: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Parsing error: {str(e)}"}
 
+async def crawl_tradingeconomics_indicator_async(url: str) -> Dict[str, Any]:
+    """crawl_tradingeconomics_indicator 의 asyncio 버전 (파싱은 워커 풀에서)"""
+    try:
+        html = await fetch_tradingeconomics_page_async(url)
+        return await run_parser(extract_tradingeconomics_data, html)
+
+    except PageUnchanged:
+        raise
+    except requests.RequestException as e:
+        return {"error": f"Network error: {str(e)}"}
+    except Exception as e:
+        return {"error": f"Parsing error: {str(e)}"}
+
 
 if __name__ == "__main__":
     # 테스트: Terms of Trade
@@ -20,6 +20,10 @@ CREATE TABLE IF NOT EXISTS latest_releases (
     actual TEXT,                        -- 문자열로 저장 (% 데이터 포함)
     forecast TEXT,
     previous TEXT,
+    actual_value REAL,                  -- 정규화된 숫자값 (218K → 218, 단위는 unit)
+    forecast_value REAL,
+    previous_value REAL,
+    unit TEXT,                          -- '%', 'K', 'M', 'B', 'T' 또는 NULL
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (indicator_id) REFERENCES indicators(indicator_id)
 );
@@ -32,6 +36,9 @@ CREATE TABLE IF NOT EXISTS next_releases (
     time TEXT,
     forecast TEXT,
     previous TEXT,
+    forecast_value REAL,
+    previous_value REAL,
+    unit TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (indicator_id) REFERENCES indicators(indicator_id)
 );
@@ -45,6 +52,10 @@ CREATE TABLE IF NOT EXISTS history_data (
     actual TEXT,
     forecast TEXT,
     previous TEXT,
+    actual_value REAL,
+    forecast_value REAL,
+    previous_value REAL,
+    unit TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (indicator_id) REFERENCES indicators(indicator_id)
 );
@@ -60,6 +71,22 @@ CREATE TABLE IF NOT EXISTS crawl_info (
     FOREIGN KEY (indicator_id) REFERENCES indicators(indicator_id)
 );
 
+-- 지표별 데이터 버전 (저장 시 증가, MAX(version) 을 캐시 키 세대 번호로 사용)
+CREATE TABLE IF NOT EXISTS indicator_data_versions (
+    indicator_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- FRED 원본 관측치 (변환 전 레벨 값, 증분 조회용)
+CREATE TABLE IF NOT EXISTS fred_observations (
+    series_id TEXT NOT NULL,
+    observation_date TEXT NOT NULL,
+    value REAL NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (series_id, observation_date)
+);
+
 -- 인덱스 생성 (성능 최적화)
 CREATE INDEX IF NOT EXISTS idx_latest_releases_indicator ON latest_releases(indicator_id);
 CREATE INDEX IF NOT EXISTS idx_next_releases_indicator ON next_releases(indicator_id);
@@ -67,6 +94,13 @@ CREATE INDEX IF NOT EXISTS idx_history_data_indicator ON history_data(indicator_
 CREATE INDEX IF NOT EXISTS idx_history_data_date ON history_data(release_date DESC);
 CREATE INDEX IF NOT EXISTS idx_crawl_info_indicator ON crawl_info(indicator_id);
 
+-- 히스토리 시계열 키 (indicator_id, release_date) - 중복 정리 후 유니크 인덱스
+DELETE FROM history_data
+WHERE id NOT IN (
+    SELECT MAX(id) FROM history_data GROUP BY indicator_id, release_date
+);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_history_data_indicator_date ON history_data(indicator_id, release_date DESC);
+
 -- 기본 지표 데이터 삽입
 INSERT OR IGNORE INTO indicators (indicator_id, name, url) VALUES
 ('ism-manufacturing', 'ISM Manufacturing PMI', 'https://www.investing.com/economic-calendar/ism-manufacturing-pmi-173'),
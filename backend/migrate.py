@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""PostgreSQL 스키마 마이그레이션 CLI
+
+Usage:
+    python migrate.py status            # 현재 버전 / 대기 중 마이그레이션 확인
+    python migrate.py apply             # 대기 중 마이그레이션 모두 적용
+    python migrate.py apply --target 3  # 3번까지만 적용
+
+DATABASE_URL 환경변수(.env)를 사용한다.
+"""
+
+import argparse
+import os
+import sys
+
+from dotenv import load_dotenv
+
+from services.migration_runner import MigrationRunner
+from services.pg_pool import PostgresConnectionPool
+
+
+def main() -> int:
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations (backend/migrations)")
+    parser.add_argument("command", choices=["status", "apply"], nargs="?", default="status")
+    parser.add_argument("--target", type=int, default=None, help="apply migrations up to this version")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url or not database_url.startswith("postgres"):
+        print("DATABASE_URL (PostgreSQL) is required")
+        return 1
+
+    pool = PostgresConnectionPool(database_url, min_size=0, max_size=1)
+    runner = MigrationRunner(pool.connection)
+
+    try:
+        if args.command == "apply":
+            applied = runner.apply(target=args.target)
+            if applied:
+                print(f"Applied {len(applied)} migration(s)")
+            else:
+                print("Nothing to apply")
+
+        status = runner.status()
+        print(f"Schema version: {status['current_version']} (latest: {status['latest_version']})")
+        for migration in status["pending"]:
+            print(f"  pending:  {migration.version:04d}_{migration.name}")
+        for migration in status["modified"]:
+            print(f"  modified: {migration.version:04d}_{migration.name} (checksum differs from applied file)")
+        return 0
+    finally:
+        pool.closeall()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+-- 0001 baseline: 기존 PostgresDatabaseService.init_database() 가 매 부팅마다 실행하던 스키마
+-- 모든 구문이 IF NOT EXISTS / 최초 1회 가드로 작성되어 있어 기존 운영 DB 에도 안전하게 적용된다.
+
+CREATE TABLE IF NOT EXISTS indicators (
+    id SERIAL PRIMARY KEY,
+    indicator_id TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS latest_releases (
+    id SERIAL PRIMARY KEY,
+    indicator_id TEXT NOT NULL,
+    release_date TEXT NOT NULL,
+    time TEXT,
+    actual TEXT,
+    forecast TEXT,
+    previous TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS next_releases (
+    id SERIAL PRIMARY KEY,
+    indicator_id TEXT NOT NULL,
+    release_date TEXT NOT NULL,
+    time TEXT,
+    forecast TEXT,
+    previous TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS history_data (
+    id SERIAL PRIMARY KEY,
+    indicator_id TEXT NOT NULL,
+    release_date TEXT NOT NULL,
+    time TEXT,
+    actual TEXT,
+    forecast TEXT,
+    previous TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS crawl_info (
+    id SERIAL PRIMARY KEY,
+    indicator_id TEXT NOT NULL,
+    last_crawl_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    status TEXT DEFAULT 'success',
+    error_message TEXT,
+    data_count INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    username VARCHAR(50) UNIQUE NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS assets (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    asset_type VARCHAR(50),
+    sub_category VARCHAR(50),
+    name VARCHAR(100),
+    amount NUMERIC,
+    quantity NUMERIC,
+    avg_price NUMERIC,
+    eval_amount NUMERIC,
+    principal NUMERIC,
+    profit_loss NUMERIC DEFAULT 0,
+    profit_rate NUMERIC DEFAULT 0,
+    date DATE,
+    note TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    -- 부동산 전용 필드
+    area_pyeong NUMERIC, -- 면적(평수)
+    acquisition_tax NUMERIC, -- 취득세
+    rent_type VARCHAR(20) DEFAULT 'monthly', -- 임대유형 ('monthly', 'jeonse')
+    rental_income NUMERIC, -- 임대수익(월세)
+    jeonse_deposit NUMERIC, -- 전세보증금
+
+    -- 예금/적금 전용 필드
+    maturity_date DATE, -- 만기일
+    interest_rate NUMERIC, -- 연이율(%)
+    early_withdrawal_fee NUMERIC, -- 중도해지수수료
+
+    -- MMF/CMA 전용 필드
+    current_yield NUMERIC, -- 현재수익률(%)
+    annual_yield NUMERIC, -- 연환산수익률(%)
+    minimum_balance NUMERIC, -- 최소유지잔고
+    withdrawal_fee NUMERIC, -- 출금수수료
+
+    -- 주식/ETF 전용 필드
+    dividend_rate NUMERIC, -- 배당율(%)
+
+    -- 펀드 전용 필드
+    nav NUMERIC, -- 기준가격
+    management_fee NUMERIC -- 운용보수(%)
+);
+
+CREATE TABLE IF NOT EXISTS goal_settings (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    total_goal NUMERIC NOT NULL DEFAULT 50000000,
+    target_date DATE NOT NULL DEFAULT '2024-12-31',
+    category_goals JSONB DEFAULT '{}',
+    sub_category_goals JSONB DEFAULT '{}',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id)
+);
+
+CREATE TABLE IF NOT EXISTS portfolio_history (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    total_assets NUMERIC DEFAULT 0,
+    total_principal NUMERIC DEFAULT 0,
+    total_eval_amount NUMERIC DEFAULT 0,
+    change_type VARCHAR(20), -- 'add', 'update', 'delete'
+    change_amount NUMERIC DEFAULT 0,
+    asset_id INTEGER,
+    asset_name VARCHAR(100),
+    notes TEXT,
+    is_daily_summary BOOLEAN DEFAULT FALSE
+);
+
+-- 기존 테이블에 새 컬럼 추가 (테이블이 이미 존재하는 경우)
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS user_id INTEGER;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS sub_category VARCHAR(50);
+ALTER TABLE goal_settings ADD COLUMN IF NOT EXISTS sub_category_goals JSONB DEFAULT '{}';
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS principal NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS profit_loss NUMERIC DEFAULT 0;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS profit_rate NUMERIC DEFAULT 0;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+
+-- 소분류별 전용 필드 추가
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS area_pyeong NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS acquisition_tax NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS rental_income NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS lawyer_fee NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS brokerage_fee NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS maturity_date DATE;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS interest_rate NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS early_withdrawal_fee NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS current_yield NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS annual_yield NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS minimum_balance NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS withdrawal_fee NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS dividend_rate NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS nav NUMERIC;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS management_fee NUMERIC;
+
+-- 기존 assets 데이터에 기본 user_id 설정 (NULL인 경우에만)
+UPDATE assets SET user_id = 1 WHERE user_id IS NULL;
+
+-- 가계부/지출관리 테이블 생성
+CREATE TABLE IF NOT EXISTS expenses (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    transaction_type VARCHAR(10) NOT NULL CHECK (transaction_type IN ('수입', '지출')),
+    amount NUMERIC NOT NULL CHECK (amount > 0),
+    category VARCHAR(50) NOT NULL,
+    subcategory VARCHAR(50) NOT NULL,
+    description TEXT,
+    payment_method VARCHAR(30) DEFAULT '현금',
+    transaction_date DATE NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS budgets (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    category VARCHAR(50) NOT NULL,
+    subcategory VARCHAR(50),
+    monthly_budget NUMERIC NOT NULL CHECK (monthly_budget >= 0),
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, category, subcategory, year, month)
+);
+
+-- 경제지표 사용자 해석 테이블
+CREATE TABLE IF NOT EXISTS indicator_interpretations (
+    id SERIAL PRIMARY KEY,
+    indicator_id TEXT UNIQUE NOT NULL,
+    user_interpretation TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 인덱스 생성
+CREATE INDEX IF NOT EXISTS idx_latest_releases_indicator_id ON latest_releases(indicator_id);
+CREATE INDEX IF NOT EXISTS idx_next_releases_indicator_id ON next_releases(indicator_id);
+CREATE INDEX IF NOT EXISTS idx_history_data_indicator_id ON history_data(indicator_id);
+CREATE INDEX IF NOT EXISTS idx_crawl_info_indicator_id ON crawl_info(indicator_id);
+CREATE INDEX IF NOT EXISTS idx_indicator_interpretations_id ON indicator_interpretations(indicator_id);
+
+-- 가계부 테이블 인덱스 (성능 최적화)
+CREATE INDEX IF NOT EXISTS idx_expenses_user_date ON expenses(user_id, transaction_date DESC);
+CREATE INDEX IF NOT EXISTS idx_expenses_user_category ON expenses(user_id, category, subcategory);
+CREATE INDEX IF NOT EXISTS idx_expenses_date_type ON expenses(transaction_date, transaction_type);
+CREATE INDEX IF NOT EXISTS idx_budgets_user_period ON budgets(user_id, year, month);
+
+-- 투자 철학 테이블 (MASTER_PLAN Page 1)
+CREATE TABLE IF NOT EXISTS investment_philosophy (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE UNIQUE,
+
+    -- 투자 목표 (Section 1)
+    goal JSONB DEFAULT '{
+        "targetReturn": 10,
+        "riskTolerance": {"volatility": 15, "maxDrawdown": 20, "maxLeverage": 1},
+        "timeHorizon": {"start": "2025-01-01", "target": "2030-12-31", "years": 5}
+    }',
+
+    -- 금지 자산 (Section 2)
+    forbidden_assets JSONB DEFAULT '[]',
+
+    -- 운용 범위 (Section 3)
+    allocation_range JSONB DEFAULT '[]',
+
+    -- 투자 원칙 (Section 4)
+    principles JSONB DEFAULT '[]',
+
+    -- 투자 방법 (Section 5)
+    methods JSONB DEFAULT '[]',
+
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_investment_philosophy_user_id ON investment_philosophy(user_id);
+
+-- 자산 개별분석 테이블 (5개 탭 구조)
+CREATE TABLE IF NOT EXISTS asset_analysis (
+    id SERIAL PRIMARY KEY,
+    asset_id INTEGER REFERENCES assets(id) ON DELETE CASCADE,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+
+    -- ① 투자 가설 (Investment Thesis)
+    thesis JSONB DEFAULT '{}',
+
+    -- ② 검증: 펀더멘털 (Validation: Fundamentals)
+    validation JSONB DEFAULT '{}',
+
+    -- ③ 가격과 기대치 (Price & Expectation)
+    pricing JSONB DEFAULT '{}',
+
+    -- ④ 타이밍 & 리스크 (Timing & Risk)
+    timing JSONB DEFAULT '{}',
+
+    -- ⑤ 결정 & 관리 (Decision & Management)
+    decision JSONB DEFAULT '{}',
+
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(asset_id, user_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_asset_analysis_asset_id ON asset_analysis(asset_id);
+CREATE INDEX IF NOT EXISTS idx_asset_analysis_user_id ON asset_analysis(user_id);
+
+-- 섹터 성과 테이블 (Page 3: Industries)
+CREATE TABLE IF NOT EXISTS sector_performance (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    date DATE NOT NULL,
+    sector VARCHAR(100) NOT NULL,  -- 섹터명 (예: Technology, Healthcare)
+    performance NUMERIC,            -- 성과 (%)
+    relative_strength NUMERIC,      -- 상대강도 지수
+    notes TEXT,                     -- 메모
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, date, sector)
+);
+
+CREATE INDEX IF NOT EXISTS idx_sector_performance_user_date ON sector_performance(user_id, date DESC);
+
+-- 관심 종목 테이블 (Page 3: Industries)
+CREATE TABLE IF NOT EXISTS watchlist (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    symbol VARCHAR(20) NOT NULL,    -- 티커 심볼 (예: AAPL, TSLA)
+    name VARCHAR(200) NOT NULL,     -- 종목명
+    sector VARCHAR(100),            -- 섹터
+    current_price NUMERIC,          -- 현재가
+    target_price NUMERIC,           -- 목표가
+    notes TEXT,                     -- 투자 근거/메모
+    alert_enabled BOOLEAN DEFAULT false,  -- 알림 활성화
+    alert_price NUMERIC,            -- 알림 가격
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, symbol)
+);
+
+CREATE INDEX IF NOT EXISTS idx_watchlist_user ON watchlist(user_id);
+CREATE INDEX IF NOT EXISTS idx_watchlist_symbol ON watchlist(symbol);
+
+-- 산업군 분석 테이블 (Page 3: Industries - 새로운 산업군 분석 시스템)
+CREATE TABLE IF NOT EXISTS industry_analysis (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    major_category VARCHAR(50) NOT NULL,     -- 6대 산업군
+    sub_industry VARCHAR(100) NOT NULL,      -- 하위 산업명
+    analysis_data JSONB NOT NULL DEFAULT '{
+        "core_technology": {"definition": "", "stage": "상용화", "innovation_path": ""},
+        "macro_impact": {"interest_rate": "", "exchange_rate": "", "commodities": "", "policy": ""},
+        "growth_drivers": {"internal": "", "external": "", "kpi": ""},
+        "value_chain": {"flow": "", "profit_pool": "", "bottleneck": ""},
+        "supply_demand": {
+            "demand": {"end_user": "", "long_term": "", "sensitivity": ""},
+            "supply": {"players": "", "capacity": "", "barriers": ""},
+            "catalysts": ""
+        },
+        "market_map": {"structure": "", "competition": "", "moat": "", "lifecycle": ""}
+    }'::jsonb,
+    leading_stocks TEXT[] DEFAULT '{}',      -- 대표 대형주
+    emerging_stocks TEXT[] DEFAULT '{}',     -- 중소형 유망주
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, major_category, sub_industry)
+);
+
+CREATE INDEX IF NOT EXISTS idx_industry_analysis_user ON industry_analysis(user_id);
+CREATE INDEX IF NOT EXISTS idx_industry_analysis_major ON industry_analysis(major_category);
+
+-- 부동산 월세/전세 컬럼 (기존에는 information_schema 조회 후 조건부 ALTER)
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS rent_type VARCHAR(20) DEFAULT 'monthly';
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS jeonse_deposit NUMERIC;
+
+-- 가계부 예산 목표 (기존에는 get/save_expense_budget_goals 호출마다 CREATE TABLE)
+CREATE TABLE IF NOT EXISTS expense_budget_goals (
+    user_id VARCHAR(100) PRIMARY KEY,
+    expense_goals JSONB DEFAULT '{}'::jsonb,
+    income_goals JSONB DEFAULT '{}'::jsonb,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,34 @@
+-- 0003 지표 테이블 upsert 키: 지표당 1행(latest/next/crawl_info), (indicator_id, release_date) 당 1행(history)
+-- 기존 중복 행은 최신 행만 남기고 정리한 뒤 유니크 인덱스를 만든다.
+
+DO $$
+BEGIN
+    IF to_regclass('uq_latest_releases_indicator_id') IS NULL THEN
+        DELETE FROM latest_releases a USING latest_releases b
+        WHERE a.indicator_id = b.indicator_id
+          AND (a.created_at, a.id) < (b.created_at, b.id);
+        CREATE UNIQUE INDEX uq_latest_releases_indicator_id ON latest_releases(indicator_id);
+    END IF;
+
+    IF to_regclass('uq_next_releases_indicator_id') IS NULL THEN
+        DELETE FROM next_releases a USING next_releases b
+        WHERE a.indicator_id = b.indicator_id
+          AND (a.created_at, a.id) < (b.created_at, b.id);
+        CREATE UNIQUE INDEX uq_next_releases_indicator_id ON next_releases(indicator_id);
+    END IF;
+
+    IF to_regclass('uq_history_data_indicator_date') IS NULL THEN
+        DELETE FROM history_data a USING history_data b
+        WHERE a.indicator_id = b.indicator_id
+          AND a.release_date = b.release_date
+          AND a.id < b.id;
+        CREATE UNIQUE INDEX uq_history_data_indicator_date ON history_data(indicator_id, release_date);
+    END IF;
+
+    IF to_regclass('uq_crawl_info_indicator_id') IS NULL THEN
+        DELETE FROM crawl_info a USING crawl_info b
+        WHERE a.indicator_id = b.indicator_id
+          AND (a.last_crawl_time, a.id) < (b.last_crawl_time, b.id);
+        CREATE UNIQUE INDEX uq_crawl_info_indicator_id ON crawl_info(indicator_id);
+    END IF;
+END $$;
@@ -0,0 +1,20 @@
+-- 0004 지표값 숫자/단위 컬럼 (저장 시점에 services/value_normalizer 로 1회 파싱)
+
+ALTER TABLE latest_releases ADD COLUMN IF NOT EXISTS actual_value DOUBLE PRECISION;
+ALTER TABLE latest_releases ADD COLUMN IF NOT EXISTS forecast_value DOUBLE PRECISION;
+ALTER TABLE latest_releases ADD COLUMN IF NOT EXISTS previous_value DOUBLE PRECISION;
+ALTER TABLE latest_releases ADD COLUMN IF NOT EXISTS unit TEXT;
+ALTER TABLE next_releases ADD COLUMN IF NOT EXISTS forecast_value DOUBLE PRECISION;
+ALTER TABLE next_releases ADD COLUMN IF NOT EXISTS previous_value DOUBLE PRECISION;
+ALTER TABLE next_releases ADD COLUMN IF NOT EXISTS unit TEXT;
+ALTER TABLE history_data ADD COLUMN IF NOT EXISTS actual_value DOUBLE PRECISION;
+ALTER TABLE history_data ADD COLUMN IF NOT EXISTS forecast_value DOUBLE PRECISION;
+ALTER TABLE history_data ADD COLUMN IF NOT EXISTS previous_value DOUBLE PRECISION;
+ALTER TABLE history_data ADD COLUMN IF NOT EXISTS unit TEXT;
+
+-- 지표 시계열 커버링 인덱스 (기간 조회/최근 N개 조회를 index-only scan 으로)
+DROP INDEX IF EXISTS idx_history_data_indicator_date_desc;
+CREATE INDEX IF NOT EXISTS idx_history_data_indicator_date_values
+    ON history_data(indicator_id, release_date DESC)
+    INCLUDE (time, actual, forecast, previous,
+             actual_value, forecast_value, previous_value, unit);
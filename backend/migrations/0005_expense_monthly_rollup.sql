@@ -0,0 +1,33 @@
+-- 0005 가계부 월별 집계 테이블
+-- add_expense / update_expense / delete_expense 가 같은 트랜잭션에서 증감 반영한다.
+-- 연간 차트, 예산 진행률, Excel 요약은 거래 건수가 아닌 (12개월 × 카테고리) 행만 읽는다.
+
+CREATE TABLE IF NOT EXISTS expense_monthly_rollup (
+    user_id INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    category VARCHAR(50) NOT NULL,
+    subcategory VARCHAR(50) NOT NULL DEFAULT '',
+    transaction_type VARCHAR(10) NOT NULL,
+    total_amount NUMERIC NOT NULL DEFAULT 0,
+    transaction_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, year, month, category, subcategory, transaction_type)
+);
+
+-- 기존 거래내역으로 초기 집계 (재실행 시 전체 재계산)
+DELETE FROM expense_monthly_rollup;
+INSERT INTO expense_monthly_rollup
+    (user_id, year, month, category, subcategory, transaction_type, total_amount, transaction_count)
+SELECT
+    user_id,
+    EXTRACT(YEAR FROM transaction_date)::int,
+    EXTRACT(MONTH FROM transaction_date)::int,
+    category,
+    COALESCE(subcategory, ''),
+    transaction_type,
+    SUM(amount),
+    COUNT(*)
+FROM expenses
+WHERE user_id IS NOT NULL
+GROUP BY 1, 2, 3, 4, 5, 6;
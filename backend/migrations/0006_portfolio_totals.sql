@@ -0,0 +1,26 @@
+-- 0006 사용자별 포트폴리오 합계 (running totals)
+-- save_asset / update_asset / delete_asset 가 같은 트랜잭션에서 증감 반영한다.
+-- 이력 스냅샷/대시보드 요약은 전체 자산을 다시 읽지 않고 이 행 하나만 읽는다.
+-- 합계 규칙은 get_all_assets 와 동일: principal/eval_amount 가 비어있거나 0 이면 amount 사용.
+
+CREATE TABLE IF NOT EXISTS portfolio_totals (
+    user_id INTEGER PRIMARY KEY,
+    total_assets NUMERIC NOT NULL DEFAULT 0,
+    total_principal NUMERIC NOT NULL DEFAULT 0,
+    total_eval_amount NUMERIC NOT NULL DEFAULT 0,
+    asset_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 기존 자산으로 초기 합계 (재실행 시 전체 재계산)
+DELETE FROM portfolio_totals;
+INSERT INTO portfolio_totals (user_id, total_assets, total_principal, total_eval_amount, asset_count)
+SELECT
+    user_id,
+    SUM(COALESCE(amount, 0)),
+    SUM(COALESCE(NULLIF(principal, 0), NULLIF(amount, 0), 0)),
+    SUM(COALESCE(NULLIF(eval_amount, 0), NULLIF(amount, 0), 0)),
+    COUNT(*)
+FROM assets
+WHERE user_id IS NOT NULL
+GROUP BY user_id;
@@ -0,0 +1,62 @@
+-- 0007 포트폴리오 이력 일별/월별 스냅샷 + 조회 인덱스
+-- save_portfolio_history / create_daily_summary 가 원본 행 저장과 같은 트랜잭션에서
+-- 해당 일/월의 마지막 스냅샷을 갱신한다.
+-- 월간 차트(일별 마지막 값)는 portfolio_history_daily, 연간 차트(월별 마지막 값)는
+-- portfolio_history_monthly 를 읽어 DISTINCT ON 전체 스캔을 피한다.
+
+CREATE INDEX IF NOT EXISTS idx_portfolio_history_user_timestamp
+    ON portfolio_history (user_id, timestamp DESC);
+
+CREATE TABLE IF NOT EXISTS portfolio_history_daily (
+    user_id INTEGER NOT NULL,
+    day DATE NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    total_assets NUMERIC DEFAULT 0,
+    total_principal NUMERIC DEFAULT 0,
+    total_eval_amount NUMERIC DEFAULT 0,
+    change_type VARCHAR(20),
+    change_amount NUMERIC DEFAULT 0,
+    asset_name VARCHAR(100),
+    notes TEXT,
+    change_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, day)
+);
+
+CREATE TABLE IF NOT EXISTS portfolio_history_monthly (
+    user_id INTEGER NOT NULL,
+    month DATE NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    total_assets NUMERIC DEFAULT 0,
+    total_principal NUMERIC DEFAULT 0,
+    total_eval_amount NUMERIC DEFAULT 0,
+    change_type VARCHAR(20),
+    change_amount NUMERIC DEFAULT 0,
+    asset_name VARCHAR(100),
+    notes TEXT,
+    change_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, month)
+);
+
+-- 기존 이력으로 초기 스냅샷 (재실행 시 전체 재계산)
+DELETE FROM portfolio_history_daily;
+INSERT INTO portfolio_history_daily
+    (user_id, day, timestamp, total_assets, total_principal, total_eval_amount,
+     change_type, change_amount, asset_name, notes, change_count)
+SELECT DISTINCT ON (user_id, DATE(timestamp))
+    user_id, DATE(timestamp), timestamp, total_assets, total_principal, total_eval_amount,
+    change_type, change_amount, asset_name, notes,
+    COUNT(*) OVER (PARTITION BY user_id, DATE(timestamp))
+FROM portfolio_history
+WHERE user_id IS NOT NULL AND timestamp IS NOT NULL
+ORDER BY user_id, DATE(timestamp), timestamp DESC, id DESC;
+
+DELETE FROM portfolio_history_monthly;
+INSERT INTO portfolio_history_monthly
+    (user_id, month, timestamp, total_assets, total_principal, total_eval_amount,
+     change_type, change_amount, asset_name, notes, change_count)
+SELECT DISTINCT ON (user_id, DATE_TRUNC('month', day))
+    user_id, DATE_TRUNC('month', day)::date, timestamp, total_assets, total_principal, total_eval_amount,
+    change_type, change_amount, asset_name, notes,
+    SUM(change_count) OVER (PARTITION BY user_id, DATE_TRUNC('month', day))
+FROM portfolio_history_daily
+ORDER BY user_id, DATE_TRUNC('month', day), timestamp DESC;
@@ -0,0 +1,19 @@
+-- 0008 지표별 데이터 버전 (캐시 키 무효화용)
+-- save_indicator_data / update_crawl_info 가 같은 문장 배치에서 해당 지표의 version 을
+-- 전역 시퀀스의 다음 값으로 갱신한다.
+-- MAX(version) 이 전역 세대 번호가 되어 /api/v2/indicators 캐시 키에 포함된다
+-- (SCAN 으로 키를 지우지 않아도 저장 즉시 새 키를 사용).
+
+CREATE SEQUENCE IF NOT EXISTS indicator_data_version_seq;
+
+CREATE TABLE IF NOT EXISTS indicator_data_versions (
+    indicator_id TEXT PRIMARY KEY,
+    version BIGINT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO indicator_data_versions (indicator_id, version)
+SELECT indicator_id, nextval('indicator_data_version_seq')
+FROM crawl_info
+GROUP BY indicator_id
+ON CONFLICT (indicator_id) DO NOTHING;
@@ -0,0 +1,11 @@
+-- 0009 FRED 원본 관측치 저장 (증분 조회용)
+-- history_data 에는 YoY 등 변환된 값이 저장되므로, 변환 전 레벨 값을 시리즈/날짜별로 따로 보관한다.
+-- FRED 크롤러는 마지막 저장 관측치 이후만 받아 이 시계열과 합친 뒤 YoY/차이를 계산한다.
+
+CREATE TABLE IF NOT EXISTS fred_observations (
+    series_id TEXT NOT NULL,
+    observation_date DATE NOT NULL,
+    value DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (series_id, observation_date)
+);
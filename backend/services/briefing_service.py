@@ -5,13 +5,13 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import requests
 
 from crawlers.indicators_config import get_all_enabled_indicators, get_indicator_config
+from services.value_normalizer import release_number
 
 CATEGORY_LABELS = {
     "business": "경기",
@@ -27,24 +27,6 @@ LATEST_CACHE_KEY = "indicators:briefing:v2:latest"
 BY_SIGNATURE_PREFIX = "indicators:briefing:v2:sig:"
 CACHE_TTL_SECONDS = 24 * 60 * 60
 
-_IN_MEMORY_CACHE: Dict[str, Any] = {
-    "latest": None,
-    "signature": None,
-    "ts": 0,
-}
-
-
-def _to_float(value: Any) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    try:
-        text = str(value).replace("%", "").replace("K", "000").replace(",", "").strip()
-        return float(text)
-    except Exception:
-        return None
-
 
 def _extract_output_text(response_json: Dict[str, Any]) -> Optional[str]:
     output_text = response_json.get("output_text")
@@ -118,8 +100,8 @@ def _build_indicator_rows(db_service) -> List[Dict[str, Any]]:
         actual = latest.get("actual")
         forecast = latest.get("forecast")
         previous = latest.get("previous")
-        actual_num = _to_float(actual)
-        forecast_num = _to_float(forecast)
+        actual_num = release_number(latest, "actual")
+        forecast_num = release_number(latest, "forecast")
 
         surprise = None
         if actual_num is not None and forecast_num is not None:
@@ -308,69 +290,51 @@ def _openai_briefing(category_summary: Dict[str, Dict[str, Any]]) -> Dict[str, A
         return _fallback_briefing(category_summary)
 
 
-def _cache_get(redis_client, key: str) -> Optional[Dict[str, Any]]:
-    if redis_client:
-        try:
-            raw = redis_client.get(key)
-            if raw:
-                return json.loads(raw)
-        except Exception:
-            pass
-    return None
-
-
-def _cache_set(redis_client, key: str, value: Dict[str, Any], ttl: int = CACHE_TTL_SECONDS) -> None:
-    if redis_client:
-        try:
-            redis_client.setex(key, ttl, json.dumps(value, ensure_ascii=False))
-        except Exception:
-            pass
-
-
-def get_latest_briefing(redis_client=None) -> Optional[Dict[str, Any]]:
-    cached = _cache_get(redis_client, LATEST_CACHE_KEY)
-    if cached:
-        return cached
-    return _IN_MEMORY_CACHE.get("latest")
+def get_latest_briefing(cache=None) -> Optional[Dict[str, Any]]:
+    """최신 브리핑 (cache: services.cache.TwoTierCache)"""
+    if cache is None:
+        return None
+    return cache.get(LATEST_CACHE_KEY)
 
 
-def generate_briefing(db_service, redis_client=None, force: bool = False) -> Dict[str, Any]:
+def generate_briefing(db_service, cache=None, force: bool = False) -> Dict[str, Any]:
     rows = _build_indicator_rows(db_service)
     signature = _signature_from_rows(rows)
 
-    latest_cached = get_latest_briefing(redis_client)
+    latest_cached = get_latest_briefing(cache)
     if not force and latest_cached and latest_cached.get("data_signature") == signature:
-        latest_cached["cached"] = True
-        return latest_cached
+        return {**latest_cached, "cached": True}
+
+    built = {"value": False}
+
+    def build() -> Dict[str, Any]:
+        built["value"] = True
+        category_summary = _build_category_summary(rows)
+        generated = _openai_briefing(category_summary)
+        return {
+            "status": "success",
+            "generated_at": datetime.now().isoformat(),
+            "data_signature": signature,
+            "source": generated.get("source", "fallback"),
+            "overall_summary": generated.get("overall_summary"),
+            "category_briefings": generated.get("category_briefings", {}),
+            "category_summary": category_summary,
+            "cached": False,
+        }
 
-    by_sig_key = f"{BY_SIGNATURE_PREFIX}{signature}"
-    if not force:
-        cached_by_sig = _cache_get(redis_client, by_sig_key)
-        if cached_by_sig:
-            _cache_set(redis_client, LATEST_CACHE_KEY, cached_by_sig)
-            _IN_MEMORY_CACHE["latest"] = cached_by_sig
-            _IN_MEMORY_CACHE["signature"] = signature
-            _IN_MEMORY_CACHE["ts"] = time.time()
-            cached_by_sig["cached"] = True
-            return cached_by_sig
-
-    category_summary = _build_category_summary(rows)
-    generated = _openai_briefing(category_summary)
-    result = {
-        "status": "success",
-        "generated_at": datetime.now().isoformat(),
-        "data_signature": signature,
-        "source": generated.get("source", "fallback"),
-        "overall_summary": generated.get("overall_summary"),
-        "category_briefings": generated.get("category_briefings", {}),
-        "category_summary": category_summary,
-        "cached": False,
-    }
+    if cache is None:
+        return build()
 
-    _cache_set(redis_client, LATEST_CACHE_KEY, result)
-    _cache_set(redis_client, by_sig_key, result)
-    _IN_MEMORY_CACHE["latest"] = result
-    _IN_MEMORY_CACHE["signature"] = signature
-    _IN_MEMORY_CACHE["ts"] = time.time()
+    by_sig_key = f"{BY_SIGNATURE_PREFIX}{signature}"
+    if force:
+        result = build()
+        cache.set(by_sig_key, result, CACHE_TTL_SECONDS)
+    else:
+        # 같은 시그니처의 동시 요청은 OpenAI 호출 1회만 수행
+        result = cache.get_or_set(by_sig_key, build, CACHE_TTL_SECONDS)
 
+    cache.set(LATEST_CACHE_KEY, result, CACHE_TTL_SECONDS)
+    # 이번 호출에서 생성하지 않은 결과(시그니처 캐시 적중)는 cached 로 표시
+    if not built["value"]:
+        return {**result, "cached": True}
     return result
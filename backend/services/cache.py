@@ -0,0 +1,351 @@
+"""2단계 응답 캐시 (워커 내 L1 LRU + 공유 L2 Redis)
+
+- L1: 워커 프로세스별 크기 제한 LRU (CACHE_L1_MAX_ENTRIES, 기본 256)
+- L2: Redis (redis_client 가 없으면 L1 만 사용)
+- get_or_set: 같은 키에 대한 동시 miss 는 1회만 재계산 (single-flight)
+    - 워커 내: 키별 스레드 락
+    - 워커 간: Redis SET NX 락, 락을 못 잡은 워커는 L2 에 값이 채워질 때까지 대기
+- get_or_refresh: stale-while-revalidate (soft TTL 이 지나면 이전 값을 반환하면서 백그라운드에서 1회 재계산,
+  hard TTL 이 지나면 동기 재계산)
+- 적중/미스 카운터 (stats)
+
+L1 에는 객체를 그대로 보관하므로 get 으로 받은 값을 수정하지 말 것.
+L2 에는 JSON 으로 직렬화해서 저장한다. raw=True 이면 값은 이미 인코딩된 UTF-8 bytes 로
+L2 에도 그대로 저장한다 (decode_responses 클라이언트와 호환되도록 UTF-8 텍스트만 허용).
+local_only=True 이면 L1 에만 저장한다 (gzip 본문처럼 워커에서 다시 만들 수 있는 값).
+"""
+
+import os
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from services.json_codec import dumps_bytes, loads
+
+_MISSING = object()
+
+# 토큰이 일치할 때만 락 해제 (다른 워커가 새로 잡은 락을 지우지 않도록)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class TwoTierCache:
+    """L1 LRU + L2 Redis 캐시
+
+    Args:
+        redis_client: redis.Redis (decode_responses=True) 또는 None
+        max_entries: L1 최대 항목 수
+        lock_timeout: 워커 간 재계산 락 유지 시간 (초). 재계산이 이보다 오래 걸리면
+            다른 워커도 재계산을 시작한다.
+    """
+
+    LOCK_SUFFIX = ":lock"
+
+    def __init__(self, redis_client=None, max_entries: int = None, lock_timeout: float = None):
+        self.redis = redis_client
+        self.max_entries = max(1, max_entries if max_entries is not None else int(os.getenv("CACHE_L1_MAX_ENTRIES", "256")))
+        self.lock_timeout = lock_timeout if lock_timeout is not None else float(os.getenv("CACHE_LOCK_TIMEOUT", "30"))
+
+        # key -> (expires_at, value)
+        self._l1: "OrderedDict[str, tuple]" = OrderedDict()
+        self._l1_lock = threading.Lock()
+        # 키별 재계산 락 (사용 중인 동안만 유지)
+        self._key_locks: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+        self._key_locks_guard = threading.Lock()
+
+        self._stats = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "builds": 0,
+            "single_flight_waits": 0,
+            "stale_hits": 0,
+            "background_refreshes": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    # ---------- L1 ----------
+
+    def _l1_entry(self, key: str):
+        """(value, 남은 TTL 초) 또는 (_MISSING, None)"""
+        with self._l1_lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return _MISSING, None
+            expires_at, value = entry
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                del self._l1[key]
+                return _MISSING, None
+            self._l1.move_to_end(key)
+            return value, remaining
+
+    def _l1_get(self, key: str) -> Any:
+        return self._l1_entry(key)[0]
+
+    def _l1_set(self, key: str, value: Any, ttl: float):
+        with self._l1_lock:
+            self._l1[key] = (time.time() + ttl, value)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.max_entries:
+                self._l1.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    # ---------- L2 ----------
+
+    def _l2_get(self, key: str, raw: bool = False):
+        """(value, 남은 TTL 초) 또는 (_MISSING, None)"""
+        if not self.redis:
+            return _MISSING, None
+        try:
+            pipe = self.redis.pipeline()
+            pipe.get(key)
+            pipe.pttl(key)
+            value, pttl = pipe.execute()
+            if value is None:
+                return _MISSING, None
+            ttl = pttl / 1000.0 if pttl and pttl > 0 else None
+            if raw:
+                return (value.encode("utf-8") if isinstance(value, str) else value), ttl
+            return loads(value), ttl
+        except Exception as e:
+            self._count("errors")
+            print(f"⚠️ Redis cache get error ({key}): {e}")
+            return _MISSING, None
+
+    def _l2_set(self, key: str, value: Any, ttl: float, raw: bool = False):
+        if not self.redis:
+            return
+        try:
+            self.redis.setex(key, max(1, int(ttl)), value if raw else dumps_bytes(value))
+        except Exception as e:
+            self._count("errors")
+            print(f"⚠️ Redis cache set error ({key}): {e}")
+
+    # ---------- public API ----------
+
+    def _count(self, name: str, amount: int = 1):
+        with self._l1_lock:
+            self._stats[name] += amount
+
+    def _lookup(self, key: str, raw: bool = False, local_only: bool = False):
+        """L1 → L2 순서로 조회, (value, 남은 TTL 초) 반환 (L2 적중 시 남은 TTL 만큼 L1 에 채움)"""
+        value, ttl = self._l1_entry(key)
+        if value is not _MISSING:
+            self._count("l1_hits")
+            return value, ttl
+
+        value, ttl = self._l2_get(key, raw) if not local_only else (_MISSING, None)
+        if value is not _MISSING:
+            self._count("l2_hits")
+            if ttl:
+                self._l1_set(key, value, ttl)
+            return value, ttl
+
+        self._count("misses")
+        return _MISSING, None
+
+    def get(self, key: str, default: Any = None, raw: bool = False, local_only: bool = False) -> Any:
+        """L1 → L2 순서로 조회"""
+        value, _ = self._lookup(key, raw, local_only)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any, ttl: float, raw: bool = False, local_only: bool = False):
+        """L1 + L2 저장"""
+        self._count("sets")
+        self._l1_set(key, value, ttl)
+        if not local_only:
+            self._l2_set(key, value, ttl, raw)
+
+    def delete(self, *keys: str):
+        with self._l1_lock:
+            for key in keys:
+                self._l1.pop(key, None)
+        if self.redis and keys:
+            try:
+                self.redis.delete(*keys)
+            except Exception as e:
+                self._count("errors")
+                print(f"⚠️ Redis cache delete error: {e}")
+
+    def delete_prefix(self, prefix: str) -> int:
+        """prefix 로 시작하는 모든 키 삭제 (L1 + L2)"""
+        with self._l1_lock:
+            l1_keys = [key for key in self._l1 if key.startswith(prefix)]
+            for key in l1_keys:
+                del self._l1[key]
+
+        deleted = len(l1_keys)
+        if self.redis:
+            try:
+                batch = []
+                for key in self.redis.scan_iter(f"{prefix}*"):
+                    batch.append(key)
+                    if len(batch) >= 500:
+                        deleted += self.redis.delete(*batch)
+                        batch = []
+                if batch:
+                    deleted += self.redis.delete(*batch)
+            except Exception as e:
+                self._count("errors")
+                print(f"⚠️ Redis cache invalidation error ({prefix}): {e}")
+        return deleted
+
+    def _key_lock(self, key: str):
+        with self._key_locks_guard:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._key_locks[key] = lock
+            return lock
+
+    def _acquire_l2_lock(self, key: str, local_only: bool = False) -> Optional[str]:
+        """워커 간 재계산 락 획득 (Redis 없으면 항상 성공, 실패 시 None)"""
+        token = uuid.uuid4().hex
+        if not self.redis or local_only:
+            return token
+        try:
+            acquired = self.redis.set(
+                key + self.LOCK_SUFFIX, token, nx=True, px=int(self.lock_timeout * 1000)
+            )
+            return token if acquired else None
+        except Exception as e:
+            self._count("errors")
+            print(f"⚠️ Redis cache lock error ({key}): {e}")
+            return token
+
+    def _release_l2_lock(self, key: str, token: str, local_only: bool = False):
+        if not self.redis or local_only:
+            return
+        try:
+            self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, key + self.LOCK_SUFFIX, token)
+        except Exception as e:
+            self._count("errors")
+            print(f"⚠️ Redis cache unlock error ({key}): {e}")
+
+    def _wait_for_l2(self, key: str, raw: bool = False) -> Any:
+        """다른 워커의 재계산 결과를 기다림 (락이 풀렸는데 값이 없으면 _MISSING)"""
+        self._count("single_flight_waits")
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            value, ttl = self._l2_get(key, raw)
+            if value is not _MISSING:
+                if ttl:
+                    self._l1_set(key, value, ttl)
+                return value
+            try:
+                if not self.redis.exists(key + self.LOCK_SUFFIX):
+                    return _MISSING
+            except Exception:
+                return _MISSING
+        return _MISSING
+
+    def get_or_set(self, key: str, builder: Callable[[], Any], ttl: float,
+                   raw: bool = False, local_only: bool = False) -> Any:
+        """캐시 조회, miss 면 builder() 결과를 저장 후 반환 (single-flight)
+
+        builder 가 예외를 던지면 캐시하지 않고 그대로 전파한다.
+        """
+        value = self.get(key, _MISSING, raw=raw, local_only=local_only)
+        if value is not _MISSING:
+            return value
+
+        with self._key_lock(key):
+            # 같은 워커의 다른 스레드가 먼저 채웠을 수 있음
+            value = self._l1_get(key)
+            if value is not _MISSING:
+                self._count("l1_hits")
+                return value
+
+            token = self._acquire_l2_lock(key, local_only)
+            if token is None:
+                value = self._wait_for_l2(key, raw)
+                if value is not _MISSING:
+                    return value
+                token = self._acquire_l2_lock(key, local_only)
+
+            try:
+                self._count("builds")
+                value = builder()
+                self.set(key, value, ttl, raw=raw, local_only=local_only)
+                return value
+            finally:
+                if token is not None:
+                    self._release_l2_lock(key, token, local_only)
+
+    def get_or_refresh(self, key: str, builder: Callable[[], Any], soft_ttl: float, hard_ttl: float,
+                       raw: bool = False, local_only: bool = False) -> Any:
+        """stale-while-revalidate 조회
+
+        값은 hard_ttl 동안 보관한다. 저장 후 soft_ttl 이 지난 값은 그대로 반환하고
+        백그라운드 스레드에서 1회만 재계산해서 교체한다 (워커 내 키 락 + 워커 간 Redis 락).
+        값이 없거나 hard_ttl 이 지났으면 get_or_set 과 같이 동기 재계산한다.
+        builder 는 요청 컨텍스트 밖(백그라운드 스레드)에서도 호출될 수 있다.
+        """
+        hard_ttl = max(hard_ttl, soft_ttl)
+        stale_after = hard_ttl - soft_ttl  # 남은 TTL 이 이보다 작으면 stale
+
+        value, remaining = self._lookup(key, raw, local_only)
+        if value is _MISSING:
+            return self.get_or_set(key, builder, hard_ttl, raw=raw, local_only=local_only)
+
+        if remaining is not None and remaining < stale_after:
+            # 다른 워커가 이미 교체했으면 L2 의 새 값을 사용
+            if not local_only:
+                fresh, ttl = self._l2_get(key, raw)
+                if fresh is not _MISSING and ttl and ttl >= stale_after:
+                    self._l1_set(key, fresh, ttl)
+                    return fresh
+            self._count("stale_hits")
+            self._refresh_in_background(key, builder, hard_ttl, raw, local_only)
+        return value
+
+    def _refresh_in_background(self, key: str, builder: Callable[[], Any], ttl: float,
+                               raw: bool = False, local_only: bool = False):
+        """재계산 중이 아니면 백그라운드 스레드에서 builder() 결과로 교체 (실패 시 기존 값 유지)"""
+        lock = self._key_lock(key)
+        if not lock.acquire(blocking=False):
+            return
+        token = self._acquire_l2_lock(key, local_only)
+        if token is None:
+            lock.release()
+            return
+
+        def refresh():
+            try:
+                self._count("background_refreshes")
+                self.set(key, builder(), ttl, raw=raw, local_only=local_only)
+            except Exception as e:
+                self._count("errors")
+                print(f"⚠️ Cache background refresh error ({key}): {e}")
+            finally:
+                self._release_l2_lock(key, token, local_only)
+                lock.release()
+
+        try:
+            threading.Thread(target=refresh, name=f"cache-refresh:{key}", daemon=True).start()
+        except Exception as e:
+            self._release_l2_lock(key, token, local_only)
+            lock.release()
+            print(f"⚠️ Cache background refresh start error ({key}): {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 통계 (헬스체크/모니터링용)"""
+        with self._l1_lock:
+            stats = dict(self._stats)
+            stats["l1_size"] = len(self._l1)
+        lookups = stats["l1_hits"] + stats["l2_hits"] + stats["misses"]
+        stats["l1_max_entries"] = self.max_entries
+        stats["l2_enabled"] = bool(self.redis)
+        stats["hit_rate"] = round((stats["l1_hits"] + stats["l2_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
@@ -0,0 +1,261 @@
+"""
+발표 일정 기반 크롤링 스케줄러
+- 경제 캘린더 지표: next_releases 의 발표 일시 직후(CRAWL_RELEASE_DELAY_MINUTES)에 크롤링,
+  발표값이 아직 안 올라왔으면 CRAWL_RELEASE_RETRY_MINUTES 간격으로 CRAWL_RELEASE_RETRY_WINDOW_HOURS 동안만 재시도
+- 일간 시계열(시장 가격, FRED 일간 시리즈, multpl 등): CRAWL_DAILY_INTERVAL_HOURS 간격
+- 발표 일정을 모르는 지표(FRED 월간, BEA, TradingEconomics, 일정 미정 캘린더): CRAWL_PERIODIC_INTERVAL_HOURS 간격
+- 데이터가 없거나 마지막 크롤링이 실패한 지표: CRAWL_ERROR_RETRY_MINUTES 간격
+
+지표별 (우선순위, 예정 시각) 우선순위 큐를 만들고, 예정 시각이 지난 지표만 업데이트 실행에 넣는다.
+DB 조회는 지표 수와 무관하게 배치 2회 (get_multiple_indicators_data + get_multiple_crawl_info).
+마지막 시도 시각은 record_attempts 로 Redis(없으면 프로세스 메모리)에 기록한다
+(변경 없음으로 끝난 크롤링은 crawl_info 가 갱신되지 않으므로 별도 보관).
+"""
+
+import heapq
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover - Python 3.8
+    ZoneInfo = None
+
+from crawlers.indicators_config import INDICATORS
+
+# 캘린더 발표 시각의 시간대 (investing.com 비로그인 기본 표시: 미국 동부)
+CRAWL_RELEASE_TIMEZONE = os.getenv("CRAWL_RELEASE_TIMEZONE", "America/New_York")
+CRAWL_RELEASE_DELAY_MINUTES = float(os.getenv("CRAWL_RELEASE_DELAY_MINUTES", "2"))
+CRAWL_RELEASE_RETRY_MINUTES = float(os.getenv("CRAWL_RELEASE_RETRY_MINUTES", "10"))
+CRAWL_RELEASE_RETRY_WINDOW_HOURS = float(os.getenv("CRAWL_RELEASE_RETRY_WINDOW_HOURS", "6"))
+CRAWL_DAILY_INTERVAL_HOURS = float(os.getenv("CRAWL_DAILY_INTERVAL_HOURS", "6"))
+CRAWL_PERIODIC_INTERVAL_HOURS = float(os.getenv("CRAWL_PERIODIC_INTERVAL_HOURS", "24"))
+CRAWL_ERROR_RETRY_MINUTES = float(os.getenv("CRAWL_ERROR_RETRY_MINUTES", "15"))
+# 발표 일정이 있어도 이 기간 이상 크롤링하지 않았으면 다시 확인 (예상치/이전값 수정 반영)
+CRAWL_RELEASE_MAX_AGE_DAYS = float(os.getenv("CRAWL_RELEASE_MAX_AGE_DAYS", "7"))
+
+# 지표 주기
+CADENCE_RELEASE = "release"
+CADENCE_DAILY = "daily"
+CADENCE_PERIODIC = "periodic"
+
+# 우선순위 (작을수록 먼저): 발표 직후 > 데이터 없음/실패 재시도 > 주기 갱신
+PRIORITY_RELEASE = 0
+PRIORITY_RETRY = 1
+PRIORITY_INTERVAL = 2
+
+MARKET_URL_PATTERNS = ("rates-bonds", "commodities", "indices", "currencies")
+DAILY_SOURCE_PATTERNS = ("multpl.com", "cboe.com")
+# FRED 일간 시리즈 (나머지 FRED 시리즈는 월간/분기)
+DAILY_FRED_SERIES = frozenset(["DFII10", "T10Y2Y", "BAMLH0A0HYM2", "BAMLC0A0CM"])
+
+REDIS_ATTEMPTS_KEY = "crawl:schedule:attempts"
+_UNKNOWN_DATES = (None, "", "미정", "-")
+
+
+def source_cadence(indicator_id: str) -> str:
+    """지표 URL 로 주기 분류 (캘린더 발표 / 일간 시계열 / 일정 미상 주기 갱신)"""
+    config = INDICATORS.get(indicator_id)
+    url = config.url if config else ""
+    if "fred.stlouisfed.org" in url:
+        return CADENCE_DAILY if url.rstrip("/").split("/")[-1] in DAILY_FRED_SERIES else CADENCE_PERIODIC
+    if any(pattern in url for pattern in MARKET_URL_PATTERNS) or any(pattern in url for pattern in DAILY_SOURCE_PATTERNS):
+        return CADENCE_DAILY
+    if "investing.com/economic-calendar" in url:
+        return CADENCE_RELEASE
+    return CADENCE_PERIODIC
+
+
+def _release_tz():
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(CRAWL_RELEASE_TIMEZONE)
+        except Exception as e:
+            print(f"⚠️ Unknown CRAWL_RELEASE_TIMEZONE {CRAWL_RELEASE_TIMEZONE}: {e}")
+    return timezone.utc
+
+
+def release_timestamp(release_date: Any, release_time: Any) -> Optional[tuple]:
+    """next_release 의 (날짜, 시각) → (발표 epoch 초, 시각 확정 여부), 날짜가 없으면 None"""
+    if release_date in _UNKNOWN_DATES:
+        return None
+    try:
+        day = datetime.strptime(str(release_date)[:10], "%Y-%m-%d")
+    except ValueError:
+        return None
+    try:
+        clock = datetime.strptime(str(release_time).strip(), "%H:%M")
+        day = day.replace(hour=clock.hour, minute=clock.minute)
+        exact = True
+    except (TypeError, ValueError):
+        exact = False
+    return day.replace(tzinfo=_release_tz()).timestamp(), exact
+
+
+def _crawl_timestamp(value: Any) -> Optional[float]:
+    """crawl_info.last_crawl_time (datetime 또는 SQLite 문자열, UTC 기준) → epoch 초"""
+    if value in (None, ""):
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return None
+
+
+class CrawlScheduler:
+    """지표별 다음 크롤링 시각 계산 + 우선순위 큐"""
+
+    def __init__(self, db_service=None, redis_client=None):
+        self.db_service = db_service
+        self.redis = redis_client
+        self._attempts: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, db_service=None, redis_client=None):
+        self.db_service = db_service
+        self.redis = redis_client
+
+    # ---------- 마지막 시도 시각 ----------
+
+    def get_attempts(self, indicator_ids: List[str]) -> Dict[str, float]:
+        if self.redis is not None and indicator_ids:
+            try:
+                values = self.redis.hmget(REDIS_ATTEMPTS_KEY, indicator_ids)
+                return {
+                    indicator_id: float(value)
+                    for indicator_id, value in zip(indicator_ids, values) if value is not None
+                }
+            except Exception as e:
+                print(f"⚠️ Redis crawl schedule get error: {e}")
+        with self._lock:
+            return {indicator_id: self._attempts[indicator_id] for indicator_id in indicator_ids if indicator_id in self._attempts}
+
+    def record_attempts(self, indicator_ids: List[str], attempted_at: Optional[float] = None):
+        """크롤링 시도 기록 (성공/변경 없음/실패 모두, 업데이트 실행 종료 시 호출)"""
+        if not indicator_ids:
+            return
+        attempted_at = attempted_at or time.time()
+        with self._lock:
+            for indicator_id in indicator_ids:
+                self._attempts[indicator_id] = attempted_at
+        if self.redis is not None:
+            try:
+                self.redis.hset(REDIS_ATTEMPTS_KEY, mapping={indicator_id: attempted_at for indicator_id in indicator_ids})
+            except Exception as e:
+                print(f"⚠️ Redis crawl schedule set error: {e}")
+
+    # ---------- 스케줄 계산 ----------
+
+    def _load_state(self, indicator_ids: List[str]) -> tuple:
+        db = self.db_service
+        if hasattr(db, "get_multiple_indicators_data"):
+            data = db.get_multiple_indicators_data(indicator_ids)
+        else:
+            data = {indicator_id: db.get_indicator_data(indicator_id) for indicator_id in indicator_ids}
+        if hasattr(db, "get_multiple_crawl_info"):
+            crawl_info = db.get_multiple_crawl_info(indicator_ids)
+        else:
+            crawl_info = {indicator_id: db.get_crawl_info(indicator_id) for indicator_id in indicator_ids}
+        return data or {}, crawl_info or {}
+
+    def schedule_entry(self, indicator_id: str, data: Optional[Dict[str, Any]], crawl_info: Optional[Dict[str, Any]],
+                       last_attempt: Optional[float], now: float) -> Dict[str, Any]:
+        """지표 1개의 다음 크롤링 예정 {indicator_id, due_at, priority, reason, cadence, release_at}"""
+        cadence = source_cadence(indicator_id)
+        last_crawl = _crawl_timestamp((crawl_info or {}).get("last_crawl_time"))
+        last = max(filter(None, (last_attempt, last_crawl)), default=None)
+        entry = {"indicator_id": indicator_id, "cadence": cadence, "release_at": None, "last_crawl": last}
+
+        def due(at, priority, reason):
+            entry.update(due_at=at, priority=priority, reason=reason)
+            return entry
+
+        if last is None:
+            return due(now, PRIORITY_RETRY, "never crawled")
+
+        latest = data.get("latest_release", {}) if isinstance(data, dict) and "error" not in data else None
+        if not latest or latest.get("actual") in (None, "", "-"):
+            return due(last + CRAWL_ERROR_RETRY_MINUTES * 60, PRIORITY_RETRY, "no data")
+        if crawl_info and crawl_info.get("status") == "error":
+            return due(last + CRAWL_ERROR_RETRY_MINUTES * 60, PRIORITY_RETRY, "last crawl failed")
+
+        if cadence == CADENCE_DAILY:
+            return due(last + CRAWL_DAILY_INTERVAL_HOURS * 3600, PRIORITY_INTERVAL, "daily refresh")
+
+        next_release = data.get("next_release") or {}
+        release = release_timestamp(next_release.get("release_date"), next_release.get("time"))
+        if cadence != CADENCE_RELEASE or release is None:
+            return due(last + CRAWL_PERIODIC_INTERVAL_HOURS * 3600, PRIORITY_INTERVAL, "periodic refresh")
+
+        released_at, exact = release
+        crawl_at = released_at + CRAWL_RELEASE_DELAY_MINUTES * 60
+        # 시각 미정(All Day 등)이면 그날 하루 전체를 재시도 구간으로
+        window_end = crawl_at + CRAWL_RELEASE_RETRY_WINDOW_HOURS * 3600 + (0 if exact else 24 * 3600)
+        max_age_at = last + CRAWL_RELEASE_MAX_AGE_DAYS * 86400
+        entry["release_at"] = released_at
+
+        if last < crawl_at:
+            # 발표 후 아직 크롤링 안 함 (발표 전이면 발표 직후 예약, 너무 오래됐으면 그 전에 한 번 확인)
+            if max_age_at < crawl_at:
+                return due(max_age_at, PRIORITY_INTERVAL, "max age")
+            return due(crawl_at, PRIORITY_RELEASE, "scheduled release")
+        if now < window_end:
+            # 발표 후 크롤링했지만 발표값이 아직 없음 (next_release 가 그대로) → 재시도 구간 안에서만
+            return due(min(last + CRAWL_RELEASE_RETRY_MINUTES * 60, window_end), PRIORITY_RELEASE, "release retry")
+        return due(max_age_at, PRIORITY_INTERVAL, "release retry window expired")
+
+    def build_queue(self, indicator_ids: List[str], now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """(우선순위, 예정 시각) 순 힙 (heapq 로 pop)"""
+        now = now or time.time()
+        data, crawl_info = self._load_state(indicator_ids)
+        attempts = self.get_attempts(indicator_ids)
+        heap = []
+        for order, indicator_id in enumerate(indicator_ids):
+            entry = self.schedule_entry(
+                indicator_id, data.get(indicator_id), crawl_info.get(indicator_id), attempts.get(indicator_id), now
+            )
+            heapq.heappush(heap, (entry["due_at"] > now, entry["priority"], entry["due_at"], order, entry))
+        return heap
+
+    def due_indicators(self, indicator_ids: List[str], now: Optional[float] = None) -> List[str]:
+        """지금 크롤링할 지표 (발표 직후 → 재시도 → 주기 갱신 순)"""
+        now = now or time.time()
+        heap = self.build_queue(indicator_ids, now)
+        due = []
+        while heap and heap[0][2] <= now:
+            due.append(heapq.heappop(heap)[-1]["indicator_id"])
+        return due
+
+    def describe(self, indicator_ids: List[str], now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """모니터링용 전체 스케줄 (예정 시각 순, ISO 시각 포함)"""
+        now = now or time.time()
+        entries = [item[-1] for item in sorted(self.build_queue(indicator_ids, now))]
+        return [
+            dict(
+                entry,
+                due=entry["due_at"] <= now,
+                due_at=datetime.fromtimestamp(entry["due_at"], timezone.utc).isoformat(),
+                release_at=datetime.fromtimestamp(entry["release_at"], timezone.utc).isoformat() if entry["release_at"] else None,
+                last_crawl=datetime.fromtimestamp(entry["last_crawl"], timezone.utc).isoformat() if entry["last_crawl"] else None,
+            )
+            for entry in entries
+        ]
+
+    def next_release_due(self, indicator_ids: List[str], now: Optional[float] = None) -> Optional[float]:
+        """가장 가까운 발표 직후 크롤링 예정 시각 (발표 일정 기반 항목만, 없으면 None)"""
+        heap = self.build_queue(indicator_ids, now)
+        times = [item[2] for item in heap if item[-1]["priority"] == PRIORITY_RELEASE]
+        return min(times) if times else None
+
+
+# 프로세스 공용 인스턴스 (app.py 에서 configure)
+crawl_scheduler = CrawlScheduler()
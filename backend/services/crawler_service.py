@@ -1,18 +1,33 @@
-from crawlers.investing_crawler import fetch_html, parse_history_table, extract_raw_data
-from crawlers.rates_bonds_crawler import crawl_rate_indicator
-from crawlers.fred_crawler import crawl_fred_indicator
-from crawlers.tradingeconomics_crawler import crawl_tradingeconomics_indicator
-from crawlers.bea_crawler import crawl_bea_indicator
-from crawlers.sp500_pe_crawler import crawl_sp500_pe
-from crawlers.shiller_pe_crawler import crawl_shiller_pe
+from crawlers.investing_crawler import fetch_html, fetch_html_async, parse_history_table, extract_raw_data
+from crawlers.rates_bonds_crawler import crawl_rate_indicator, crawl_rate_indicator_async
+from crawlers.fred_crawler import crawl_fred_indicator, crawl_fred_indicator_async, crawl_fred_indicators_async
+from crawlers.tradingeconomics_crawler import crawl_tradingeconomics_indicator, crawl_tradingeconomics_indicator_async
+from crawlers.bea_crawler import crawl_bea_indicator, crawl_bea_indicator_async
+from crawlers.sp500_pe_crawler import crawl_sp500_pe, crawl_sp500_pe_async
+from crawlers.shiller_pe_crawler import crawl_shiller_pe, crawl_shiller_pe_async
+from crawlers.page_cache import PageUnchanged, page_cache
+from crawlers.parse_pool import run_parser
 from crawlers.put_call_crawler import crawl_put_call_ratio
 from crawlers.indicators_config import INDICATORS, get_all_enabled_indicators
-from typing import Dict, Any
+from typing import Dict, Any, List
+import asyncio
 import time
 
 class CrawlerService:
     """크롤링 서비스 통합 클래스 - indicators_config.py 기반"""
 
+    # BEA 지표 ID -> BEA ITA 지표 코드
+    BEA_INDICATORS = {
+        "current-account-balance": "BalCurrAcct"
+    }
+
+    # FRED 원본 관측치 저장소 (db_service, configure 로 설정) - 있으면 FRED 는 증분 조회
+    observation_store = None
+
+    @classmethod
+    def configure(cls, observation_store=None):
+        cls.observation_store = observation_store
+
     # indicators_config.py의 설정을 사용
     @classmethod
     def get_indicator_urls(cls) -> Dict[str, str]:
@@ -42,9 +57,10 @@ class CrawlerService:
                 series_id = url.split('/')[-1]  # URL에서 시리즈 ID 추출 (예: DFII10, RBUSBIS 등)
                 # YoY 계산 여부는 config에서 결정
                 calculate_yoy = getattr(config, 'calculate_yoy', False)
-                # YoY 계산 시 500일, 월별 데이터는 180일, 일별은 60일
-                days = 500 if calculate_yoy else (180 if "_PC1" in series_id or indicator_id in ["ppi", "pce"] else 60)
-                result = crawl_fred_indicator(series_id, calculate_yoy=calculate_yoy, days=days)
+                days = cls._fred_days(indicator_id, series_id, calculate_yoy)
+                result = crawl_fred_indicator(
+                    series_id, calculate_yoy=calculate_yoy, days=days, store=cls.observation_store
+                )
 
                 if "error" in result:
                     return result
@@ -81,11 +97,7 @@ class CrawlerService:
             elif "apps.bea.gov" in url:
                 # BEA API 크롤러
                 # current-account-balance -> BalCurrAcct
-                bea_indicators = {
-                    "current-account-balance": "BalCurrAcct"
-                }
-
-                bea_code = bea_indicators.get(indicator_id)
+                bea_code = cls.BEA_INDICATORS.get(indicator_id)
                 if not bea_code:
                     return {"error": f"BEA indicator code not found for {indicator_id}"}
 
@@ -135,24 +147,151 @@ class CrawlerService:
             else:
                 # Investing.com Economic Calendar 크롤러 (기존 방식)
                 html = fetch_html(url)
-                history_rows = parse_history_table(html)
-                raw_data = extract_raw_data(history_rows)
-
-                if "error" in raw_data:
-                    return raw_data
-
-                result = {
-                    "latest_release": raw_data.get("latest_release"),
-                    "next_release": raw_data.get("next_release"),
-                    "history_table": history_rows,
-                    "crawl_timestamp": time.time(),
-                    "url": url
-                }
+                return cls._build_calendar_result(html, url)
+
+        except Exception as e:
+            return {"error": f"Crawling failed for {indicator_id}: {str(e)}"}
+
+    @classmethod
+    async def crawl_indicator_async(cls, indicator_id: str, conditional: bool = False) -> Dict[str, Any]:
+        """crawl_indicator 의 asyncio 버전
+
+        네트워크 요청/백오프는 이벤트 루프에서 기다리고, HTML/CSV 파싱은 파싱 워커 풀에서 실행한다.
+        크롤러 선택 규칙과 결과 구조는 crawl_indicator 와 같다.
+
+        Args:
+            conditional: True 면 스크래핑 페이지(investing/tradingeconomics/multpl)에 조건부 요청을 보내고
+                마지막 성공 크롤링과 같으면 파싱 없이 {"unchanged": True, ...} 를 반환한다.
+                새로 받은 페이지의 검증값은 result["page_validators"] 에 담기며,
+                저장 성공 후 page_cache.commit(...) 으로 기록해야 다음 실행에서 사용된다.
+        """
+        if not conditional:
+            return await cls._crawl_indicator_async(indicator_id)
+
+        url = INDICATORS[indicator_id].url if indicator_id in INDICATORS else None
+        with page_cache.collect() as validators:
+            try:
+                result = await cls._crawl_indicator_async(indicator_id)
+            except PageUnchanged as e:
+                return {"unchanged": True, "url": url, "reason": e.reason}
+
+        if validators and "error" not in result:
+            result["page_validators"] = validators
+        return result
+
+    @classmethod
+    async def _crawl_indicator_async(cls, indicator_id: str) -> Dict[str, Any]:
+        config = INDICATORS.get(indicator_id)
+        if not config or not config.enabled:
+            return {"error": f"Unknown or disabled indicator: {indicator_id}"}
+
+        url = config.url
+
+        try:
+            if "fred.stlouisfed.org" in url:
+                series_id, calculate_yoy, days = cls._fred_spec(indicator_id)
+                result = await crawl_fred_indicator_async(
+                    series_id, calculate_yoy=calculate_yoy, days=days, store=cls.observation_store
+                )
+
+            elif any(pattern in url for pattern in ["rates-bonds", "commodities", "indices", "currencies"]):
+                result = await crawl_rate_indicator_async(url)
+
+            elif "tradingeconomics.com" in url:
+                result = await crawl_tradingeconomics_indicator_async(url)
+
+            elif "apps.bea.gov" in url:
+                bea_code = cls.BEA_INDICATORS.get(indicator_id)
+                if not bea_code:
+                    return {"error": f"BEA indicator code not found for {indicator_id}"}
+                result = await crawl_bea_indicator_async(bea_code)
+
+            elif "multpl.com/s-p-500-pe-ratio" in url:
+                result = await crawl_sp500_pe_async()
+
+            elif "multpl.com/shiller-pe" in url:
+                result = await crawl_shiller_pe_async()
+
+            elif "cboe.com" in url or indicator_id == "put-call-ratio":
+                # 네트워크 요청 없는 폴백 값
+                result = crawl_put_call_ratio()
+
+            else:
+                html = await fetch_html_async(url)
+                return await run_parser(cls._build_calendar_result, html, url)
+
+            if "error" in result:
                 return result
 
+            result["crawl_timestamp"] = time.time()
+            result["url"] = url
+            return result
+
+        except PageUnchanged:
+            raise
         except Exception as e:
             return {"error": f"Crawling failed for {indicator_id}: {str(e)}"}
 
+    @classmethod
+    def is_fred_indicator(cls, indicator_id: str) -> bool:
+        config = INDICATORS.get(indicator_id)
+        return bool(config and config.enabled and "fred.stlouisfed.org" in config.url)
+
+    @classmethod
+    def _fred_spec(cls, indicator_id: str) -> tuple:
+        """FRED 지표 → (series_id, calculate_yoy, days)"""
+        config = INDICATORS[indicator_id]
+        series_id = config.url.split('/')[-1]
+        calculate_yoy = getattr(config, 'calculate_yoy', False)
+        return series_id, calculate_yoy, cls._fred_days(indicator_id, series_id, calculate_yoy)
+
+    @classmethod
+    async def crawl_fred_indicators_async(cls, indicator_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """FRED 지표 여러 개를 한 번에 크롤링 (저장된 관측치 이후만, 다중 시리즈 요청 1회)
+
+        저장소가 없으면 지표별 crawl_indicator_async 와 같다.
+        결과 구조는 crawl_indicator_async 와 같다 ({indicator_id: result}).
+        """
+        if cls.observation_store is None:
+            results = await asyncio.gather(*(cls._crawl_indicator_async(indicator_id) for indicator_id in indicator_ids))
+            return dict(zip(indicator_ids, results))
+
+        specs = {indicator_id: cls._fred_spec(indicator_id) for indicator_id in indicator_ids}
+        try:
+            results = await crawl_fred_indicators_async(specs, store=cls.observation_store)
+        except Exception as e:
+            return {indicator_id: {"error": f"Crawling failed for {indicator_id}: {str(e)}"} for indicator_id in indicator_ids}
+
+        for indicator_id, result in results.items():
+            if "error" not in result:
+                result["crawl_timestamp"] = time.time()
+                result["url"] = INDICATORS[indicator_id].url
+        return results
+
+    @staticmethod
+    def _fred_days(indicator_id: str, series_id: str, calculate_yoy: bool) -> int:
+        """FRED 조회 기간: YoY 계산 시 500일, 월별 데이터는 180일, 일별은 60일"""
+        if calculate_yoy:
+            return 500
+        return 180 if "_PC1" in series_id or indicator_id in ["ppi", "pce"] else 60
+
+    @staticmethod
+    def _build_calendar_result(html: str, url: str) -> Dict[str, Any]:
+        """Investing.com Economic Calendar 페이지 HTML → 통합 데이터 구조"""
+        history_rows = parse_history_table(html)
+        raw_data = extract_raw_data(history_rows)
+
+        if "error" in raw_data:
+            return raw_data
+
+        return {
+            "latest_release": raw_data.get("latest_release"),
+            "next_release": raw_data.get("next_release"),
+            "history_table": history_rows,
+            "crawl_timestamp": time.time(),
+            "url": url
+        }
+
     @classmethod
     def crawl_all_indicators(cls) -> Dict[str, Dict[str, Any]]:
         """모든 지표 크롤링 (배치 처리용)"""
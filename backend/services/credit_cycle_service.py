@@ -14,6 +14,8 @@
 from typing import Dict, Optional
 from datetime import datetime
 
+from services.value_normalizer import release_number
+
 
 class CreditCycleService:
     """신용/유동성 사이클 계산 서비스"""
@@ -151,28 +153,28 @@ class CreditCycleService:
 
         # HY Spread (역방향: 낮을수록 좋음 → 높은 점수)
         if 'hy-spread' in data:
-            spread = self._parse_value(data['hy-spread'].get('actual'))
+            spread = self._release_value(data['hy-spread'])
             scores['hy_spread'] = self._score_hy_spread(spread)
         else:
             scores['hy_spread'] = 50.0
 
         # IG Spread (역방향: 낮을수록 좋음 → 높은 점수)
         if 'ig-spread' in data:
-            spread = self._parse_value(data['ig-spread'].get('actual'))
+            spread = self._release_value(data['ig-spread'])
             scores['ig_spread'] = self._score_ig_spread(spread)
         else:
             scores['ig_spread'] = 50.0
 
         # FCI (역방향: 낮을수록 좋음 → 높은 점수)
         if 'fci' in data:
-            fci = self._parse_value(data['fci'].get('actual'))
+            fci = self._release_value(data['fci'])
             scores['fci'] = self._score_fci(fci)
         else:
             scores['fci'] = 50.0
 
         # M2 YoY (정방향: 높을수록 좋음)
         if 'm2-yoy' in data:
-            m2 = self._parse_value(data['m2-yoy'].get('actual'))
+            m2 = self._release_value(data['m2-yoy'])
             scores['m2_yoy'] = self._score_m2_yoy(m2)
         else:
             scores['m2_yoy'] = 50.0
@@ -281,26 +283,10 @@ class CreditCycleService:
         else:
             return 25
 
-    def _parse_value(self, value) -> float:
-        """지표 값 파싱"""
-        if value is None:
-            return 0.0
-
-        if isinstance(value, (int, float)):
-            return float(value)
-
-        value_str = str(value).strip()
-
-        if value_str.endswith('%'):
-            value_str = value_str[:-1]
-
-        if value_str.endswith('K'):
-            value_str = value_str[:-1]
-
-        try:
-            return float(value_str)
-        except ValueError:
-            return 0.0
+    def _release_value(self, release: Dict) -> float:
+        """지표 최신값 (저장 시 정규화된 actual_value 사용, 없으면 0.0)"""
+        value = release_number(release)
+        return value if value is not None else 0.0
 
     def _error_response(self, message: str) -> Dict:
         """에러 응답"""
@@ -15,9 +15,14 @@ Scoring:
 """
 
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 
+import numpy as np
+
+from services.series_transforms import to_date
+from services.value_normalizer import release_number, to_number
+
 logger = logging.getLogger(__name__)
 
 
@@ -270,36 +275,16 @@ def parse_indicator_value(value: Any) -> Optional[float]:
     """
     지표값 파싱 (문자열, %, K 단위 처리)
 
+    value_normalizer.to_number 와 동일 (218K → 218, "3.2%" → 3.2).
+    DB 조회 결과에는 이미 actual_value 가 있으므로 release_number() 를 우선 사용한다.
+
     Args:
         value: 원본 지표값 (str, float, None)
 
     Returns:
         파싱된 숫자 또는 None
     """
-    if value is None:
-        return None
-
-    if isinstance(value, (int, float)):
-        return float(value)
-
-    if isinstance(value, str):
-        # % 제거
-        value = value.replace('%', '').strip()
-
-        # K 단위 처리 (218K → 218)
-        if value.endswith('K'):
-            try:
-                return float(value[:-1])
-            except ValueError:
-                return None
-
-        # 숫자 변환
-        try:
-            return float(value)
-        except ValueError:
-            return None
-
-    return None
+    return to_number(value)
 
 
 # ========================================
@@ -335,7 +320,7 @@ def calculate_macro_score(db_service) -> Dict[str, Any]:
                 continue
 
             # 값 파싱
-            value = parse_indicator_value(latest['actual'])
+            value = release_number(latest)
             if value is None:
                 continue
 
@@ -432,7 +417,7 @@ def calculate_credit_score(db_service) -> Dict[str, Any]:
                 logger.warning(f"Credit indicator {indicator_id} not found in DB")
                 continue
 
-            value = parse_indicator_value(latest['actual'])
+            value = release_number(latest)
             if value is None:
                 continue
 
@@ -524,7 +509,7 @@ def calculate_sentiment_score(db_service) -> Dict[str, Any]:
                 logger.warning(f"Sentiment indicator {indicator_id} not found in DB")
                 continue
 
-            value = parse_indicator_value(latest['actual'])
+            value = release_number(latest)
             if value is None:
                 continue
 
@@ -947,52 +932,70 @@ def calculate_trend_score(
     return max(0.0, min(100.0, score))
 
 
-def get_value_n_months_ago(
+def get_values_n_months_ago(
     history: List[Dict[str, Any]],
-    months: int = 3
-) -> Optional[float]:
+    months_list: Tuple[int, ...] = (1, 3)
+) -> Dict[int, Optional[float]]:
     """
-    N개월 전 값 추출
+    여러 기간의 N개월 전 값을 한 번에 추출 (히스토리를 한 번만 훑음)
 
     Args:
         history: 히스토리 데이터 리스트 (최신순 정렬)
-        months: 몇 개월 전 값을 가져올지
+        months_list: 몇 개월 전 값들을 가져올지
 
     Returns:
-        N개월 전 값 또는 None
+        {months: N개월 전 값 또는 None}
+        - 현재 기준 months*30 일 전 이하인 가장 최근 (actual 이 있는) 데이터
+        - 없으면 가장 오래된 데이터 (히스토리 마지막)
     """
-    from datetime import datetime, timedelta
-
+    result = {months: None for months in months_list}
     if not history:
-        return None
+        return result
 
-    # 현재 날짜 기준으로 N개월 전 날짜 계산
-    target_date = datetime.now() - timedelta(days=months * 30)
+    now = datetime.now()
+    targets = {months: to_date(now - timedelta(days=months * 30)) for months in months_list}
 
-    # 히스토리에서 target_date에 가장 가까운 데이터 찾기
+    # 최신순으로 한 번만 훑으면서 기간별로 target 이하인 첫 데이터를 채움 (모두 찾으면 중단)
+    pending = set(targets)
     for record in history:
-        release_date_str = record.get('release_date')
-        if not release_date_str:
+        if record.get('actual') is None:
             continue
-
-        try:
-            release_date = datetime.strptime(str(release_date_str), '%Y-%m-%d')
-            # target_date 이전이거나 같은 날짜의 첫 번째 데이터
-            if release_date <= target_date:
-                actual = record.get('actual')
-                if actual is not None:
-                    return parse_indicator_value(actual)
-        except (ValueError, TypeError):
+        release_date = to_date(record.get('release_date'))
+        if np.isnat(release_date):
             continue
+        found = [months for months in pending if release_date <= targets[months]]
+        if found:
+            value = release_number(record)
+            for months in found:
+                result[months] = value
+            pending.difference_update(found)
+            if not pending:
+                return result
 
     # 못 찾으면 가장 오래된 데이터 반환 (히스토리 마지막)
-    if history:
-        last_record = history[-1]
-        actual = last_record.get('actual')
-        if actual is not None:
-            return parse_indicator_value(actual)
+    last_record = history[-1]
+    if last_record.get('actual') is not None:
+        fallback = release_number(last_record)
+        for months in pending:
+            result[months] = fallback
+    return result
+
 
-    return None
+def get_value_n_months_ago(
+    history: List[Dict[str, Any]],
+    months: int = 3
+) -> Optional[float]:
+    """
+    N개월 전 값 추출
+
+    Args:
+        history: 히스토리 데이터 리스트 (최신순 정렬)
+        months: 몇 개월 전 값을 가져올지
+
+    Returns:
+        N개월 전 값 또는 None
+    """
+    return get_values_n_months_ago(history, (months,))[months]
 
 
 def calculate_cycle_with_trend(
@@ -1033,7 +1036,7 @@ def calculate_cycle_with_trend(
             if not latest or 'actual' not in latest:
                 continue
 
-            current_value = parse_indicator_value(latest['actual'])
+            current_value = release_number(latest)
             if current_value is None:
                 continue
 
@@ -1213,11 +1216,11 @@ def calculate_real_interest_rate(db_service) -> Dict[str, Any]:
     try:
         # 명목금리 (Federal Funds Rate)
         fed_rate_data = db_service.get_latest_indicator('federal-funds-rate')
-        nominal_rate = parse_indicator_value(fed_rate_data.get('actual')) if fed_rate_data else None
+        nominal_rate = release_number(fed_rate_data)
 
         # 인플레이션 (Core CPI)
         cpi_data = db_service.get_latest_indicator('core-cpi')
-        inflation = parse_indicator_value(cpi_data.get('actual')) if cpi_data else None
+        inflation = release_number(cpi_data)
 
         if nominal_rate is None or inflation is None:
             return {
@@ -1287,7 +1290,7 @@ def calculate_yield_curve_inversion_duration(db_service) -> Dict[str, Any]:
     try:
         # 현재 스프레드
         latest = db_service.get_latest_indicator('yield-curve-10y-2y')
-        current_spread = parse_indicator_value(latest.get('actual')) if latest else None
+        current_spread = release_number(latest)
 
         if current_spread is None:
             return {
@@ -1303,7 +1306,7 @@ def calculate_yield_curve_inversion_duration(db_service) -> Dict[str, Any]:
         inversion_months = 0
 
         for record in history:
-            spread_value = parse_indicator_value(record.get('actual'))
+            spread_value = release_number(record)
             if spread_value is not None and spread_value < 0:
                 inversion_months += 1
             else:
@@ -1490,7 +1493,7 @@ def calculate_spread_velocity(db_service, indicator_id: str) -> Dict[str, Any]:
     try:
         # 현재값 조회
         latest = db_service.get_latest_indicator(indicator_id)
-        current_value = parse_indicator_value(latest.get('actual')) if latest else None
+        current_value = release_number(latest)
 
         if current_value is None:
             return {
@@ -1503,8 +1506,9 @@ def calculate_spread_velocity(db_service, indicator_id: str) -> Dict[str, Any]:
 
         # 히스토리에서 1개월, 3개월 전 값 조회
         history = db_service.get_history_data(indicator_id, limit=12)
-        value_1m = get_value_n_months_ago(history, months=1)
-        value_3m = get_value_n_months_ago(history, months=3)
+        past_values = get_values_n_months_ago(history, (1, 3))
+        value_1m = past_values[1]
+        value_3m = past_values[3]
 
         # 변화량 계산 (bp 단위)
         delta_1m = (current_value - value_1m) if value_1m else 0
@@ -1585,7 +1589,7 @@ def detect_rapid_change(db_service) -> Dict[str, Any]:
         vix_latest = db_service.get_latest_indicator('vix')
         vix_history = db_service.get_history_data('vix', limit=6)
         if vix_latest and vix_history:
-            vix_current = parse_indicator_value(vix_latest.get('actual'))
+            vix_current = release_number(vix_latest)
             vix_1m = get_value_n_months_ago(vix_history, months=1)
             if vix_current and vix_1m:
                 vix_delta = vix_current - vix_1m
@@ -0,0 +1,98 @@
+"""
+지표 데이터 세대 번호 (응답 캐시 키 / ETag 용)
+
+세대 번호 = indicator_data_versions 의 MAX(version). 지표 데이터 행이 실제로 바뀐 저장에서만 증가한다.
+요청마다 DB 를 조회하지 않도록:
+- L1: 워커 메모리에 DATA_GENERATION_L1_TTL 초 동안 보관 (같은 워커의 저장은 즉시 반영)
+- L2: Redis 키 (저장한 워커가 새 세대로 올림, 다른 워커는 L1 TTL 안에 반영)
+- DB 조회는 Redis 에 값이 없거나 Redis 가 없을 때만 (L1 TTL 마다 최대 1회)
+- 조회가 실패하면 마지막으로 알던 세대를 계속 사용 (한 번도 읽지 못했으면 None → 캐시 없이 계산)
+
+사용:
+    data_generation.configure(redis_client, loader=db_service.get_data_generation)
+    generation = data_generation.current()
+    data_generation.advance(new_version)   # DB 서비스가 데이터 변경 commit 후 호출
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+REDIS_KEY = "indicators:data_generation"
+L1_TTL = float(os.getenv("DATA_GENERATION_L1_TTL", "2"))  # seconds
+
+# 더 큰 값으로만 갱신 (동시에 저장한 워커의 순서가 뒤바뀌어도 세대가 되돌아가지 않도록)
+_ADVANCE_SCRIPT = """
+local current = tonumber(redis.call('get', KEYS[1]) or '0')
+local generation = tonumber(ARGV[1])
+if generation > current then
+    redis.call('set', KEYS[1], ARGV[1])
+    return generation
+end
+return current
+"""
+
+
+class DataGeneration:
+    """워커 L1 + Redis + DB 폴백 세대 번호"""
+
+    def __init__(self):
+        self.redis = None
+        self._loader: Optional[Callable[[], Optional[int]]] = None
+        self._value: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def configure(self, redis_client=None, loader: Optional[Callable[[], Optional[int]]] = None):
+        self.redis = redis_client
+        self._loader = loader
+
+    def _remember(self, generation: Optional[int]) -> Optional[int]:
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if generation is not None:
+                self._value = max(self._value or 0, generation)
+            return self._value
+
+    def _read_redis(self) -> Optional[int]:
+        if self.redis is None:
+            return None
+        try:
+            raw = self.redis.get(REDIS_KEY)
+            return int(raw) if raw is not None else None
+        except Exception as e:
+            print(f"⚠️ Redis data generation get error: {e}")
+            return None
+
+    def _publish(self, generation: int) -> Optional[int]:
+        if self.redis is None:
+            return generation
+        try:
+            return int(self.redis.eval(_ADVANCE_SCRIPT, 1, REDIS_KEY, generation))
+        except Exception as e:
+            print(f"⚠️ Redis data generation set error: {e}")
+            return generation
+
+    def current(self, refresh: bool = False) -> Optional[int]:
+        """현재 세대 (L1 → Redis → DB, 실패 시 마지막으로 알던 값)"""
+        with self._lock:
+            if not refresh and self._value is not None and time.monotonic() - self._checked_at < L1_TTL:
+                return self._value
+
+        generation = self._read_redis()
+        if generation is None and self._loader is not None:
+            generation = self._loader()
+            if generation is not None:
+                generation = self._publish(generation)
+        return self._remember(generation)
+
+    def advance(self, generation: Optional[int]) -> Optional[int]:
+        """데이터 변경 commit 후 새 세대 반영 (Redis 는 더 큰 값으로만 갱신)"""
+        if generation is None:
+            return self._value
+        return self._remember(self._publish(generation))
+
+
+# 프로세스 공용 인스턴스
+data_generation = DataGeneration()
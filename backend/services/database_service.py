@@ -1,14 +1,20 @@
 import sqlite3
 import json
 import os
+import threading
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 
+from services.data_generation import data_generation
+from services.value_normalizer import normalize_release, release_values
+
 class DatabaseService:
     """SQLite 데이터베이스 서비스 클래스"""
 
     def __init__(self, db_path: str = "database/indicators.db"):
         self.db_path = db_path
+        # 스레드별 재사용 연결 (sqlite3 연결은 스레드 간 공유하지 않는다)
+        self._local = threading.local()
         self.init_database()
 
     def init_database(self):
@@ -28,6 +34,7 @@ class DatabaseService:
                 with sqlite3.connect(self.db_path, timeout=30.0) as conn:
                     conn.execute("PRAGMA journal_mode=WAL")
                     conn.executescript(schema_sql)
+                    self._ensure_value_columns(conn)
                     conn.commit()
                     print("Database initialized successfully")
             else:
@@ -37,17 +44,29 @@ class DatabaseService:
             # 기본 테이블만이라도 생성
             self._create_basic_tables()
 
-    def get_connection(self):
-        """데이터베이스 연결 반환"""
+    def _connect(self):
         conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
         conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
-        # SQLite 설정 최적화
+        # SQLite 설정 최적화 (연결 생성 시 1회)
         conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging 활성화
         conn.execute("PRAGMA synchronous=NORMAL")  # 동기화 수준 조정
         conn.execute("PRAGMA cache_size=1000")  # 캐시 크기 증가
         conn.execute("PRAGMA temp_store=MEMORY")  # 메모리에 임시 데이터 저장
         return conn
 
+    def get_connection(self):
+        """현재 스레드의 데이터베이스 연결 반환 (스레드당 1개 재사용)
+
+        `with self.get_connection() as conn:` 블록은 트랜잭션(commit/rollback)만 관리하며
+        연결은 닫지 않는다. fork 된 프로세스에서는 부모의 연결을 버리고 새로 연다.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
     def _create_basic_tables(self):
         """기본 테이블 생성 (스키마 파일이 없을 때 사용)"""
         try:
@@ -105,74 +124,186 @@ class DatabaseService:
                     error_message TEXT,
                     data_count INTEGER DEFAULT 0
                 );
+
+                CREATE TABLE IF NOT EXISTS indicator_data_versions (
+                    indicator_id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS fred_observations (
+                    series_id TEXT NOT NULL,
+                    observation_date TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (series_id, observation_date)
+                );
                 """
 
                 conn.executescript(basic_schema)
+                self._ensure_value_columns(conn)
                 conn.commit()
                 print("Basic tables created successfully")
         except Exception as e:
             print(f"Failed to create basic tables: {e}")
 
+    # 지표값 숫자/단위 컬럼 (저장 시점에 value_normalizer 로 1회 파싱)
+    VALUE_COLUMNS = {
+        "latest_releases": ("actual_value", "forecast_value", "previous_value", "unit"),
+        "next_releases": ("forecast_value", "previous_value", "unit"),
+        "history_data": ("actual_value", "forecast_value", "previous_value", "unit"),
+    }
+
+    def _ensure_value_columns(self, conn):
+        """기존 DB 에 숫자/단위 컬럼이 없으면 추가 (SQLite 는 ADD COLUMN IF NOT EXISTS 미지원)"""
+        for table, columns in self.VALUE_COLUMNS.items():
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+            for column in columns:
+                if column not in existing:
+                    column_type = "TEXT" if column == "unit" else "REAL"
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+    @staticmethod
+    def _to_db_text(value: Any) -> Optional[str]:
+        return str(value) if value is not None else None
+
+    def _history_row_dict(self, row) -> Dict[str, Any]:
+        """history_data / latest_releases 행 → API 응답 형태 (원문 + 숫자값)"""
+        row = dict(row)
+        return {
+            "release_date": row['release_date'],
+            "time": row['time'],
+            "actual": self._parse_value(row['actual']),
+            "forecast": self._parse_value(row['forecast']),
+            "previous": self._parse_value(row['previous']),
+            **release_values(row)
+        }
+
+    def _next_release_dict(self, row) -> Dict[str, Any]:
+        """next_releases 행 → API 응답 형태 (없으면 미정)"""
+        if not row:
+            return {
+                "release_date": "미정",
+                "time": "미정",
+                "forecast": None,
+                "previous": None,
+                "forecast_value": None,
+                "previous_value": None,
+                "unit": None
+            }
+        row = dict(row)
+        return {
+            "release_date": row['release_date'],
+            "time": row['time'],
+            "forecast": self._parse_value(row['forecast']),
+            "previous": self._parse_value(row['previous']),
+            **release_values(row, include_actual=False)
+        }
+
     def save_indicator_data(self, indicator_id: str, crawled_data: Dict[str, Any]):
         """크롤링된 데이터를 데이터베이스에 저장"""
         with self.get_connection() as conn:
             try:
+                # 데이터 변경 여부 판단용 (latest/next 는 삭제 후 다시 넣으므로 전후 비교, history 는 변경 행 수)
+                releases_before = self._release_snapshot(conn, indicator_id)
+
                 # 기존 데이터 삭제 (최신 데이터로 교체)
                 conn.execute("DELETE FROM latest_releases WHERE indicator_id = ?", (indicator_id,))
                 conn.execute("DELETE FROM next_releases WHERE indicator_id = ?", (indicator_id,))
-                conn.execute("DELETE FROM history_data WHERE indicator_id = ?", (indicator_id,))
+                # history_data 는 누적 시계열이므로 삭제하지 않고 (indicator_id, release_date) 기준 upsert
 
                 # 최신 릴리즈 데이터 저장
                 if 'latest_release' in crawled_data:
                     latest = crawled_data['latest_release']
+                    values = normalize_release(latest.get('actual'), latest.get('forecast'), latest.get('previous'))
                     conn.execute("""
                         INSERT INTO latest_releases
-                        (indicator_id, release_date, time, actual, forecast, previous)
-                        VALUES (?, ?, ?, ?, ?, ?)
+                        (indicator_id, release_date, time, actual, forecast, previous,
+                         actual_value, forecast_value, previous_value, unit)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         indicator_id,
                         latest.get('release_date'),
                         latest.get('time'),
-                        str(latest.get('actual')) if latest.get('actual') is not None else None,
-                        str(latest.get('forecast')) if latest.get('forecast') is not None else None,
-                        str(latest.get('previous')) if latest.get('previous') is not None else None
+                        self._to_db_text(latest.get('actual')),
+                        self._to_db_text(latest.get('forecast')),
+                        self._to_db_text(latest.get('previous')),
+                        values['actual_value'],
+                        values['forecast_value'],
+                        values['previous_value'],
+                        values['unit']
                     ))
 
                 # 다음 릴리즈 데이터 저장
                 if 'next_release' in crawled_data:
                     next_rel = crawled_data['next_release']
+                    values = normalize_release(None, next_rel.get('forecast'), next_rel.get('previous'))
                     conn.execute("""
                         INSERT INTO next_releases
-                        (indicator_id, release_date, time, forecast, previous)
-                        VALUES (?, ?, ?, ?, ?)
+                        (indicator_id, release_date, time, forecast, previous,
+                         forecast_value, previous_value, unit)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         indicator_id,
                         next_rel.get('release_date'),
                         next_rel.get('time'),
-                        str(next_rel.get('forecast')) if next_rel.get('forecast') is not None else None,
-                        str(next_rel.get('previous')) if next_rel.get('previous') is not None else None
+                        self._to_db_text(next_rel.get('forecast')),
+                        self._to_db_text(next_rel.get('previous')),
+                        values['forecast_value'],
+                        values['previous_value'],
+                        values['unit']
                     ))
 
-                # 히스토리 데이터 저장 (history_table에서)
+                # 히스토리 데이터 저장 (history_table에서, 값이 같은 행은 갱신하지 않음)
+                changes_before = conn.total_changes
                 if 'history_table' in crawled_data:
                     for row in crawled_data['history_table']:
+                        if not row.get('release_date'):
+                            continue
+                        values = normalize_release(row.get('actual'), row.get('forecast'), row.get('previous'))
                         conn.execute("""
                             INSERT INTO history_data
-                            (indicator_id, release_date, time, actual, forecast, previous)
-                            VALUES (?, ?, ?, ?, ?, ?)
+                            (indicator_id, release_date, time, actual, forecast, previous,
+                             actual_value, forecast_value, previous_value, unit)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            ON CONFLICT (indicator_id, release_date) DO UPDATE SET
+                                time = excluded.time,
+                                actual = excluded.actual,
+                                forecast = excluded.forecast,
+                                previous = excluded.previous,
+                                actual_value = excluded.actual_value,
+                                forecast_value = excluded.forecast_value,
+                                previous_value = excluded.previous_value,
+                                unit = excluded.unit
+                            WHERE (history_data.time, history_data.actual, history_data.forecast,
+                                   history_data.previous, history_data.actual_value, history_data.forecast_value,
+                                   history_data.previous_value, history_data.unit)
+                                  IS NOT
+                                  (excluded.time, excluded.actual, excluded.forecast,
+                                   excluded.previous, excluded.actual_value, excluded.forecast_value,
+                                   excluded.previous_value, excluded.unit)
                         """, (
                             indicator_id,
                             row.get('release_date'),
                             row.get('time'),
-                            str(row.get('actual')) if row.get('actual') is not None else None,
-                            str(row.get('forecast')) if row.get('forecast') is not None else None,
-                            str(row.get('previous')) if row.get('previous') is not None else None
+                            self._to_db_text(row.get('actual')),
+                            self._to_db_text(row.get('forecast')),
+                            self._to_db_text(row.get('previous')),
+                            values['actual_value'],
+                            values['forecast_value'],
+                            values['previous_value'],
+                            values['unit']
                         ))
 
-                # 크롤링 정보 업데이트
-                self.update_crawl_info(indicator_id, 'success', len(crawled_data.get('history_table', [])))
+                history_changed = conn.total_changes - changes_before > 0
+                data_changed = history_changed or self._release_snapshot(conn, indicator_id) != releases_before
+                version = self._bump_data_version(conn, indicator_id) if data_changed else None
+
+                # 크롤링 정보 업데이트 (같은 트랜잭션)
+                self._write_crawl_info(conn, indicator_id, 'success', len(crawled_data.get('history_table', [])))
 
                 conn.commit()
+                data_generation.advance(version)
                 return True
 
             except Exception as e:
@@ -207,19 +338,8 @@ class DatabaseService:
 
             # API 응답 형태로 변환
             result = {
-                "latest_release": {
-                    "release_date": latest_row['release_date'],
-                    "time": latest_row['time'],
-                    "actual": self._parse_value(latest_row['actual']),
-                    "forecast": self._parse_value(latest_row['forecast']),
-                    "previous": self._parse_value(latest_row['previous'])
-                },
-                "next_release": {
-                    "release_date": next_row['release_date'] if next_row else "미정",
-                    "time": next_row['time'] if next_row else "미정",
-                    "forecast": self._parse_value(next_row['forecast']) if next_row else None,
-                    "previous": self._parse_value(next_row['previous']) if next_row else None
-                },
+                "latest_release": self._history_row_dict(latest_row),
+                "next_release": self._next_release_dict(next_row),
                 "last_updated": crawl_row['last_crawl_time'] if crawl_row else None,
                 "timestamp": datetime.now().isoformat()
             }
@@ -240,7 +360,8 @@ class DatabaseService:
         try:
             with self.get_connection() as conn:
                 query = """
-                    SELECT release_date, time, actual, forecast, previous
+                    SELECT release_date, time, actual, forecast, previous,
+                           actual_value, forecast_value, previous_value, unit
                     FROM history_data
                     WHERE indicator_id = ?
                     ORDER BY release_date DESC
@@ -253,20 +374,178 @@ class DatabaseService:
 
                 rows = conn.execute(query, tuple(params)).fetchall()
 
-                return [
-                    {
-                        "release_date": row['release_date'],
-                        "time": row['time'],
-                        "actual": self._parse_value(row['actual']),
-                        "forecast": self._parse_value(row['forecast']),
-                        "previous": self._parse_value(row['previous'])
-                    }
-                    for row in rows
-                ]
+                return [self._history_row_dict(row) for row in rows]
         except Exception as e:
             print(f"Error getting history data for {indicator_id}: {e}")
             return []
 
+    def get_history_range(self, indicator_id: str, start: str = None, end: str = None,
+                          limit: int = None) -> List[Dict[str, Any]]:
+        """기간별 히스토리 데이터 조회 (누적 시계열)
+
+        Args:
+            indicator_id: 지표 ID
+            start: 시작일 (YYYY-MM-DD, 포함). None이면 처음부터
+            end: 종료일 (YYYY-MM-DD, 포함). None이면 최신까지
+            limit: 가져올 최대 행 수 (None이면 전체)
+        """
+        try:
+            with self.get_connection() as conn:
+                query = """
+                    SELECT release_date, time, actual, forecast, previous,
+                           actual_value, forecast_value, previous_value, unit
+                    FROM history_data
+                    WHERE indicator_id = ?
+                """
+                params = [indicator_id]
+
+                if start:
+                    query += " AND release_date >= ?"
+                    params.append(start)
+                if end:
+                    query += " AND release_date <= ?"
+                    params.append(end)
+
+                query += " ORDER BY release_date DESC"
+                if limit and limit > 0:
+                    query += " LIMIT ?"
+                    params.append(limit)
+
+                rows = conn.execute(query, tuple(params)).fetchall()
+
+                return [self._history_row_dict(row) for row in rows]
+        except Exception as e:
+            print(f"Error getting history range for {indicator_id}: {e}")
+            return []
+
+    def get_multiple_indicators_data(self, indicator_ids: List[str]) -> Dict[str, Any]:
+        """여러 지표 데이터를 한 번에 조회 (PostgreSQL 배치 API 와 동일한 응답 형태)
+
+        Returns:
+            {indicator_id: {"latest_release", "next_release", "last_updated", "timestamp"}}
+            (데이터가 없는 지표는 {"error": "No data found"})
+        """
+        if not indicator_ids:
+            return {}
+        try:
+            with self.get_connection() as conn:
+                placeholders = ",".join("?" for _ in indicator_ids)
+                params = tuple(indicator_ids)
+
+                # 지표별 최신 1행 (ROW_NUMBER 로 DISTINCT ON 대체)
+                latest_rows = conn.execute(f"""
+                    SELECT * FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY indicator_id ORDER BY created_at DESC, id DESC
+                        ) AS rn
+                        FROM latest_releases
+                        WHERE indicator_id IN ({placeholders})
+                    ) WHERE rn = 1
+                """, params).fetchall()
+
+                next_rows = conn.execute(f"""
+                    SELECT * FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY indicator_id ORDER BY created_at DESC, id DESC
+                        ) AS rn
+                        FROM next_releases
+                        WHERE indicator_id IN ({placeholders})
+                    ) WHERE rn = 1
+                """, params).fetchall()
+
+                crawl_rows = conn.execute(f"""
+                    SELECT indicator_id, MAX(last_crawl_time) AS last_crawl_time
+                    FROM crawl_info
+                    WHERE indicator_id IN ({placeholders})
+                    GROUP BY indicator_id
+                """, params).fetchall()
+
+            latest_dict = {row['indicator_id']: row for row in latest_rows}
+            next_dict = {row['indicator_id']: row for row in next_rows}
+            crawl_dict = {row['indicator_id']: row['last_crawl_time'] for row in crawl_rows}
+
+            result = {}
+            for indicator_id in indicator_ids:
+                latest_row = latest_dict.get(indicator_id)
+                if not latest_row:
+                    result[indicator_id] = {"error": "No data found"}
+                    continue
+
+                result[indicator_id] = {
+                    "latest_release": self._history_row_dict(latest_row),
+                    "next_release": self._next_release_dict(next_dict.get(indicator_id)),
+                    "last_updated": crawl_dict.get(indicator_id),
+                    "timestamp": datetime.now().isoformat()
+                }
+
+            return result
+
+        except Exception as e:
+            print(f"Error getting multiple indicators data: {e}")
+            return {indicator_id: {"error": str(e)} for indicator_id in indicator_ids}
+
+    def get_multiple_history_data(self, indicator_ids: List[str], limit: int = 12) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 지표의 히스토리 데이터를 한 번에 조회 (지표별 최신 limit 개)
+
+        Returns:
+            {indicator_id: [{"release_date", "time", "actual", ...}, ...]} (release_date 내림차순)
+        """
+        result = {indicator_id: [] for indicator_id in indicator_ids}
+        if not indicator_ids:
+            return result
+        try:
+            with self.get_connection() as conn:
+                placeholders = ",".join("?" for _ in indicator_ids)
+                query = f"""
+                    SELECT indicator_id, release_date, time, actual, forecast, previous,
+                           actual_value, forecast_value, previous_value, unit
+                    FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY indicator_id ORDER BY release_date DESC
+                        ) AS rn
+                        FROM history_data
+                        WHERE indicator_id IN ({placeholders})
+                    )
+                """
+                params = list(indicator_ids)
+                if limit and limit > 0:
+                    query += " WHERE rn <= ?"
+                    params.append(limit)
+                query += " ORDER BY indicator_id, release_date DESC"
+
+                rows = conn.execute(query, tuple(params)).fetchall()
+
+            for row in rows:
+                result[row['indicator_id']].append(self._history_row_dict(row))
+            return result
+
+        except Exception as e:
+            print(f"Error getting multiple history data: {e}")
+            return {indicator_id: [] for indicator_id in indicator_ids}
+
+    def get_latest_indicator(self, indicator_id: str) -> Optional[Dict]:
+        """특정 지표의 최신값 조회 (Cycle Engine용, PostgreSQL 과 동일한 응답 형태)"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute("""
+                    SELECT indicator_id, actual, forecast, previous,
+                           actual_value, forecast_value, previous_value, unit,
+                           release_date, time
+                    FROM latest_releases
+                    WHERE indicator_id = ?
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT 1
+                """, (indicator_id,)).fetchone()
+
+            if not row:
+                return None
+            row = dict(row)
+            return {**row, **release_values(row)}
+
+        except Exception as e:
+            print(f"SQLite get_latest_indicator error for {indicator_id}: {e}")
+            return None
+
     def get_all_indicators(self) -> List[str]:
         """모든 지표 ID 목록 조회"""
         try:
@@ -320,17 +599,151 @@ class DatabaseService:
             print(f"Error getting crawl info for {indicator_id}: {e}")
             return None
 
+    def get_multiple_crawl_info(self, indicator_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 지표의 크롤링 정보를 한 번에 조회 (기록이 없는 지표는 포함되지 않음)"""
+        if not indicator_ids:
+            return {}
+        try:
+            with self.get_connection() as conn:
+                placeholders = ",".join("?" for _ in indicator_ids)
+                rows = conn.execute(f"""
+                    SELECT * FROM crawl_info
+                    WHERE indicator_id IN ({placeholders})
+                    ORDER BY last_crawl_time ASC
+                """, tuple(indicator_ids)).fetchall()
+
+                # 최신 기록이 마지막에 오므로 덮어쓰기로 지표별 최신값만 남김
+                result = {}
+                for row in rows:
+                    result[row['indicator_id']] = {
+                        "indicator_id": row['indicator_id'],
+                        "last_crawl_time": row['last_crawl_time'],
+                        "status": row['status'],
+                        "error_message": row['error_message'],
+                        "data_count": row['data_count']
+                    }
+                return result
+        except Exception as e:
+            print(f"Error getting multiple crawl info: {e}")
+            return {}
+
+    def _write_crawl_info(self, conn, indicator_id: str, status: str, data_count: int = 0, error_message: str = None):
+        """crawl_info 갱신 (호출자의 트랜잭션 안에서 실행, 데이터 버전은 바꾸지 않음)"""
+        # 기존 레코드 삭제 후 새로 삽입 (최신 상태만 유지)
+        conn.execute("DELETE FROM crawl_info WHERE indicator_id = ?", (indicator_id,))
+        conn.execute("""
+            INSERT INTO crawl_info
+            (indicator_id, status, data_count, error_message)
+            VALUES (?, ?, ?, ?)
+        """, (indicator_id, status, data_count, error_message))
+
+    def _release_snapshot(self, conn, indicator_id: str) -> tuple:
+        """latest/next 행 내용 (id/created_at 제외, 저장 전후 비교용)"""
+        snapshot = []
+        for table in ('latest_releases', 'next_releases'):
+            rows = conn.execute(f"SELECT * FROM {table} WHERE indicator_id = ?", (indicator_id,)).fetchall()
+            snapshot.append(sorted(
+                tuple((key, row[key]) for key in row.keys() if key not in ('id', 'created_at'))
+                for row in rows
+            ))
+        return tuple(snapshot)
+
+    def _bump_data_version(self, conn, indicator_id: str) -> int:
+        """지표 데이터 버전 증가 (데이터 행이 바뀐 저장에서만, 호출자의 트랜잭션 안에서 실행)"""
+        # 쓰기 트랜잭션은 직렬화되므로 MAX+1 이 전역 시퀀스 역할을 한다
+        conn.execute("""
+            INSERT INTO indicator_data_versions (indicator_id, version)
+            VALUES (?, (SELECT COALESCE(MAX(version), 0) + 1 FROM indicator_data_versions))
+            ON CONFLICT (indicator_id) DO UPDATE SET
+                version = excluded.version,
+                updated_at = CURRENT_TIMESTAMP
+        """, (indicator_id,))
+        row = conn.execute(
+            "SELECT version FROM indicator_data_versions WHERE indicator_id = ?", (indicator_id,)
+        ).fetchone()
+        return int(row['version'])
+
+    def get_data_generation(self) -> Optional[int]:
+        """지표 데이터 전역 세대 번호 (어떤 지표든 데이터 행이 바뀌면 증가, 조회 실패 시 None)"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute(
+                    "SELECT COALESCE(MAX(version), 0) AS generation FROM indicator_data_versions"
+                ).fetchone()
+            return int(row['generation'])
+        except Exception as e:
+            print(f"Error getting data generation: {e}")
+            return None
+
+    def get_data_versions(self, indicator_ids: List[str] = None) -> Dict[str, int]:
+        """지표별 데이터 버전 {indicator_id: version} (저장 기록이 없는 지표는 포함되지 않음)"""
+        try:
+            with self.get_connection() as conn:
+                if indicator_ids is None:
+                    rows = conn.execute("SELECT indicator_id, version FROM indicator_data_versions").fetchall()
+                else:
+                    placeholders = ",".join("?" for _ in indicator_ids) or "NULL"
+                    rows = conn.execute(
+                        f"SELECT indicator_id, version FROM indicator_data_versions WHERE indicator_id IN ({placeholders})",
+                        tuple(indicator_ids)
+                    ).fetchall()
+            return {row['indicator_id']: int(row['version']) for row in rows}
+        except Exception as e:
+            print(f"Error getting data versions: {e}")
+            return {}
+
+    def get_fred_observations(self, windows: Dict[str, str]) -> Dict[str, List[Dict[str, Any]]]:
+        """저장된 FRED 원본 관측치
+
+        Args:
+            windows: {series_id: 시작일 YYYY-MM-DD}
+
+        Returns:
+            {series_id: [{date, value}, ...] (최신순)} - 저장된 관측치가 없는 시리즈는 빈 리스트
+        """
+        result = {series_id: [] for series_id in windows}
+        try:
+            with self.get_connection() as conn:
+                for series_id, start_date in windows.items():
+                    rows = conn.execute("""
+                        SELECT observation_date, value FROM fred_observations
+                        WHERE series_id = ? AND observation_date >= ?
+                        ORDER BY observation_date DESC
+                    """, (series_id, start_date)).fetchall()
+                    result[series_id] = [{'date': row['observation_date'], 'value': row['value']} for row in rows]
+        except Exception as e:
+            print(f"Error getting FRED observations: {e}")
+        return result
+
+    def save_fred_observations(self, observations: Dict[str, List[Dict[str, Any]]]) -> bool:
+        """FRED 원본 관측치 upsert ({series_id: [{date, value}, ...]})"""
+        rows = [
+            (series_id, row['date'], row['value'])
+            for series_id, series_rows in observations.items() for row in series_rows
+        ]
+        if not rows:
+            return True
+        try:
+            with self.get_connection() as conn:
+                conn.executemany("""
+                    INSERT INTO fred_observations (series_id, observation_date, value)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT (series_id, observation_date) DO UPDATE SET
+                        value = excluded.value,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE fred_observations.value IS NOT excluded.value
+                """, rows)
+                conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error saving FRED observations: {e}")
+            return False
+
     def update_crawl_info(self, indicator_id: str, status: str, data_count: int = 0, error_message: str = None):
         """크롤링 정보 업데이트"""
         try:
             with self.get_connection() as conn:
-                # 기존 레코드 삭제 후 새로 삽입 (최신 상태만 유지)
-                conn.execute("DELETE FROM crawl_info WHERE indicator_id = ?", (indicator_id,))
-                conn.execute("""
-                    INSERT INTO crawl_info
-                    (indicator_id, status, data_count, error_message)
-                    VALUES (?, ?, ?, ?)
-                """, (indicator_id, status, data_count, error_message))
+                self._write_crawl_info(conn, indicator_id, status, data_count, error_message)
                 conn.commit()
         except Exception as e:
             print(f"Error updating crawl info for {indicator_id}: {e}")
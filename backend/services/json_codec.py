@@ -0,0 +1,41 @@
+"""JSON 직렬화 (orjson 이 설치되어 있으면 사용, 없으면 표준 json)
+
+캐시/응답 본문을 bytes 로 한 번만 인코딩하기 위한 공용 함수.
+Decimal → float, date/datetime → ISO 문자열로 변환한다.
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """obj → UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """JSON bytes/str → obj"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
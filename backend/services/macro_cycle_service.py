@@ -15,6 +15,8 @@
 from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 
+from services.value_normalizer import release_number
+
 
 class MacroCycleService:
     """거시경제 사이클 계산 서비스"""
@@ -171,35 +173,35 @@ class MacroCycleService:
 
         # ISM 제조업 PMI (30점 만점)
         if 'ism-manufacturing' in data:
-            pmi = self._parse_value(data['ism-manufacturing'].get('actual'))
+            pmi = self._release_value(data['ism-manufacturing'])
             scores['ism_manufacturing'] = self._score_pmi(pmi)
         else:
             scores['ism_manufacturing'] = 50.0  # 중립
 
         # ISM 비제조업 PMI (20점 만점)
         if 'ism-non-manufacturing' in data:
-            pmi = self._parse_value(data['ism-non-manufacturing'].get('actual'))
+            pmi = self._release_value(data['ism-non-manufacturing'])
             scores['ism_non_manufacturing'] = self._score_pmi(pmi)
         else:
             scores['ism_non_manufacturing'] = 50.0
 
         # 근원 CPI (20점 만점)
         if 'core-cpi' in data:
-            cpi = self._parse_value(data['core-cpi'].get('actual'))
+            cpi = self._release_value(data['core-cpi'])
             scores['core_cpi'] = self._score_inflation(cpi)
         else:
             scores['core_cpi'] = 50.0
 
         # 연준 기준금리 (15점 만점)
         if 'federal-funds-rate' in data:
-            rate = self._parse_value(data['federal-funds-rate'].get('actual'))
+            rate = self._release_value(data['federal-funds-rate'])
             scores['fed_funds_rate'] = self._score_interest_rate(rate)
         else:
             scores['fed_funds_rate'] = 50.0
 
         # 장단기금리차 (15점 만점)
         if 'yield-curve-10y-2y' in data:
-            curve = self._parse_value(data['yield-curve-10y-2y'].get('actual'))
+            curve = self._release_value(data['yield-curve-10y-2y'])
             scores['yield_curve'] = self._score_yield_curve(curve)
         else:
             scores['yield_curve'] = 50.0
@@ -317,29 +319,10 @@ class MacroCycleService:
         else:
             return 40
 
-    def _parse_value(self, value) -> float:
-        """지표 값 파싱 (%, K 단위 처리)"""
-        if value is None:
-            return 0.0
-
-        if isinstance(value, (int, float)):
-            return float(value)
-
-        # 문자열 처리
-        value_str = str(value).strip()
-
-        # % 제거
-        if value_str.endswith('%'):
-            value_str = value_str[:-1]
-
-        # K 단위 처리 (예: "218K" → 218)
-        if value_str.endswith('K'):
-            value_str = value_str[:-1]
-
-        try:
-            return float(value_str)
-        except ValueError:
-            return 0.0
+    def _release_value(self, release: Dict) -> float:
+        """지표 최신값 (저장 시 정규화된 actual_value 사용, 없으면 0.0)"""
+        value = release_number(release)
+        return value if value is not None else 0.0
 
     def _error_response(self, message: str) -> Dict:
         """에러 응답"""
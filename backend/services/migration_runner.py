@@ -0,0 +1,174 @@
+"""PostgreSQL 스키마 마이그레이션 (버전 관리)
+
+- backend/migrations/NNNN_<name>.sql 파일을 번호 순서대로 적용
+- 적용 이력은 schema_version 테이블에 기록 (버전, 이름, 체크섬)
+- 적용은 `python migrate.py apply` 로 1회, 워커 시작 시에는 버전만 확인
+- 여러 워커가 동시에 적용하지 않도록 advisory lock 사용
+"""
+
+import hashlib
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d{4})_([A-Za-z0-9_\-]+)\.sql$")
+
+# pg_advisory_xact_lock 키 (임의의 고정값)
+MIGRATION_LOCK_ID = 7240611
+
+SCHEMA_VERSION_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        checksum TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+class SchemaVersionError(Exception):
+    """DB 스키마 버전이 코드가 기대하는 버전보다 낮은 경우"""
+
+
+class Migration:
+    """마이그레이션 파일 1개"""
+
+    def __init__(self, version: int, name: str, path: str):
+        self.version = version
+        self.name = name
+        self.path = path
+        self._sql: Optional[str] = None
+
+    @property
+    def sql(self) -> str:
+        if self._sql is None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._sql = f.read()
+        return self._sql
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+    def __repr__(self) -> str:
+        return f"Migration({self.version:04d}_{self.name})"
+
+
+def load_migrations(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """마이그레이션 파일 목록 (버전 오름차순)"""
+    migrations: Dict[int, Migration] = {}
+    if not os.path.isdir(directory):
+        return []
+
+    for filename in os.listdir(directory):
+        match = MIGRATION_FILE_PATTERN.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(
+                f"Duplicate migration version {version:04d}: "
+                f"{os.path.basename(migrations[version].path)}, {filename}"
+            )
+        migrations[version] = Migration(version, match.group(2), os.path.join(directory, filename))
+
+    return [migrations[version] for version in sorted(migrations)]
+
+
+class MigrationRunner:
+    """schema_version 기반 마이그레이션 적용/확인
+
+    Args:
+        connection_factory: `with connection_factory() as conn:` 형태로 커넥션을 돌려주는 함수
+            (PostgresDatabaseService.get_connection 또는 pool.connection)
+        directory: 마이그레이션 파일 디렉토리
+    """
+
+    def __init__(self, connection_factory: Callable[[], Any], directory: str = MIGRATIONS_DIR):
+        self.connection_factory = connection_factory
+        self.migrations = load_migrations(directory)
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    def applied_versions(self) -> Dict[int, Dict[str, Any]]:
+        """적용된 마이그레이션 {version: row} (schema_version 테이블이 없으면 빈 dict)"""
+        with self.connection_factory() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT to_regclass('schema_version') AS regclass")
+                row = cur.fetchone()
+                if not row or row["regclass"] is None:
+                    return {}
+                cur.execute("SELECT version, name, checksum, applied_at FROM schema_version ORDER BY version")
+                return {row["version"]: dict(row) for row in cur.fetchall()}
+
+    def status(self) -> Dict[str, Any]:
+        """현재 버전/대기 중 마이그레이션/체크섬 불일치"""
+        applied = self.applied_versions()
+        pending = [m for m in self.migrations if m.version not in applied]
+        modified = [
+            m for m in self.migrations
+            if m.version in applied and applied[m.version]["checksum"] != m.checksum
+        ]
+        return {
+            "current_version": max(applied) if applied else 0,
+            "latest_version": self.latest_version,
+            "applied": [applied[v] for v in sorted(applied)],
+            "pending": pending,
+            "modified": modified,
+        }
+
+    def verify(self):
+        """DB 가 최신 버전인지 확인 (워커 시작 시 호출, 쿼리 1~2회)
+
+        Raises:
+            SchemaVersionError: 적용되지 않은 마이그레이션이 있는 경우
+        """
+        status = self.status()
+        for migration in status["modified"]:
+            print(f"⚠️ Migration {migration.version:04d}_{migration.name} changed after it was applied")
+        if status["pending"]:
+            names = ", ".join(f"{m.version:04d}_{m.name}" for m in status["pending"])
+            raise SchemaVersionError(
+                f"Database schema is at version {status['current_version']}, "
+                f"expected {status['latest_version']} (pending: {names}). "
+                f"Run `python migrate.py apply`."
+            )
+        return status
+
+    def apply(self, target: Optional[int] = None) -> List[Migration]:
+        """대기 중인 마이그레이션을 순서대로 적용 (각각 별도 트랜잭션)
+
+        Args:
+            target: 이 버전까지만 적용 (None 이면 최신까지)
+
+        Returns:
+            이번에 적용된 마이그레이션 목록
+        """
+        applied_now: List[Migration] = []
+        for migration in self.migrations:
+            if target is not None and migration.version > target:
+                break
+
+            with self.connection_factory() as conn:
+                with conn.cursor() as cur:
+                    # 동시에 시작한 다른 워커/CLI 와 직렬화 (트랜잭션 종료 시 자동 해제)
+                    cur.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+                    cur.execute(SCHEMA_VERSION_DDL)
+                    cur.execute("SELECT 1 FROM schema_version WHERE version = %s", (migration.version,))
+                    if cur.fetchone():
+                        continue
+
+                    print(f"Applying migration {migration.version:04d}_{migration.name}...")
+                    cur.execute(migration.sql)
+                    cur.execute(
+                        "INSERT INTO schema_version (version, name, checksum) VALUES (%s, %s, %s)",
+                        (migration.version, migration.name, migration.checksum)
+                    )
+                conn.commit()
+            applied_now.append(migration)
+
+        return applied_now
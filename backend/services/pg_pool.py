@@ -0,0 +1,313 @@
+"""PostgreSQL 커넥션 풀 (스레드 안전)
+
+- gunicorn 워커 + 백그라운드 크롤링 스레드에서 공유
+- 체크아웃 시 헬스체크, 깨진 커넥션 폐기/재생성
+- 사용 중/대기 중/대기 시간 통계 제공
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
+
+
+class PoolTimeoutError(Exception):
+    """풀에서 커넥션을 제한 시간 내에 얻지 못한 경우"""
+
+
+class PooledConnection:
+    """`with pool.connection() as conn:` 형태로 사용하는 체크아웃 핸들
+
+    psycopg2 커넥션의 컨텍스트 매니저와 동일하게 정상 종료 시 commit,
+    예외 발생 시 rollback 후 커넥션을 풀에 반납한다.
+    """
+
+    def __init__(self, pool: "PostgresConnectionPool"):
+        self._pool = pool
+        self._conn = None
+
+    def __enter__(self):
+        self._conn = self._pool.getconn()
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return False
+
+        broken = False
+        try:
+            if not conn.closed:
+                if exc_type is None:
+                    conn.commit()
+                else:
+                    conn.rollback()
+        except Exception:
+            broken = True
+        finally:
+            self._pool.putconn(conn, broken=broken)
+        return False
+
+
+class PostgresConnectionPool:
+    """min/max 크기를 가진 블로킹 커넥션 풀"""
+
+    def __init__(
+        self,
+        database_url: str,
+        min_size: int = None,
+        max_size: int = None,
+        timeout: float = None,
+        health_check_interval: float = None,
+        max_lifetime: float = None,
+        connect_timeout: int = 10,
+    ):
+        self.database_url = database_url
+        self.min_size = max(0, min_size if min_size is not None else int(os.getenv("DB_POOL_MIN", "1")))
+        self.max_size = max(1, max_size if max_size is not None else int(os.getenv("DB_POOL_MAX", "10")))
+        self.min_size = min(self.min_size, self.max_size)
+        # 커넥션을 기다리는 최대 시간 (초)
+        self.timeout = timeout if timeout is not None else float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        # 이 시간 이상 유휴였던 커넥션만 SELECT 1 로 확인 (매 체크아웃마다 왕복 방지)
+        self.health_check_interval = (
+            health_check_interval if health_check_interval is not None
+            else float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30"))
+        )
+        # 이 시간이 지난 커넥션은 반납 시 폐기 (서버측 idle timeout 대비)
+        self.max_lifetime = (
+            max_lifetime if max_lifetime is not None
+            else float(os.getenv("DB_POOL_MAX_LIFETIME", "1800"))
+        )
+        self.connect_timeout = connect_timeout
+
+        self._cond = threading.Condition(threading.Lock())
+        # (conn, last_used_at)
+        self._idle: List[Any] = []
+        self._in_use: Dict[int, float] = {}
+        self._created_at: Dict[int, float] = {}
+        self._total = 0
+        self._pid = os.getpid()
+        self._closed = False
+
+        self._stats = {
+            "connections_created": 0,
+            "connections_discarded": 0,
+            "checkouts": 0,
+            "timeouts": 0,
+            "health_check_failures": 0,
+            "wait_count": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+        }
+        self._waiting = 0
+
+        for _ in range(self.min_size):
+            try:
+                conn = self._connect()
+            except Exception as e:
+                print(f"DB pool warm-up connection failed: {e}")
+                break
+            with self._cond:
+                self._total += 1
+                self._idle.append((conn, time.time()))
+
+    def _connect(self):
+        conn = psycopg2.connect(
+            self.database_url,
+            cursor_factory=psycopg2.extras.RealDictCursor,
+            connect_timeout=self.connect_timeout
+        )
+        with self._cond:
+            self._created_at[id(conn)] = time.time()
+            self._stats["connections_created"] += 1
+        return conn
+
+    def _discard(self, conn):
+        """커넥션 폐기 (호출자가 락을 잡지 않은 상태에서 호출)"""
+        with self._cond:
+            self._created_at.pop(id(conn), None)
+            self._stats["connections_discarded"] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _check_fork(self):
+        """fork 된 자식 프로세스는 부모의 소켓을 공유하지 않도록 풀을 비운다"""
+        if os.getpid() != self._pid:
+            with self._cond:
+                self._idle = []
+                self._in_use = {}
+                self._created_at = {}
+                self._total = 0
+                self._pid = os.getpid()
+
+    def _is_healthy(self, conn, last_used: float) -> bool:
+        if conn.closed:
+            return False
+        if conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            return False
+        if time.time() - last_used < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                cur.fetchone()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def getconn(self):
+        """풀에서 커넥션 체크아웃 (없으면 생성, max 도달 시 대기)"""
+        self._check_fork()
+        deadline = time.monotonic() + self.timeout
+        wait_started = None
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    if wait_started is not None:
+                        self._waiting -= 1
+                    raise PoolTimeoutError("Connection pool is closed")
+
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+
+                if self._total < self.max_size:
+                    self._total += 1
+                    conn, last_used = None, None
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if wait_started is not None:
+                        self._waiting -= 1
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeoutError(
+                        f"Timed out after {self.timeout}s waiting for a database connection "
+                        f"(max_size={self.max_size})"
+                    )
+                if wait_started is None:
+                    wait_started = time.monotonic()
+                    self._waiting += 1
+                self._cond.wait(remaining)
+
+            if wait_started is not None:
+                self._waiting -= 1
+                waited = time.monotonic() - wait_started
+                self._stats["wait_count"] += 1
+                self._stats["wait_time_total"] += waited
+                self._stats["wait_time_max"] = max(self._stats["wait_time_max"], waited)
+
+        # 네트워크 I/O 는 락 밖에서 수행
+        if conn is not None and not self._is_healthy(conn, last_used):
+            with self._cond:
+                self._stats["health_check_failures"] += 1
+            self._discard(conn)
+            conn = None
+
+        if conn is None:
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._cond:
+                    self._total -= 1
+                    self._cond.notify()
+                raise
+
+        with self._cond:
+            self._in_use[id(conn)] = time.time()
+            self._stats["checkouts"] += 1
+        return conn
+
+    def putconn(self, conn, broken: bool = False):
+        """커넥션 반납 (깨졌거나 수명이 지난 커넥션은 폐기)"""
+        if os.getpid() != self._pid:
+            return
+
+        if not broken:
+            if conn.closed:
+                broken = True
+            else:
+                status = conn.info.transaction_status
+                if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                    broken = True
+                elif status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    # 커밋되지 않은 트랜잭션이 남아 있으면 정리 후 반납
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        broken = True
+
+        created_at = self._created_at.get(id(conn), 0)
+        expired = self.max_lifetime > 0 and (time.time() - created_at) > self.max_lifetime
+
+        discard = broken or expired or self._closed
+        with self._cond:
+            self._in_use.pop(id(conn), None)
+            if discard:
+                self._total -= 1
+            else:
+                self._idle.append((conn, time.time()))
+            self._cond.notify()
+        if discard:
+            self._discard(conn)
+
+    def connection(self) -> PooledConnection:
+        return PooledConnection(self)
+
+    def closeall(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 통계 (헬스체크/모니터링용)"""
+        with self._cond:
+            wait_count = self._stats["wait_count"]
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._total,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "waiting": self._waiting,
+                "checkouts": self._stats["checkouts"],
+                "connections_created": self._stats["connections_created"],
+                "connections_discarded": self._stats["connections_discarded"],
+                "health_check_failures": self._stats["health_check_failures"],
+                "timeouts": self._stats["timeouts"],
+                "wait_count": wait_count,
+                "wait_time_total_ms": round(self._stats["wait_time_total"] * 1000, 2),
+                "wait_time_avg_ms": round(self._stats["wait_time_total"] / wait_count * 1000, 2) if wait_count else 0.0,
+                "wait_time_max_ms": round(self._stats["wait_time_max"] * 1000, 2),
+            }
+
+
+_POOLS: Dict[str, PostgresConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(database_url: str) -> PostgresConnectionPool:
+    """DATABASE_URL 별 프로세스 공유 풀 반환"""
+    pool: Optional[PostgresConnectionPool] = _POOLS.get(database_url)
+    if pool is not None and pool._pid == os.getpid() and not pool._closed:
+        return pool
+
+    with _POOLS_LOCK:
+        pool = _POOLS.get(database_url)
+        if pool is None or pool._pid != os.getpid() or pool._closed:
+            pool = PostgresConnectionPool(database_url)
+            _POOLS[database_url] = pool
+            print(f"PostgreSQL connection pool created (min={pool.min_size}, max={pool.max_size})")
+        return pool
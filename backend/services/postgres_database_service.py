@@ -11,6 +11,19 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 from urllib.parse import urlparse
 
+from services.data_generation import data_generation
+from services.migration_runner import MigrationRunner, SchemaVersionError
+from services.pg_pool import get_pool
+from services.value_normalizer import normalize_release, release_values
+
+# 자산 1건이 portfolio_totals 에 기여하는 값 (get_all_assets 의 원금/평가액 대체 규칙과 동일)
+PORTFOLIO_CONTRIBUTION_COLUMNS = """
+    user_id,
+    COALESCE(amount, 0) AS total_assets,
+    COALESCE(NULLIF(principal, 0), NULLIF(amount, 0), 0) AS total_principal,
+    COALESCE(NULLIF(eval_amount, 0), NULLIF(amount, 0), 0) AS total_eval_amount
+"""
+
 class PostgresDatabaseService:
     """PostgreSQL 데이터베이스 서비스 클래스"""
 
@@ -27,465 +40,372 @@ class PostgresDatabaseService:
 
         # URL 파싱
         self.parsed_url = urlparse(self.database_url)
+
+        # 프로세스 공유 커넥션 풀 (DB_POOL_MIN / DB_POOL_MAX 로 크기 조정)
+        self.pool = get_pool(self.database_url)
         self.init_database()
 
     def init_database(self):
-        """데이터베이스 초기화 및 스키마 생성"""
+        """스키마 버전 확인 (DDL 은 migrations/ 파일로 관리, `python migrate.py apply` 로 1회 적용)
+
+        DB_AUTO_MIGRATE=true(기본값)이면 대기 중인 마이그레이션을 이 자리에서 적용한다.
+        최신 버전이면 schema_version 조회만 수행한다.
+        """
+        runner = MigrationRunner(self.get_connection)
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cur:
-                    # 테이블 생성
-                    schema_sql = """
-                    CREATE TABLE IF NOT EXISTS indicators (
-                        id SERIAL PRIMARY KEY,
-                        indicator_id TEXT UNIQUE NOT NULL,
-                        name TEXT NOT NULL,
-                        url TEXT NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    );
-
-                    CREATE TABLE IF NOT EXISTS latest_releases (
-                        id SERIAL PRIMARY KEY,
-                        indicator_id TEXT NOT NULL,
-                        release_date TEXT NOT NULL,
-                        time TEXT,
-                        actual TEXT,
-                        forecast TEXT,
-                        previous TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    );
-
-                    CREATE TABLE IF NOT EXISTS next_releases (
-                        id SERIAL PRIMARY KEY,
-                        indicator_id TEXT NOT NULL,
-                        release_date TEXT NOT NULL,
-                        time TEXT,
-                        forecast TEXT,
-                        previous TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    );
-
-                    CREATE TABLE IF NOT EXISTS history_data (
-                        id SERIAL PRIMARY KEY,
-                        indicator_id TEXT NOT NULL,
-                        release_date TEXT NOT NULL,
-                        time TEXT,
-                        actual TEXT,
-                        forecast TEXT,
-                        previous TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    );
-
-                    CREATE TABLE IF NOT EXISTS crawl_info (
-                        id SERIAL PRIMARY KEY,
-                        indicator_id TEXT NOT NULL,
-                        last_crawl_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        status TEXT DEFAULT 'success',
-                        error_message TEXT,
-                        data_count INTEGER DEFAULT 0
-                    );
-
-                    CREATE TABLE IF NOT EXISTS users (
-                        id SERIAL PRIMARY KEY,
-                        username VARCHAR(50) UNIQUE NOT NULL,
-                        password_hash VARCHAR(255) NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    );
-
-                    CREATE TABLE IF NOT EXISTS assets (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        asset_type VARCHAR(50),
-                        sub_category VARCHAR(50),
-                        name VARCHAR(100),
-                        amount NUMERIC,
-                        quantity NUMERIC,
-                        avg_price NUMERIC,
-                        eval_amount NUMERIC,
-                        principal NUMERIC,
-                        profit_loss NUMERIC DEFAULT 0,
-                        profit_rate NUMERIC DEFAULT 0,
-                        date DATE,
-                        note TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-                        -- 부동산 전용 필드
-                        area_pyeong NUMERIC, -- 면적(평수)
-                        acquisition_tax NUMERIC, -- 취득세
-                        rent_type VARCHAR(20) DEFAULT 'monthly', -- 임대유형 ('monthly', 'jeonse')
-                        rental_income NUMERIC, -- 임대수익(월세)
-                        jeonse_deposit NUMERIC, -- 전세보증금
-
-                        -- 예금/적금 전용 필드
-                        maturity_date DATE, -- 만기일
-                        interest_rate NUMERIC, -- 연이율(%)
-                        early_withdrawal_fee NUMERIC, -- 중도해지수수료
-
-                        -- MMF/CMA 전용 필드
-                        current_yield NUMERIC, -- 현재수익률(%)
-                        annual_yield NUMERIC, -- 연환산수익률(%)
-                        minimum_balance NUMERIC, -- 최소유지잔고
-                        withdrawal_fee NUMERIC, -- 출금수수료
-
-                        -- 주식/ETF 전용 필드
-                        dividend_rate NUMERIC, -- 배당율(%)
-
-                        -- 펀드 전용 필드
-                        nav NUMERIC, -- 기준가격
-                        management_fee NUMERIC -- 운용보수(%)
-                    );
-
-                    CREATE TABLE IF NOT EXISTS goal_settings (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        total_goal NUMERIC NOT NULL DEFAULT 50000000,
-                        target_date DATE NOT NULL DEFAULT '2024-12-31',
-                        category_goals JSONB DEFAULT '{}',
-                        sub_category_goals JSONB DEFAULT '{}',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(user_id)
-                    );
-
-                    CREATE TABLE IF NOT EXISTS portfolio_history (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        total_assets NUMERIC DEFAULT 0,
-                        total_principal NUMERIC DEFAULT 0,
-                        total_eval_amount NUMERIC DEFAULT 0,
-                        change_type VARCHAR(20), -- 'add', 'update', 'delete'
-                        change_amount NUMERIC DEFAULT 0,
-                        asset_id INTEGER,
-                        asset_name VARCHAR(100),
-                        notes TEXT,
-                        is_daily_summary BOOLEAN DEFAULT FALSE
-                    );
-
-                    -- 기존 테이블에 새 컬럼 추가 (테이블이 이미 존재하는 경우)
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS user_id INTEGER;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS sub_category VARCHAR(50);
-                    ALTER TABLE goal_settings ADD COLUMN IF NOT EXISTS sub_category_goals JSONB DEFAULT '{}';
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS principal NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS profit_loss NUMERIC DEFAULT 0;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS profit_rate NUMERIC DEFAULT 0;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
-
-                    -- 소분류별 전용 필드 추가
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS area_pyeong NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS acquisition_tax NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS rental_income NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS lawyer_fee NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS brokerage_fee NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS maturity_date DATE;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS interest_rate NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS early_withdrawal_fee NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS current_yield NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS annual_yield NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS minimum_balance NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS withdrawal_fee NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS dividend_rate NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS nav NUMERIC;
-                    ALTER TABLE assets ADD COLUMN IF NOT EXISTS management_fee NUMERIC;
-
-                    -- 기존 assets 데이터에 기본 user_id 설정 (NULL인 경우에만)
-                    UPDATE assets SET user_id = 1 WHERE user_id IS NULL;
-
-                    -- 가계부/지출관리 테이블 생성
-                    CREATE TABLE IF NOT EXISTS expenses (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        transaction_type VARCHAR(10) NOT NULL CHECK (transaction_type IN ('수입', '지출')),
-                        amount NUMERIC NOT NULL CHECK (amount > 0),
-                        category VARCHAR(50) NOT NULL,
-                        subcategory VARCHAR(50) NOT NULL,
-                        description TEXT,
-                        payment_method VARCHAR(30) DEFAULT '현금',
-                        transaction_date DATE NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    );
-
-                    CREATE TABLE IF NOT EXISTS budgets (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        category VARCHAR(50) NOT NULL,
-                        subcategory VARCHAR(50),
-                        monthly_budget NUMERIC NOT NULL CHECK (monthly_budget >= 0),
-                        year INTEGER NOT NULL,
-                        month INTEGER NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(user_id, category, subcategory, year, month)
-                    );
-
-                    -- 경제지표 사용자 해석 테이블
-                    CREATE TABLE IF NOT EXISTS indicator_interpretations (
-                        id SERIAL PRIMARY KEY,
-                        indicator_id TEXT UNIQUE NOT NULL,
-                        user_interpretation TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    );
-
-                    -- 인덱스 생성
-                    CREATE INDEX IF NOT EXISTS idx_latest_releases_indicator_id ON latest_releases(indicator_id);
-                    CREATE INDEX IF NOT EXISTS idx_next_releases_indicator_id ON next_releases(indicator_id);
-                    CREATE INDEX IF NOT EXISTS idx_history_data_indicator_id ON history_data(indicator_id);
-                    CREATE INDEX IF NOT EXISTS idx_crawl_info_indicator_id ON crawl_info(indicator_id);
-                    CREATE INDEX IF NOT EXISTS idx_indicator_interpretations_id ON indicator_interpretations(indicator_id);
-
-                    -- 가계부 테이블 인덱스 (성능 최적화)
-                    CREATE INDEX IF NOT EXISTS idx_expenses_user_date ON expenses(user_id, transaction_date DESC);
-                    CREATE INDEX IF NOT EXISTS idx_expenses_user_category ON expenses(user_id, category, subcategory);
-                    CREATE INDEX IF NOT EXISTS idx_expenses_date_type ON expenses(transaction_date, transaction_type);
-                    CREATE INDEX IF NOT EXISTS idx_budgets_user_period ON budgets(user_id, year, month);
-
-                    -- 투자 철학 테이블 (MASTER_PLAN Page 1)
-                    CREATE TABLE IF NOT EXISTS investment_philosophy (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE UNIQUE,
-
-                        -- 투자 목표 (Section 1)
-                        goal JSONB DEFAULT '{
-                            "targetReturn": 10,
-                            "riskTolerance": {"volatility": 15, "maxDrawdown": 20, "maxLeverage": 1},
-                            "timeHorizon": {"start": "2025-01-01", "target": "2030-12-31", "years": 5}
-                        }',
-
-                        -- 금지 자산 (Section 2)
-                        forbidden_assets JSONB DEFAULT '[]',
-
-                        -- 운용 범위 (Section 3)
-                        allocation_range JSONB DEFAULT '[]',
-
-                        -- 투자 원칙 (Section 4)
-                        principles JSONB DEFAULT '[]',
-
-                        -- 투자 방법 (Section 5)
-                        methods JSONB DEFAULT '[]',
-
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    );
-
-                    CREATE INDEX IF NOT EXISTS idx_investment_philosophy_user_id ON investment_philosophy(user_id);
-
-                    -- 자산 개별분석 테이블 (5개 탭 구조)
-                    CREATE TABLE IF NOT EXISTS asset_analysis (
-                        id SERIAL PRIMARY KEY,
-                        asset_id INTEGER REFERENCES assets(id) ON DELETE CASCADE,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-
-                        -- ① 투자 가설 (Investment Thesis)
-                        thesis JSONB DEFAULT '{}',
-
-                        -- ② 검증: 펀더멘털 (Validation: Fundamentals)
-                        validation JSONB DEFAULT '{}',
-
-                        -- ③ 가격과 기대치 (Price & Expectation)
-                        pricing JSONB DEFAULT '{}',
-
-                        -- ④ 타이밍 & 리스크 (Timing & Risk)
-                        timing JSONB DEFAULT '{}',
-
-                        -- ⑤ 결정 & 관리 (Decision & Management)
-                        decision JSONB DEFAULT '{}',
-
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(asset_id, user_id)
-                    );
-
-                    CREATE INDEX IF NOT EXISTS idx_asset_analysis_asset_id ON asset_analysis(asset_id);
-                    CREATE INDEX IF NOT EXISTS idx_asset_analysis_user_id ON asset_analysis(user_id);
-
-                    -- 섹터 성과 테이블 (Page 3: Industries)
-                    CREATE TABLE IF NOT EXISTS sector_performance (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        date DATE NOT NULL,
-                        sector VARCHAR(100) NOT NULL,  -- 섹터명 (예: Technology, Healthcare)
-                        performance NUMERIC,            -- 성과 (%)
-                        relative_strength NUMERIC,      -- 상대강도 지수
-                        notes TEXT,                     -- 메모
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(user_id, date, sector)
-                    );
-
-                    CREATE INDEX IF NOT EXISTS idx_sector_performance_user_date ON sector_performance(user_id, date DESC);
-
-                    -- 관심 종목 테이블 (Page 3: Industries)
-                    CREATE TABLE IF NOT EXISTS watchlist (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        symbol VARCHAR(20) NOT NULL,    -- 티커 심볼 (예: AAPL, TSLA)
-                        name VARCHAR(200) NOT NULL,     -- 종목명
-                        sector VARCHAR(100),            -- 섹터
-                        current_price NUMERIC,          -- 현재가
-                        target_price NUMERIC,           -- 목표가
-                        notes TEXT,                     -- 투자 근거/메모
-                        alert_enabled BOOLEAN DEFAULT false,  -- 알림 활성화
-                        alert_price NUMERIC,            -- 알림 가격
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(user_id, symbol)
-                    );
-
-                    CREATE INDEX IF NOT EXISTS idx_watchlist_user ON watchlist(user_id);
-                    CREATE INDEX IF NOT EXISTS idx_watchlist_symbol ON watchlist(symbol);
-
-                    -- 산업군 분석 테이블 (Page 3: Industries - 새로운 산업군 분석 시스템)
-                    CREATE TABLE IF NOT EXISTS industry_analysis (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        major_category VARCHAR(50) NOT NULL,     -- 6대 산업군
-                        sub_industry VARCHAR(100) NOT NULL,      -- 하위 산업명
-                        analysis_data JSONB NOT NULL DEFAULT '{
-                            "core_technology": {"definition": "", "stage": "상용화", "innovation_path": ""},
-                            "macro_impact": {"interest_rate": "", "exchange_rate": "", "commodities": "", "policy": ""},
-                            "growth_drivers": {"internal": "", "external": "", "kpi": ""},
-                            "value_chain": {"flow": "", "profit_pool": "", "bottleneck": ""},
-                            "supply_demand": {
-                                "demand": {"end_user": "", "long_term": "", "sensitivity": ""},
-                                "supply": {"players": "", "capacity": "", "barriers": ""},
-                                "catalysts": ""
-                            },
-                            "market_map": {"structure": "", "competition": "", "moat": "", "lifecycle": ""}
-                        }'::jsonb,
-                        leading_stocks TEXT[] DEFAULT '{}',      -- 대표 대형주
-                        emerging_stocks TEXT[] DEFAULT '{}',     -- 중소형 유망주
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(user_id, major_category, sub_industry)
-                    );
-
-                    CREATE INDEX IF NOT EXISTS idx_industry_analysis_user ON industry_analysis(user_id);
-                    CREATE INDEX IF NOT EXISTS idx_industry_analysis_major ON industry_analysis(major_category);
-                    """
+            status = runner.verify()
+            print(f"PostgreSQL schema version {status['current_version']} verified")
+        except SchemaVersionError as e:
+            if os.getenv('DB_AUTO_MIGRATE', 'true').lower() not in ('1', 'true', 'yes'):
+                print(f"Database schema check failed: {e}")
+                raise
+            print(f"{e} Applying automatically (DB_AUTO_MIGRATE)...")
+            applied = runner.apply()
+            print(f"PostgreSQL migrations applied: {[f'{m.version:04d}_{m.name}' for m in applied]}")
 
-                    print("Executing PostgreSQL schema initialization...")
-                    cur.execute(schema_sql)
-                    conn.commit()
-                    print("PostgreSQL database initialized successfully")
+    def get_connection(self):
+        """풀에서 데이터베이스 연결 체크아웃
 
-                    # user_id 컬럼 존재 여부 확인
-                    cur.execute("""
-                        SELECT column_name
-                        FROM information_schema.columns
-                        WHERE table_name = 'assets' AND column_name = 'user_id'
-                    """)
-                    user_id_column = cur.fetchone()
-                    print(f"user_id column exists in assets table: {user_id_column is not None}")
+        `with self.get_connection() as conn:` 블록 종료 시 commit/rollback 후
+        커넥션이 풀로 반납된다.
+        """
+        return self.pool.connection()
 
-                    # 부동산 월세/전세 컬럼 존재 여부 확인 및 추가
-                    cur.execute("""
-                        SELECT column_name
-                        FROM information_schema.columns
-                        WHERE table_name = 'assets' AND column_name = 'rent_type'
-                    """)
-                    rent_type_column = cur.fetchone()
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 통계 (사용 중/대기 중/대기 시간)"""
+        return self.pool.stats()
 
-                    if rent_type_column is None:
-                        print("Adding rent_type and jeonse_deposit columns to assets table...")
-                        cur.execute("""
-                            ALTER TABLE assets
-                            ADD COLUMN rent_type VARCHAR(20) DEFAULT 'monthly',
-                            ADD COLUMN jeonse_deposit NUMERIC
-                        """)
-                        conn.commit()
-                        print("Successfully added rent_type and jeonse_deposit columns")
-                    else:
-                        print("rent_type column already exists")
+    @staticmethod
+    def _to_db_text(value: Any) -> Optional[str]:
+        """actual/forecast/previous 값을 TEXT 컬럼 저장 형식으로 변환"""
+        return str(value) if value is not None else None
+
+    @classmethod
+    def _release_columns(cls, release: Dict[str, Any], include_actual: bool = True) -> tuple:
+        """원문 + 숫자/단위 컬럼 값 튜플
+
+        include_actual=True:  (actual, forecast, previous, actual_value, forecast_value, previous_value, unit)
+        include_actual=False: (forecast, previous, forecast_value, previous_value, unit)
+        """
+        actual = release.get('actual') if include_actual else None
+        normalized = normalize_release(actual, release.get('forecast'), release.get('previous'))
+        if include_actual:
+            return (
+                cls._to_db_text(actual),
+                cls._to_db_text(release.get('forecast')),
+                cls._to_db_text(release.get('previous')),
+                normalized['actual_value'],
+                normalized['forecast_value'],
+                normalized['previous_value'],
+                normalized['unit']
+            )
+        return (
+            cls._to_db_text(release.get('forecast')),
+            cls._to_db_text(release.get('previous')),
+            normalized['forecast_value'],
+            normalized['previous_value'],
+            normalized['unit']
+        )
+
+    def _collect_indicator_rows(self, items: Dict[str, Dict[str, Any]]) -> Dict[str, list]:
+        """크롤링 결과를 테이블별 upsert 행 목록으로 변환"""
+        latest_rows = []
+        next_rows = []
+        clear_next_ids = []
+        history_rows = []
+        crawl_rows = []
+
+        for indicator_id, crawled_data in items.items():
+            latest = crawled_data.get('latest_release')
+            if latest:
+                latest_rows.append((
+                    indicator_id,
+                    latest.get('release_date'),
+                    latest.get('time'),
+                    *self._release_columns(latest)
+                ))
+
+            next_rel = crawled_data.get('next_release')
+            if next_rel:
+                next_rows.append((
+                    indicator_id,
+                    next_rel.get('release_date'),
+                    next_rel.get('time'),
+                    *self._release_columns(next_rel, include_actual=False)
+                ))
+            else:
+                # 다음 릴리즈가 없어졌으면 이전 예정 정보 제거
+                clear_next_ids.append(indicator_id)
+
+            # 같은 배치 안의 중복 release_date 는 첫 행(최신)만 사용
+            history_table = crawled_data.get('history_table') or []
+            seen_dates = set()
+            for row in history_table:
+                release_date = row.get('release_date')
+                if not release_date or release_date in seen_dates:
+                    continue
+                seen_dates.add(release_date)
+                history_rows.append((
+                    indicator_id,
+                    release_date,
+                    row.get('time'),
+                    *self._release_columns(row)
+                ))
+
+            crawl_rows.append((indicator_id, 'success', len(history_table), None))
+
+        return {
+            "latest": latest_rows,
+            "next": next_rows,
+            "clear_next": clear_next_ids,
+            "history": history_rows,
+            "crawl_info": crawl_rows
+        }
+
+    def _execute_indicator_upserts(self, cur, rows: Dict[str, list]) -> Dict[str, int]:
+        """지표 upsert 문을 하나의 배치로 묶어 1회 왕복으로 실행
+
+        값이 바뀌지 않은 행은 `IS DISTINCT FROM` 조건으로 UPDATE 를 건너뛰어
+        dead tuple 이 생기지 않는다.
+        데이터 upsert 는 RETURNING 하는 CTE 로 묶어, 실제로 행이 바뀐 지표만 데이터 버전을 올린다
+        (값이 같은 재크롤링/오류 기록은 캐시 키를 바꾸지 않음).
+
+        Returns:
+            {indicator_id: 새 version} (데이터가 바뀐 지표만)
+        """
+        def values(template: str, data: list) -> bytes:
+            return b",".join(cur.mogrify(template, row) for row in data)
+
+        changes = []
+
+        if rows["latest"]:
+            changes.append((b"latest_changed", b"""
+                INSERT INTO latest_releases
+                (indicator_id, release_date, time, actual, forecast, previous,
+                 actual_value, forecast_value, previous_value, unit)
+                VALUES """ + values("(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)", rows["latest"]) + b"""
+                ON CONFLICT (indicator_id) DO UPDATE SET
+                    release_date = EXCLUDED.release_date,
+                    time = EXCLUDED.time,
+                    actual = EXCLUDED.actual,
+                    forecast = EXCLUDED.forecast,
+                    previous = EXCLUDED.previous,
+                    actual_value = EXCLUDED.actual_value,
+                    forecast_value = EXCLUDED.forecast_value,
+                    previous_value = EXCLUDED.previous_value,
+                    unit = EXCLUDED.unit,
+                    created_at = CURRENT_TIMESTAMP
+                WHERE (latest_releases.release_date, latest_releases.time, latest_releases.actual,
+                       latest_releases.forecast, latest_releases.previous,
+                       latest_releases.actual_value, latest_releases.forecast_value,
+                       latest_releases.previous_value, latest_releases.unit)
+                      IS DISTINCT FROM
+                      (EXCLUDED.release_date, EXCLUDED.time, EXCLUDED.actual,
+                       EXCLUDED.forecast, EXCLUDED.previous,
+                       EXCLUDED.actual_value, EXCLUDED.forecast_value,
+                       EXCLUDED.previous_value, EXCLUDED.unit)
+                RETURNING indicator_id
+            """))
+
+        if rows["next"]:
+            changes.append((b"next_changed", b"""
+                INSERT INTO next_releases
+                (indicator_id, release_date, time, forecast, previous,
+                 forecast_value, previous_value, unit)
+                VALUES """ + values("(%s, %s, %s, %s, %s, %s, %s, %s)", rows["next"]) + b"""
+                ON CONFLICT (indicator_id) DO UPDATE SET
+                    release_date = EXCLUDED.release_date,
+                    time = EXCLUDED.time,
+                    forecast = EXCLUDED.forecast,
+                    previous = EXCLUDED.previous,
+                    forecast_value = EXCLUDED.forecast_value,
+                    previous_value = EXCLUDED.previous_value,
+                    unit = EXCLUDED.unit,
+                    created_at = CURRENT_TIMESTAMP
+                WHERE (next_releases.release_date, next_releases.time,
+                       next_releases.forecast, next_releases.previous,
+                       next_releases.forecast_value, next_releases.previous_value, next_releases.unit)
+                      IS DISTINCT FROM
+                      (EXCLUDED.release_date, EXCLUDED.time,
+                       EXCLUDED.forecast, EXCLUDED.previous,
+                       EXCLUDED.forecast_value, EXCLUDED.previous_value, EXCLUDED.unit)
+                RETURNING indicator_id
+            """))
+
+        if rows["clear_next"]:
+            changes.append((b"next_cleared", cur.mogrify(
+                "DELETE FROM next_releases WHERE indicator_id = ANY(%s) RETURNING indicator_id",
+                (rows["clear_next"],)
+            )))
+
+        if rows["history"]:
+            changes.append((b"history_changed", b"""
+                INSERT INTO history_data
+                (indicator_id, release_date, time, actual, forecast, previous,
+                 actual_value, forecast_value, previous_value, unit)
+                VALUES """ + values("(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)", rows["history"]) + b"""
+                ON CONFLICT (indicator_id, release_date) DO UPDATE SET
+                    time = EXCLUDED.time,
+                    actual = EXCLUDED.actual,
+                    forecast = EXCLUDED.forecast,
+                    previous = EXCLUDED.previous,
+                    actual_value = EXCLUDED.actual_value,
+                    forecast_value = EXCLUDED.forecast_value,
+                    previous_value = EXCLUDED.previous_value,
+                    unit = EXCLUDED.unit
+                WHERE (history_data.time, history_data.actual,
+                       history_data.forecast, history_data.previous,
+                       history_data.actual_value, history_data.forecast_value,
+                       history_data.previous_value, history_data.unit)
+                      IS DISTINCT FROM
+                      (EXCLUDED.time, EXCLUDED.actual,
+                       EXCLUDED.forecast, EXCLUDED.previous,
+                       EXCLUDED.actual_value, EXCLUDED.forecast_value,
+                       EXCLUDED.previous_value, EXCLUDED.unit)
+                RETURNING indicator_id
+            """))
+
+        statements = []
+        if rows["crawl_info"]:
+            statements.append(self._crawl_info_upsert_sql(cur, rows["crawl_info"]))
+
+        if changes:
+            # 데이터 변경 CTE + 바뀐 지표 버전 증가 (마지막 문장 → 결과 행으로 반환)
+            changed = b" UNION ".join(b"SELECT indicator_id FROM " + name for name, _ in changes)
+            statements.append(
+                b"WITH " + b",".join(name + b" AS (" + sql + b")" for name, sql in changes) + b"""
+                INSERT INTO indicator_data_versions (indicator_id, version)
+                SELECT indicator_id, nextval('indicator_data_version_seq')
+                FROM (""" + changed + b""") AS changed
+                ON CONFLICT (indicator_id) DO UPDATE SET
+                    version = EXCLUDED.version,
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING indicator_id, version
+            """)
+
+        if not statements:
+            return {}
+        cur.execute(b";".join(statements))
+        if not changes:
+            return {}
+        return {row['indicator_id']: int(row['version']) for row in cur.fetchall()}
+
+    def _crawl_info_upsert_sql(self, cur, crawl_rows: list) -> bytes:
+        """crawl_info upsert (상태 기록만, 데이터 버전은 바꾸지 않음)"""
+        values = b",".join(cur.mogrify("(%s, %s, %s, %s)", row) for row in crawl_rows)
+        return b"""
+            INSERT INTO crawl_info
+            (indicator_id, status, data_count, error_message)
+            VALUES """ + values + b"""
+            ON CONFLICT (indicator_id) DO UPDATE SET
+                last_crawl_time = CURRENT_TIMESTAMP,
+                status = EXCLUDED.status,
+                data_count = EXCLUDED.data_count,
+                error_message = EXCLUDED.error_message
+        """
+
+    def get_data_generation(self) -> Optional[int]:
+        """지표 데이터 전역 세대 번호 (어떤 지표든 데이터 행이 바뀌면 증가, 조회 실패 시 None)"""
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT COALESCE(MAX(version), 0) AS generation FROM indicator_data_versions")
+                    return int(cur.fetchone()['generation'])
         except Exception as e:
-            print(f"Database initialization failed: {e}")
-            raise e
+            print(f"Error getting data generation: {e}")
+            return None
 
-    def get_connection(self):
-        """데이터베이스 연결 반환"""
+    def get_data_versions(self, indicator_ids: List[str] = None) -> Dict[str, int]:
+        """지표별 데이터 버전 {indicator_id: version} (저장 기록이 없는 지표는 포함되지 않음)"""
         try:
-            print(f"Attempting PostgreSQL connection to: {self.database_url[:50]}...")
-            conn = psycopg2.connect(
-                self.database_url,
-                cursor_factory=psycopg2.extras.RealDictCursor,
-                connect_timeout=10
-            )
-            print("PostgreSQL connection successful")
-            return conn
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    if indicator_ids is None:
+                        cur.execute("SELECT indicator_id, version FROM indicator_data_versions")
+                    else:
+                        cur.execute(
+                            "SELECT indicator_id, version FROM indicator_data_versions WHERE indicator_id = ANY(%s)",
+                            (list(indicator_ids),)
+                        )
+                    return {row['indicator_id']: int(row['version']) for row in cur.fetchall()}
         except Exception as e:
-            print(f"Database connection failed: {e}")
-            raise e
+            print(f"Error getting data versions: {e}")
+            return {}
 
     def save_indicator_data(self, indicator_id: str, crawled_data: Dict[str, Any]):
-        """크롤링된 데이터를 데이터베이스에 저장"""
+        """크롤링된 데이터를 데이터베이스에 저장 (latest/next/history/crawl_info 1회 왕복 upsert)"""
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # 기존 데이터 삭제 (최신 데이터로 교체)
-                    cur.execute("DELETE FROM latest_releases WHERE indicator_id = %s", (indicator_id,))
-                    cur.execute("DELETE FROM next_releases WHERE indicator_id = %s", (indicator_id,))
-                    cur.execute("DELETE FROM history_data WHERE indicator_id = %s", (indicator_id,))
-
-                    # 최신 릴리즈 데이터 저장
-                    if 'latest_release' in crawled_data:
-                        latest = crawled_data['latest_release']
-                        cur.execute("""
-                            INSERT INTO latest_releases
-                            (indicator_id, release_date, time, actual, forecast, previous)
-                            VALUES (%s, %s, %s, %s, %s, %s)
-                        """, (
-                            indicator_id,
-                            latest.get('release_date'),
-                            latest.get('time'),
-                            str(latest.get('actual')) if latest.get('actual') is not None else None,
-                            str(latest.get('forecast')) if latest.get('forecast') is not None else None,
-                            str(latest.get('previous')) if latest.get('previous') is not None else None
-                        ))
+                    rows = self._collect_indicator_rows({indicator_id: crawled_data})
+                    versions = self._execute_indicator_upserts(cur, rows)
+                    conn.commit()
+            if versions:
+                data_generation.advance(max(versions.values()))
+            return True
 
-                    # 다음 릴리즈 데이터 저장
-                    if 'next_release' in crawled_data and crawled_data['next_release'] is not None:
-                        next_rel = crawled_data['next_release']
-                        cur.execute("""
-                            INSERT INTO next_releases
-                            (indicator_id, release_date, time, forecast, previous)
-                            VALUES (%s, %s, %s, %s, %s)
-                        """, (
-                            indicator_id,
-                            next_rel.get('release_date'),
-                            next_rel.get('time'),
-                            str(next_rel.get('forecast')) if next_rel.get('forecast') is not None else None,
-                            str(next_rel.get('previous')) if next_rel.get('previous') is not None else None
-                        ))
+        except Exception as e:
+            # rollback 은 get_connection() 컨텍스트 종료 시 처리됨
+            self.update_crawl_info(indicator_id, 'error', 0, str(e))
+            raise e
 
-                    # 히스토리 데이터 저장
-                    if 'history_table' in crawled_data:
-                        for row in crawled_data['history_table']:
-                            cur.execute("""
-                                INSERT INTO history_data
-                                (indicator_id, release_date, time, actual, forecast, previous)
-                                VALUES (%s, %s, %s, %s, %s, %s)
-                            """, (
-                                indicator_id,
-                                row.get('release_date'),
-                                row.get('time'),
-                                str(row.get('actual')) if row.get('actual') is not None else None,
-                                str(row.get('forecast')) if row.get('forecast') is not None else None,
-                                str(row.get('previous')) if row.get('previous') is not None else None
-                            ))
-
-                    # 크롤링 정보 업데이트
-                    self.update_crawl_info(indicator_id, 'success', len(crawled_data.get('history_table', [])))
+    def save_multiple_indicators_data(self, items: Dict[str, Dict[str, Any]]) -> bool:
+        """여러 지표의 크롤링 결과를 한 번에 저장 (배치 upsert)
+
+        Args:
+            items: {indicator_id: crawled_data}
 
+        Returns:
+            성공 여부 (False 면 배치 전체가 롤백됨, 호출자가 지표별로 다시 저장)
+        """
+        if not items:
+            return True
+
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    rows = self._collect_indicator_rows(items)
+                    versions = self._execute_indicator_upserts(cur, rows)
                     conn.commit()
-                    return True
+            if versions:
+                data_generation.advance(max(versions.values()))
+            return True
 
         except Exception as e:
-            if 'conn' in locals():
-                conn.rollback()
-            self.update_crawl_info(indicator_id, 'error', 0, str(e))
-            raise e
+            # 한 지표의 불량 데이터가 배치 전체를 막지 않도록 호출자가 개별 저장(save_indicator_data)으로 폴백
+            print(f"Batch save failed for {len(items)} indicators: {e}")
+            return False
+
+    def _history_row_dict(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """history_data / latest_releases 행 → API 응답 형태 (원문 + 숫자값)"""
+        return {
+            "release_date": row['release_date'],
+            "time": row['time'],
+            "actual": self._parse_value(row['actual']),
+            "forecast": self._parse_value(row['forecast']),
+            "previous": self._parse_value(row['previous']),
+            **release_values(row)
+        }
+
+    def _next_release_dict(self, row: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """next_releases 행 → API 응답 형태 (없으면 미정)"""
+        if not row:
+            return {
+                "release_date": "미정",
+                "time": "미정",
+                "forecast": None,
+                "previous": None,
+                "forecast_value": None,
+                "previous_value": None,
+                "unit": None
+            }
+        return {
+            "release_date": row['release_date'],
+            "time": row['time'],
+            "forecast": self._parse_value(row['forecast']),
+            "previous": self._parse_value(row['previous']),
+            **release_values(row, include_actual=False)
+        }
 
     def get_indicator_data(self, indicator_id: str) -> Dict[str, Any]:
         """지표 데이터 조회 (API 응답 형태로 반환)"""
@@ -521,19 +441,8 @@ class PostgresDatabaseService:
 
                 # API 응답 형태로 변환
                 result = {
-                    "latest_release": {
-                        "release_date": latest_row['release_date'],
-                        "time": latest_row['time'],
-                        "actual": self._parse_value(latest_row['actual']),
-                        "forecast": self._parse_value(latest_row['forecast']),
-                        "previous": self._parse_value(latest_row['previous'])
-                    },
-                    "next_release": {
-                        "release_date": next_row['release_date'] if next_row else "미정",
-                        "time": next_row['time'] if next_row else "미정",
-                        "forecast": self._parse_value(next_row['forecast']) if next_row else None,
-                        "previous": self._parse_value(next_row['previous']) if next_row else None
-                    },
+                    "latest_release": self._history_row_dict(latest_row),
+                    "next_release": self._next_release_dict(next_row),
                     "history_table": history_table,
                     "last_updated": crawl_row['last_crawl_time'].isoformat() if crawl_row else None,
                     "timestamp": datetime.now().isoformat()
@@ -556,7 +465,8 @@ class PostgresDatabaseService:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
                     query = """
-                        SELECT release_date, time, actual, forecast, previous
+                        SELECT release_date, time, actual, forecast, previous,
+                               actual_value, forecast_value, previous_value, unit
                         FROM history_data
                         WHERE indicator_id = %s
                         ORDER BY release_date DESC
@@ -570,20 +480,55 @@ class PostgresDatabaseService:
                     cur.execute(query, tuple(params))
                     rows = cur.fetchall()
 
-                    return [
-                        {
-                            "release_date": row['release_date'],
-                            "time": row['time'],
-                            "actual": self._parse_value(row['actual']),
-                            "forecast": self._parse_value(row['forecast']),
-                            "previous": self._parse_value(row['previous'])
-                        }
-                        for row in rows
-                    ]
+                    return [self._history_row_dict(row) for row in rows]
         except Exception as e:
             print(f"Error getting history data for {indicator_id}: {e}")
             return []
 
+    def get_history_range(self, indicator_id: str, start: str = None, end: str = None,
+                          limit: int = None) -> List[Dict[str, Any]]:
+        """기간별 히스토리 데이터 조회 (누적 시계열)
+
+        Args:
+            indicator_id: 지표 ID
+            start: 시작일 (YYYY-MM-DD, 포함). None이면 처음부터
+            end: 종료일 (YYYY-MM-DD, 포함). None이면 최신까지
+            limit: 가져올 최대 행 수 (None이면 전체)
+
+        Returns:
+            release_date 최신순 리스트 (get_history_data와 동일한 형식)
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    query = """
+                        SELECT release_date, time, actual, forecast, previous,
+                               actual_value, forecast_value, previous_value, unit
+                        FROM history_data
+                        WHERE indicator_id = %s
+                    """
+                    params = [indicator_id]
+
+                    if start:
+                        query += " AND release_date >= %s"
+                        params.append(start)
+                    if end:
+                        query += " AND release_date <= %s"
+                        params.append(end)
+
+                    query += " ORDER BY release_date DESC"
+                    if limit and limit > 0:
+                        query += " LIMIT %s"
+                        params.append(limit)
+
+                    cur.execute(query, tuple(params))
+                    rows = cur.fetchall()
+
+                    return [self._history_row_dict(row) for row in rows]
+        except Exception as e:
+            print(f"Error getting history range for {indicator_id}: {e}")
+            return []
+
     def get_multiple_indicators_data(self, indicator_ids: List[str]) -> Dict[str, Any]:
         """
         여러 지표 데이터를 한 번에 조회 (배치 쿼리)
@@ -607,7 +552,8 @@ class PostgresDatabaseService:
                     # 1. 최신 릴리즈 데이터 배치 조회 (IN 절 사용)
                     cur.execute("""
                         SELECT DISTINCT ON (indicator_id)
-                            indicator_id, release_date, time, actual, forecast, previous, created_at
+                            indicator_id, release_date, time, actual, forecast, previous,
+                            actual_value, forecast_value, previous_value, unit, created_at
                         FROM latest_releases
                         WHERE indicator_id = ANY(%s)
                         ORDER BY indicator_id, created_at DESC
@@ -617,7 +563,8 @@ class PostgresDatabaseService:
                     # 2. 다음 릴리즈 데이터 배치 조회
                     cur.execute("""
                         SELECT DISTINCT ON (indicator_id)
-                            indicator_id, release_date, time, forecast, previous, created_at
+                            indicator_id, release_date, time, forecast, previous,
+                            forecast_value, previous_value, unit, created_at
                         FROM next_releases
                         WHERE indicator_id = ANY(%s)
                         ORDER BY indicator_id, created_at DESC
@@ -651,19 +598,8 @@ class PostgresDatabaseService:
                         crawl_row = crawl_dict.get(indicator_id)
 
                         result[indicator_id] = {
-                            "latest_release": {
-                                "release_date": latest_row['release_date'],
-                                "time": latest_row['time'],
-                                "actual": self._parse_value(latest_row['actual']),
-                                "forecast": self._parse_value(latest_row['forecast']),
-                                "previous": self._parse_value(latest_row['previous'])
-                            },
-                            "next_release": {
-                                "release_date": next_row['release_date'] if next_row else "미정",
-                                "time": next_row['time'] if next_row else "미정",
-                                "forecast": self._parse_value(next_row['forecast']) if next_row else None,
-                                "previous": self._parse_value(next_row['previous']) if next_row else None
-                            },
+                            "latest_release": self._history_row_dict(latest_row),
+                            "next_release": self._next_release_dict(next_row),
                             "last_updated": crawl_row['last_crawl_time'].isoformat() if crawl_row else None,
                             "timestamp": datetime.now().isoformat()
                         }
@@ -694,32 +630,28 @@ class PostgresDatabaseService:
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # 서브쿼리로 각 지표별 최신 N개만 조회
+                    # 지표별 최신 N개만 인덱스로 조회 (히스토리가 누적되어도 전체 스캔 없음)
                     query = """
-                        SELECT * FROM (
-                            SELECT
-                                indicator_id, release_date, time, actual, forecast, previous,
-                                ROW_NUMBER() OVER (PARTITION BY indicator_id ORDER BY release_date DESC) as rn
+                        SELECT ids.indicator_id, h.*
+                        FROM unnest(%s::text[]) AS ids(indicator_id)
+                        CROSS JOIN LATERAL (
+                            SELECT release_date, time, actual, forecast, previous,
+                                   actual_value, forecast_value, previous_value, unit
                             FROM history_data
-                            WHERE indicator_id = ANY(%s)
-                        ) subq
-                        WHERE rn <= %s
-                        ORDER BY indicator_id, release_date DESC
+                            WHERE history_data.indicator_id = ids.indicator_id
+                            ORDER BY release_date DESC
+                            LIMIT %s
+                        ) h
+                        ORDER BY ids.indicator_id, h.release_date DESC
                     """
-                    cur.execute(query, (indicator_ids, limit))
+                    cur.execute(query, (list(indicator_ids), limit))
                     rows = cur.fetchall()
 
                     # 지표별로 그룹화
                     result = {indicator_id: [] for indicator_id in indicator_ids}
                     for row in rows:
                         indicator_id = row['indicator_id']
-                        result[indicator_id].append({
-                            "release_date": row['release_date'],
-                            "time": row['time'],
-                            "actual": self._parse_value(row['actual']),
-                            "forecast": self._parse_value(row['forecast']),
-                            "previous": self._parse_value(row['previous'])
-                        })
+                        result[indicator_id].append(self._history_row_dict(row))
 
                     return result
 
@@ -784,18 +716,107 @@ class PostgresDatabaseService:
             print(f"Error getting crawl info for {indicator_id}: {e}")
             return None
 
-    def update_crawl_info(self, indicator_id: str, status: str, data_count: int = 0, error_message: str = None):
-        """크롤링 정보 업데이트"""
+    def get_multiple_crawl_info(self, indicator_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 지표의 크롤링 정보를 한 번에 조회 (배치 쿼리)
+
+        Args:
+            indicator_ids: 조회할 지표 ID 리스트
+
+        Returns:
+            {indicator_id: {...}} - 크롤링 기록이 없는 지표는 포함되지 않음
+        """
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # 기존 레코드 삭제 후 새로 삽입 (최신 상태만 유지)
-                    cur.execute("DELETE FROM crawl_info WHERE indicator_id = %s", (indicator_id,))
                     cur.execute("""
-                        INSERT INTO crawl_info
-                        (indicator_id, status, data_count, error_message)
-                        VALUES (%s, %s, %s, %s)
-                    """, (indicator_id, status, data_count, error_message))
+                        SELECT DISTINCT ON (indicator_id)
+                            indicator_id, last_crawl_time, status, error_message, data_count
+                        FROM crawl_info
+                        WHERE indicator_id = ANY(%s)
+                        ORDER BY indicator_id, last_crawl_time DESC
+                    """, (list(indicator_ids),))
+                    rows = cur.fetchall()
+
+                    return {
+                        row['indicator_id']: {
+                            "indicator_id": row['indicator_id'],
+                            "last_crawl_time": row['last_crawl_time'],
+                            "status": row['status'],
+                            "error_message": row['error_message'],
+                            "data_count": row['data_count']
+                        }
+                        for row in rows
+                    }
+        except Exception as e:
+            print(f"Error getting multiple crawl info: {e}")
+            return {}
+
+    def get_fred_observations(self, windows: Dict[str, str]) -> Dict[str, List[Dict[str, Any]]]:
+        """저장된 FRED 원본 관측치 (시리즈 수와 무관하게 쿼리 1회)
+
+        Args:
+            windows: {series_id: 시작일 YYYY-MM-DD}
+
+        Returns:
+            {series_id: [{date, value}, ...] (최신순)} - 저장된 관측치가 없는 시리즈는 빈 리스트
+        """
+        result = {series_id: [] for series_id in windows}
+        if not windows:
+            return result
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        SELECT o.series_id, o.observation_date, o.value
+                        FROM unnest(%s::text[], %s::date[]) AS w(series_id, start_date)
+                        JOIN fred_observations o
+                          ON o.series_id = w.series_id AND o.observation_date >= w.start_date
+                        ORDER BY o.series_id, o.observation_date DESC
+                    """, (list(windows.keys()), list(windows.values())))
+                    for row in cur.fetchall():
+                        result[row['series_id']].append({
+                            'date': row['observation_date'].isoformat(),
+                            'value': row['value']
+                        })
+        except Exception as e:
+            print(f"Error getting FRED observations: {e}")
+        return result
+
+    def save_fred_observations(self, observations: Dict[str, List[Dict[str, Any]]]) -> bool:
+        """FRED 원본 관측치 upsert ({series_id: [{date, value}, ...]}, 값이 같은 행은 갱신하지 않음)"""
+        rows = [
+            (series_id, row['date'], row['value'])
+            for series_id, series_rows in observations.items() for row in series_rows
+        ]
+        if not rows:
+            return True
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    values = b",".join(cur.mogrify("(%s, %s, %s)", row) for row in rows)
+                    cur.execute(b"""
+                        INSERT INTO fred_observations (series_id, observation_date, value)
+                        VALUES """ + values + b"""
+                        ON CONFLICT (series_id, observation_date) DO UPDATE SET
+                            value = EXCLUDED.value,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE fred_observations.value IS DISTINCT FROM EXCLUDED.value
+                    """)
+                    conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error saving FRED observations: {e}")
+            return False
+
+    def update_crawl_info(self, indicator_id: str, status: str, data_count: int = 0, error_message: str = None):
+        """크롤링 정보 업데이트 (지표당 1행 upsert)"""
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(self._crawl_info_upsert_sql(
+                        cur, [(indicator_id, status, data_count, error_message)]
+                    ))
                     conn.commit()
         except Exception as e:
             print(f"Error updating crawl info for {indicator_id}: {e}")
@@ -835,8 +856,7 @@ class PostgresDatabaseService:
                             annual_yield, minimum_balance, withdrawal_fee, dividend_rate, nav, management_fee
                         )
                         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        RETURNING id
-                    """, (
+                        RETURNING id, """ + PORTFOLIO_CONTRIBUTION_COLUMNS, (
                         asset_data.get('user_id'),
                         asset_data.get('asset_type'),
                         asset_data.get('sub_category'),
@@ -877,6 +897,7 @@ class PostgresDatabaseService:
                     result = cur.fetchone()
                     print(f"Insert result: {result}")
                     asset_id = result['id'] if result else None
+                    self._apply_portfolio_delta(cur, result, 1)
                     conn.commit()
                     print(f"Asset saved successfully with ID: {asset_id}")
 
@@ -1062,12 +1083,20 @@ class PostgresDatabaseService:
             with self.get_connection() as conn:
                 print("PostgreSQL connection established for update")
                 with conn.cursor() as cur:
-                    # 사용자별 자산 존재 여부 확인
+                    # 사용자별 자산 존재 여부 확인 (변경 전 합계 기여분도 함께 읽고 행 잠금)
                     if user_id:
-                        cur.execute("SELECT id, name FROM assets WHERE id = %s AND user_id = %s", (asset_id, user_id))
+                        cur.execute(
+                            "SELECT id, name, " + PORTFOLIO_CONTRIBUTION_COLUMNS +
+                            " FROM assets WHERE id = %s AND user_id = %s FOR UPDATE",
+                            (asset_id, user_id)
+                        )
                     else:
                         # 하위 호환성: user_id가 없으면 기존 동작
-                        cur.execute("SELECT id, name FROM assets WHERE id = %s", (asset_id,))
+                        cur.execute(
+                            "SELECT id, name, " + PORTFOLIO_CONTRIBUTION_COLUMNS +
+                            " FROM assets WHERE id = %s FOR UPDATE",
+                            (asset_id,)
+                        )
 
                     asset = cur.fetchone()
 
@@ -1232,13 +1261,18 @@ class PostgresDatabaseService:
                         values.append(user_id)
                     else:
                         sql = f"UPDATE assets SET {', '.join(update_fields)} WHERE id = %s"
+                    sql += " RETURNING " + PORTFOLIO_CONTRIBUTION_COLUMNS
 
                     print(f"Executing SQL: {sql}")
                     print(f"Values: {values}")
 
                     cur.execute(sql, values)
+                    updated = cur.fetchone()
 
-                    if cur.rowcount > 0:
+                    if updated:
+                        # 포트폴리오 합계: 변경 전 기여분을 빼고 변경 후 기여분을 더함
+                        self._apply_portfolio_delta(cur, asset, -1, count=False)
+                        self._apply_portfolio_delta(cur, updated, 1, count=False)
                         conn.commit()
                         print(f"Asset {asset_id} updated successfully")
                         # Return updated row for verification
@@ -1424,11 +1458,17 @@ class PostgresDatabaseService:
 
                     # 사용자별 자산 삭제
                     if user_id:
-                        cur.execute("DELETE FROM assets WHERE id = %s AND user_id = %s", (asset_id, user_id))
+                        cur.execute(
+                            "DELETE FROM assets WHERE id = %s AND user_id = %s RETURNING " + PORTFOLIO_CONTRIBUTION_COLUMNS,
+                            (asset_id, user_id)
+                        )
                     else:
-                        cur.execute("DELETE FROM assets WHERE id = %s", (asset_id,))
+                        cur.execute("DELETE FROM assets WHERE id = %s RETURNING " + PORTFOLIO_CONTRIBUTION_COLUMNS, (asset_id,))
 
+                    deleted = cur.fetchone()
                     deleted_count = cur.rowcount
+                    if deleted:
+                        self._apply_portfolio_delta(cur, deleted, -1)
                     conn.commit()
 
                     if deleted_count > 0:
@@ -1438,7 +1478,8 @@ class PostgresDatabaseService:
                             "message": f"자산 '{asset_name}'이(가) 성공적으로 삭제되었습니다.",
                             "deleted_asset": {
                                 "id": asset_id,
-                                "name": asset_name
+                                "name": asset_name,
+                                "amount": float(deleted['total_assets']) if deleted else 0
                             }
                         }
                     else:
@@ -1807,8 +1848,123 @@ class PostgresDatabaseService:
                 "message": "비밀번호 재설정 요청 처리 실패"
             }
 
+    def _apply_portfolio_delta(self, cur, contribution: Optional[Dict[str, Any]], sign: int, count: bool = True):
+        """portfolio_totals 에 자산 1건의 기여분을 더하거나(+1) 뺀다(-1)
+
+        contribution 은 PORTFOLIO_CONTRIBUTION_COLUMNS 로 조회/RETURNING 한 행.
+        호출자의 트랜잭션 안에서 실행되므로 자산 변경과 함께 커밋/롤백된다.
+        count=False 이면 자산 개수는 바꾸지 않는다 (수정).
+        """
+        if not contribution or contribution.get('user_id') is None:
+            return
+
+        cur.execute("""
+            INSERT INTO portfolio_totals
+            (user_id, total_assets, total_principal, total_eval_amount, asset_count)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (user_id) DO UPDATE SET
+                total_assets = portfolio_totals.total_assets + EXCLUDED.total_assets,
+                total_principal = portfolio_totals.total_principal + EXCLUDED.total_principal,
+                total_eval_amount = portfolio_totals.total_eval_amount + EXCLUDED.total_eval_amount,
+                asset_count = portfolio_totals.asset_count + EXCLUDED.asset_count,
+                updated_at = CURRENT_TIMESTAMP
+        """, (
+            contribution['user_id'],
+            sign * contribution['total_assets'],
+            sign * contribution['total_principal'],
+            sign * contribution['total_eval_amount'],
+            sign if count else 0
+        ))
+
+    def get_portfolio_totals(self, user_id: int) -> Dict[str, Any]:
+        """사용자별 포트폴리오 합계 조회 (자산 변경 시 증감 유지되는 running total)
+
+        Returns:
+            data: {total_assets, total_principal, total_eval_amount, total_profit_loss, profit_rate, asset_count}
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        SELECT total_assets, total_principal, total_eval_amount, asset_count, updated_at
+                        FROM portfolio_totals
+                        WHERE user_id = %s
+                    """, (user_id,))
+                    row = cur.fetchone()
+
+            total_assets = float(row['total_assets']) if row else 0.0
+            total_principal = float(row['total_principal']) if row else 0.0
+            total_eval_amount = float(row['total_eval_amount']) if row else 0.0
+            total_profit_loss = total_eval_amount - total_principal
+
+            return {
+                "status": "success",
+                "data": {
+                    "total_assets": total_assets,
+                    "total_principal": total_principal,
+                    "total_eval_amount": total_eval_amount,
+                    "total_profit_loss": total_profit_loss,
+                    "profit_rate": (total_profit_loss / total_principal * 100) if total_principal > 0 else 0,
+                    "asset_count": row['asset_count'] if row else 0,
+                    "updated_at": row['updated_at'].isoformat() if row and row['updated_at'] else None
+                }
+            }
+
+        except Exception as e:
+            print(f"Error getting portfolio totals: {e}")
+            return {"status": "error", "message": f"포트폴리오 합계 조회 실패: {str(e)}"}
+
+    def _apply_history_snapshot(self, cur, history_row: Optional[Dict[str, Any]]):
+        """portfolio_history 원본 행 1건을 일별/월별 스냅샷에 반영
+
+        스냅샷은 해당 일/월의 마지막(가장 늦은 timestamp) 값을 유지한다.
+        호출자의 트랜잭션 안에서 실행되므로 원본 행과 함께 커밋/롤백된다.
+        """
+        if not history_row or history_row.get('user_id') is None:
+            return
+
+        timestamp = history_row['timestamp']
+        values = (
+            history_row['user_id'],
+            timestamp,
+            history_row['total_assets'],
+            history_row['total_principal'],
+            history_row['total_eval_amount'],
+            history_row['change_type'],
+            history_row['change_amount'],
+            history_row['asset_name'],
+            history_row['notes']
+        )
+        for table, bucket_column, bucket in (
+            ('portfolio_history_daily', 'day', timestamp.date()),
+            ('portfolio_history_monthly', 'month', timestamp.date().replace(day=1)),
+        ):
+            cur.execute(f"""
+                INSERT INTO {table}
+                ({bucket_column}, user_id, timestamp, total_assets, total_principal, total_eval_amount,
+                 change_type, change_amount, asset_name, notes, change_count)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 1)
+                ON CONFLICT (user_id, {bucket_column}) DO UPDATE SET
+                    timestamp = GREATEST({table}.timestamp, EXCLUDED.timestamp),
+                    total_assets = CASE WHEN EXCLUDED.timestamp >= {table}.timestamp
+                        THEN EXCLUDED.total_assets ELSE {table}.total_assets END,
+                    total_principal = CASE WHEN EXCLUDED.timestamp >= {table}.timestamp
+                        THEN EXCLUDED.total_principal ELSE {table}.total_principal END,
+                    total_eval_amount = CASE WHEN EXCLUDED.timestamp >= {table}.timestamp
+                        THEN EXCLUDED.total_eval_amount ELSE {table}.total_eval_amount END,
+                    change_type = CASE WHEN EXCLUDED.timestamp >= {table}.timestamp
+                        THEN EXCLUDED.change_type ELSE {table}.change_type END,
+                    change_amount = CASE WHEN EXCLUDED.timestamp >= {table}.timestamp
+                        THEN EXCLUDED.change_amount ELSE {table}.change_amount END,
+                    asset_name = CASE WHEN EXCLUDED.timestamp >= {table}.timestamp
+                        THEN EXCLUDED.asset_name ELSE {table}.asset_name END,
+                    notes = CASE WHEN EXCLUDED.timestamp >= {table}.timestamp
+                        THEN EXCLUDED.notes ELSE {table}.notes END,
+                    change_count = {table}.change_count + 1
+            """, (bucket,) + values)
+
     def save_portfolio_history(self, user_id: str, change_type: str, total_assets: float = 0, total_principal: float = 0, total_eval_amount: float = 0, asset_id: int = None, asset_name: str = None, change_amount: float = 0, notes: str = None) -> Dict[str, Any]:
-        """포트폴리오 변경사항을 이력에 저장"""
+        """포트폴리오 변경사항을 이력에 저장 (일별/월별 스냅샷 동시 갱신)"""
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
@@ -1816,7 +1972,10 @@ class PostgresDatabaseService:
                         INSERT INTO portfolio_history
                         (user_id, change_type, total_assets, total_principal, total_eval_amount, asset_id, asset_name, change_amount, notes)
                         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        RETURNING user_id, timestamp, total_assets, total_principal, total_eval_amount,
+                                  change_type, change_amount, asset_name, notes
                     """, (user_id, change_type, total_assets, total_principal, total_eval_amount, asset_id, asset_name, change_amount, notes))
+                    self._apply_history_snapshot(cur, cur.fetchone())
 
                     conn.commit()
                     return {"status": "success", "message": "Portfolio history saved"}
@@ -1825,41 +1984,46 @@ class PostgresDatabaseService:
             print(f"Error saving portfolio history: {e}")
             return {"status": "error", "message": f"Failed to save history: {str(e)}"}
 
-    def get_portfolio_history(self, user_id: str, time_range: str = 'daily', start_date: str = None, end_date: str = None) -> Dict[str, Any]:
-        """포트폴리오 이력을 조회 (시간 범위별)"""
+    def get_portfolio_history(self, user_id: str, time_range: str = 'daily', start_date: str = None, end_date: str = None, limit: int = None) -> Dict[str, Any]:
+        """포트폴리오 이력을 조회 (시간 범위별)
+
+        - annual: 월별 마지막 값 (portfolio_history_monthly)
+        - monthly: 일별 마지막 값 (portfolio_history_daily)
+        - daily: 원본 변경 이력 (최근 순)
+
+        limit 이 없으면 PORTFOLIO_HISTORY_MAX_ROWS (기본 1000) 개까지만 반환한다.
+        annual/monthly 는 최근 limit 개 구간을 시간 오름차순으로 반환한다.
+        """
+        if not limit or limit <= 0:
+            limit = int(os.getenv('PORTFOLIO_HISTORY_MAX_ROWS', '1000'))
+
         try:
             with self.get_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                    # 시간 범위에 따른 쿼리 조건 설정
-                    if time_range == 'annual':
-                        # 연간: 월별 마지막 일의 데이터
-                        query = """
-                            SELECT DISTINCT ON (DATE_TRUNC('month', timestamp))
-                                timestamp, total_assets, total_principal, total_eval_amount,
-                                change_type, change_amount, asset_name
-                            FROM portfolio_history
+                    params = [user_id]
+                    if time_range in ('annual', 'monthly'):
+                        # 연간: 월별 마지막 값 / 월간: 일별 마지막 값 (증분 스냅샷 테이블)
+                        table, bucket_column = (
+                            ('portfolio_history_monthly', 'month') if time_range == 'annual'
+                            else ('portfolio_history_daily', 'day')
+                        )
+                        bucket_trunc = "DATE_TRUNC('month', %s::timestamp)::date" if time_range == 'annual' else "DATE(%s::timestamp)"
+                        query = f"""
+                            SELECT timestamp, total_assets, total_principal, total_eval_amount,
+                                   change_type, change_amount, asset_name, notes
+                            FROM {table}
                             WHERE user_id = %s
                         """
                         if start_date:
-                            query += " AND timestamp >= %s"
+                            query += f" AND {bucket_column} >= {bucket_trunc}"
+                            params.append(start_date)
                         if end_date:
-                            query += " AND timestamp <= %s"
-                        query += " ORDER BY DATE_TRUNC('month', timestamp), timestamp DESC"
-
-                    elif time_range == 'monthly':
-                        # 월간: 일별 마지막 데이터
-                        query = """
-                            SELECT DISTINCT ON (DATE(timestamp))
-                                timestamp, total_assets, total_principal, total_eval_amount,
-                                change_type, change_amount, asset_name
-                            FROM portfolio_history
-                            WHERE user_id = %s
+                            query += f" AND {bucket_column} <= {bucket_trunc}"
+                            params.append(end_date)
+                        query = f"""
+                            SELECT * FROM ({query} ORDER BY {bucket_column} DESC LIMIT %s) recent
+                            ORDER BY timestamp
                         """
-                        if start_date:
-                            query += " AND timestamp >= %s"
-                        if end_date:
-                            query += " AND timestamp <= %s"
-                        query += " ORDER BY DATE(timestamp), timestamp DESC"
 
                     else:  # daily
                         # 일간: 모든 변경사항
@@ -1871,17 +2035,13 @@ class PostgresDatabaseService:
                         """
                         if start_date:
                             query += " AND timestamp >= %s"
+                            params.append(start_date)
                         if end_date:
                             query += " AND timestamp <= %s"
-                        query += " ORDER BY timestamp DESC"
-
-                    # 파라미터 설정
-                    params = [user_id]
-                    if start_date:
-                        params.append(start_date)
-                    if end_date:
-                        params.append(end_date)
+                            params.append(end_date)
+                        query += " ORDER BY timestamp DESC LIMIT %s"
 
+                    params.append(limit)
                     cur.execute(query, params)
                     results = cur.fetchall()
 
@@ -1903,24 +2063,69 @@ class PostgresDatabaseService:
                         "status": "success",
                         "data": history_data,
                         "time_range": time_range,
-                        "count": len(history_data)
+                        "count": len(history_data),
+                        "limit": limit,
+                        "truncated": len(history_data) >= limit
                     }
 
         except Exception as e:
             print(f"Error getting portfolio history: {e}")
             return {"status": "error", "message": f"Failed to get history: {str(e)}"}
 
+    def compact_portfolio_history(self, user_id: str = None, retention_days: int = None) -> Dict[str, Any]:
+        """보존 기간이 지난 원본 변경 이력을 일별 1행으로 압축
+
+        retention_days(기본 PORTFOLIO_HISTORY_RETENTION_DAYS=90) 이전의 원본 행 중
+        각 날짜의 마지막 행(= portfolio_history_daily 스냅샷)만 남기고 삭제한다.
+        일별/월별 스냅샷 테이블은 그대로 유지된다.
+        """
+        if retention_days is None:
+            retention_days = int(os.getenv('PORTFOLIO_HISTORY_RETENTION_DAYS', '90'))
+        if retention_days <= 0:
+            return {"status": "success", "deleted": 0}
+
+        cutoff = datetime.now() - timedelta(days=retention_days)
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    query = """
+                        DELETE FROM portfolio_history h
+                        USING portfolio_history_daily d
+                        WHERE h.user_id = d.user_id
+                          AND d.day = DATE(h.timestamp)
+                          AND h.timestamp < d.timestamp
+                          AND h.timestamp < %s
+                    """
+                    params = [cutoff]
+                    if user_id is not None:
+                        query += " AND h.user_id = %s"
+                        params.append(user_id)
+                    cur.execute(query, params)
+                    deleted = cur.rowcount
+                    conn.commit()
+
+            if deleted:
+                print(f"Compacted {deleted} portfolio history rows older than {retention_days} days")
+            return {"status": "success", "deleted": deleted}
+
+        except Exception as e:
+            print(f"Error compacting portfolio history: {e}")
+            return {"status": "error", "message": f"Failed to compact history: {str(e)}"}
+
     def create_daily_summary(self, user_id: str) -> Dict[str, Any]:
-        """일일 포트폴리오 요약 생성 (스마트 샘플링)"""
+        """일일 포트폴리오 요약 생성 (스마트 샘플링)
+
+        요약 저장 후 해당 사용자의 보존 기간 지난 원본 이력을 압축한다.
+        """
         try:
-            # 현재 포트폴리오 총액 계산
-            assets_data = self.get_all_assets(user_id)
-            if assets_data.get("status") != "success":
+            # 현재 포트폴리오 총액 (portfolio_totals running total)
+            totals = self.get_portfolio_totals(user_id)
+            if totals.get("status") != "success":
                 return {"status": "error", "message": "Failed to get current assets"}
 
-            total_assets = sum(asset.get('amount', 0) for asset in assets_data.get('data', []))
-            total_principal = sum(asset.get('principal', asset.get('amount', 0)) for asset in assets_data.get('data', []))
-            total_eval_amount = sum(asset.get('eval_amount', asset.get('amount', 0)) for asset in assets_data.get('data', []))
+            total_assets = totals['data']['total_assets']
+            total_principal = totals['data']['total_principal']
+            total_eval_amount = totals['data']['total_eval_amount']
 
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
@@ -1929,10 +2134,15 @@ class PostgresDatabaseService:
                         INSERT INTO portfolio_history
                         (user_id, change_type, total_assets, total_principal, total_eval_amount, is_daily_summary, notes)
                         VALUES (%s, 'daily_summary', %s, %s, %s, true, 'Auto-generated daily summary')
+                        RETURNING user_id, timestamp, total_assets, total_principal, total_eval_amount,
+                                  change_type, change_amount, asset_name, notes
                     """, (user_id, total_assets, total_principal, total_eval_amount))
+                    self._apply_history_snapshot(cur, cur.fetchone())
 
                     conn.commit()
-                    return {"status": "success", "message": "Daily summary created"}
+
+            self.compact_portfolio_history(user_id)
+            return {"status": "success", "message": "Daily summary created"}
 
         except Exception as e:
             print(f"Error creating daily summary: {e}")
@@ -1940,6 +2150,85 @@ class PostgresDatabaseService:
 
     # ======== 가계부/지출관리 시스템 메서드들 ========
 
+    def _apply_expense_rollup(self, cur, expense: Dict[str, Any], sign: int):
+        """월별 집계(expense_monthly_rollup)에 거래 1건을 더하거나(+1) 뺀다(-1)
+
+        호출자의 트랜잭션 안에서 실행되므로 거래내역 변경과 함께 커밋/롤백된다.
+        """
+        if not expense or expense.get('user_id') is None:
+            return
+
+        transaction_date = expense['transaction_date']
+        if isinstance(transaction_date, str):
+            transaction_date = datetime.strptime(transaction_date[:10], '%Y-%m-%d').date()
+
+        key = (
+            expense['user_id'],
+            transaction_date.year,
+            transaction_date.month,
+            expense['category'],
+            expense.get('subcategory') or '',
+            expense['transaction_type']
+        )
+        cur.execute("""
+            INSERT INTO expense_monthly_rollup
+            (user_id, year, month, category, subcategory, transaction_type, total_amount, transaction_count)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (user_id, year, month, category, subcategory, transaction_type) DO UPDATE SET
+                total_amount = expense_monthly_rollup.total_amount + EXCLUDED.total_amount,
+                transaction_count = expense_monthly_rollup.transaction_count + EXCLUDED.transaction_count,
+                updated_at = CURRENT_TIMESTAMP
+        """, key + (sign * expense['amount'], sign))
+
+        if sign < 0:
+            cur.execute("""
+                DELETE FROM expense_monthly_rollup
+                WHERE user_id = %s AND year = %s AND month = %s
+                  AND category = %s AND subcategory = %s AND transaction_type = %s
+                  AND transaction_count <= 0
+            """, key)
+
+    def get_expense_rollup(self, user_id: int, year: int = None, month: int = None) -> Dict[str, Any]:
+        """월별 집계 조회 (연간 차트/예산 진행률/Excel 요약용)
+
+        Returns:
+            data: [{year, month, category, subcategory, transaction_type, total_amount, transaction_count}]
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    sql = """
+                    SELECT year, month, category, subcategory, transaction_type,
+                           total_amount, transaction_count
+                    FROM expense_monthly_rollup
+                    WHERE user_id = %s
+                    """
+                    params = [user_id]
+
+                    if year:
+                        sql += " AND year = %s"
+                        params.append(year)
+
+                    if month:
+                        sql += " AND month = %s"
+                        params.append(month)
+
+                    sql += " ORDER BY year, month, category, subcategory, transaction_type"
+
+                    cur.execute(sql, params)
+                    return {
+                        "status": "success",
+                        "data": [dict(row) for row in cur.fetchall()]
+                    }
+
+        except Exception as e:
+            print(f"PostgreSQL get_expense_rollup error: {e}")
+            return {
+                "status": "error",
+                "message": f"월별 집계 조회 중 오류가 발생했습니다: {str(e)}",
+                "data": []
+            }
+
     def add_expense(self, user_id: int, expense_data: Dict[str, Any]) -> Dict[str, Any]:
         """거래내역 추가 (포트폴리오 save_asset 패턴과 동일)"""
         try:
@@ -1949,7 +2238,7 @@ class PostgresDatabaseService:
                     INSERT INTO expenses
                     (user_id, transaction_type, amount, currency, category, subcategory, name, memo, payment_method, payment_method_name, transaction_date)
                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
+                    RETURNING id, user_id, transaction_type, amount, category, subcategory, transaction_date
                     """
 
                     cur.execute(sql, (
@@ -1968,6 +2257,7 @@ class PostgresDatabaseService:
 
                     result = cur.fetchone()
                     expense_id = result['id']
+                    self._apply_expense_rollup(cur, result, 1)
                     conn.commit()
 
                     print(f"Expense {expense_id} added successfully")
@@ -1984,95 +2274,103 @@ class PostgresDatabaseService:
                 "message": f"거래내역 저장 중 오류가 발생했습니다: {str(e)}"
             }
 
-    def get_all_expenses(self, user_id: int, filters: Dict[str, Any] = None) -> Dict[str, Any]:
-        """모든 거래내역 조회 (포트폴리오 get_all_assets 패턴과 동일)"""
+    def get_all_expenses(self, user_id: int, filters: Dict[str, Any] = None,
+                         summary_only: bool = False) -> Dict[str, Any]:
+        """모든 거래내역 조회 (포트폴리오 get_all_assets 패턴과 동일)
+
+        거래 목록, 수입/지출 합계, 카테고리별 집계를 한 번의 테이블 스캔으로 계산한다.
+        (filtered CTE 1회 + GROUPING SETS). 모든 필터가 목록과 집계에 동일하게 적용된다.
+
+        Args:
+            user_id: 사용자 ID
+            filters: start_date, end_date, category, transaction_type
+            summary_only: True면 거래 목록(data)을 만들지 않고 집계만 반환
+        """
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # 기본 쿼리
-                    base_sql = """
-                    SELECT id, transaction_type, amount, currency, category, subcategory,
-                           name, memo, payment_method, payment_method_name, transaction_date,
-                           created_at, updated_at
-                    FROM expenses
-                    WHERE user_id = %s
-                    """
-
+                    where_sql = "user_id = %s"
                     params = [user_id]
 
                     # 필터링 조건 추가
                     if filters:
                         if filters.get('start_date'):
-                            base_sql += " AND transaction_date >= %s"
+                            where_sql += " AND transaction_date >= %s"
                             params.append(filters['start_date'])
                         if filters.get('end_date'):
-                            base_sql += " AND transaction_date <= %s"
+                            where_sql += " AND transaction_date <= %s"
                             params.append(filters['end_date'])
                         if filters.get('category'):
-                            base_sql += " AND category = %s"
+                            where_sql += " AND category = %s"
                             params.append(filters['category'])
                         if filters.get('transaction_type'):
-                            base_sql += " AND transaction_type = %s"
+                            where_sql += " AND transaction_type = %s"
                             params.append(filters['transaction_type'])
 
-                    base_sql += " ORDER BY transaction_date DESC, id DESC"
-
-                    cur.execute(base_sql, params)
-                    expenses = [dict(row) for row in cur.fetchall()]
-
-                    # 요약 통계 계산
-                    summary_sql = """
+                    # 집계 행: GROUPING() 비트 0 = (카테고리, 소분류, 유형), 6 = 유형별 합계, 7 = 전체
+                    sql = f"""
+                    WITH filtered AS MATERIALIZED (
+                        SELECT id, transaction_type, amount, currency, category, subcategory,
+                               name, memo, payment_method, payment_method_name, transaction_date,
+                               created_at, updated_at
+                        FROM expenses
+                        WHERE {where_sql}
+                    )
                     SELECT
-                        SUM(CASE WHEN transaction_type = '수입' THEN amount ELSE 0 END) as total_income,
-                        SUM(CASE WHEN transaction_type = '지출' THEN amount ELSE 0 END) as total_expense,
-                        COUNT(*) as total_transactions
-                    FROM expenses
-                    WHERE user_id = %s
+                        'aggregate' AS row_kind,
+                        GROUPING(category, subcategory, transaction_type) AS grouping_level,
+                        NULL::integer AS id, transaction_type, SUM(amount) AS amount, NULL AS currency,
+                        category, subcategory, NULL AS name, NULL AS memo,
+                        NULL AS payment_method, NULL AS payment_method_name,
+                        NULL::date AS transaction_date, NULL::timestamp AS created_at,
+                        NULL::timestamp AS updated_at,
+                        COUNT(*) AS transaction_count
+                    FROM filtered
+                    GROUP BY GROUPING SETS ((category, subcategory, transaction_type), (transaction_type), ())
                     """
-
-                    summary_params = [user_id]
-
-                    # 필터 조건을 요약에도 적용
-                    if filters:
-                        if filters.get('start_date'):
-                            summary_sql += " AND transaction_date >= %s"
-                            summary_params.append(filters['start_date'])
-                        if filters.get('end_date'):
-                            summary_sql += " AND transaction_date <= %s"
-                            summary_params.append(filters['end_date'])
-
-                    cur.execute(summary_sql, summary_params)
-                    summary_row = cur.fetchone()
-
-                    total_income = float(summary_row['total_income'] or 0)
-                    total_expense = float(summary_row['total_expense'] or 0)
-                    net_amount = total_income - total_expense
-
-                    # 카테고리별 집계
-                    category_sql = """
+                    if not summary_only:
+                        sql += """
+                    UNION ALL
                     SELECT
-                        category,
-                        subcategory,
-                        transaction_type,
-                        SUM(amount) as total_amount,
-                        COUNT(*) as transaction_count
-                    FROM expenses
-                    WHERE user_id = %s
+                        'row', NULL, id, transaction_type, amount, currency,
+                        category, subcategory, name, memo,
+                        payment_method, payment_method_name,
+                        transaction_date, created_at,
+                        updated_at,
+                        NULL
+                    FROM filtered
                     """
+                    sql += " ORDER BY row_kind, transaction_date DESC, id DESC"
 
-                    category_params = [user_id]
-                    if filters:
-                        if filters.get('start_date'):
-                            category_sql += " AND transaction_date >= %s"
-                            category_params.append(filters['start_date'])
-                        if filters.get('end_date'):
-                            category_sql += " AND transaction_date <= %s"
-                            category_params.append(filters['end_date'])
+                    cur.execute(sql, params)
+
+                    expenses = []
+                    categories = []
+                    totals_by_type = {}
+                    total_transactions = 0
+                    for row in cur.fetchall():
+                        if row['row_kind'] == 'row':
+                            expense = dict(row)
+                            del expense['row_kind'], expense['grouping_level'], expense['transaction_count']
+                            expenses.append(expense)
+                        elif row['grouping_level'] == 0:
+                            categories.append({
+                                "category": row['category'],
+                                "subcategory": row['subcategory'],
+                                "transaction_type": row['transaction_type'],
+                                "total_amount": row['amount'],
+                                "transaction_count": row['transaction_count']
+                            })
+                        elif row['grouping_level'] == 7:
+                            total_transactions = row['transaction_count'] or 0
+                        else:
+                            totals_by_type[row['transaction_type']] = float(row['amount'] or 0)
 
-                    category_sql += " GROUP BY category, subcategory, transaction_type ORDER BY total_amount DESC"
+                    categories.sort(key=lambda item: item['total_amount'] or 0, reverse=True)
 
-                    cur.execute(category_sql, category_params)
-                    categories = [dict(row) for row in cur.fetchall()]
+                    total_income = totals_by_type.get('수입', 0.0)
+                    total_expense = totals_by_type.get('지출', 0.0)
+                    net_amount = total_income - total_expense
 
                     return {
                         "status": "success",
@@ -2081,7 +2379,7 @@ class PostgresDatabaseService:
                             "total_income": total_income,
                             "total_expense": total_expense,
                             "net_amount": net_amount,
-                            "total_transactions": summary_row['total_transactions'] or 0
+                            "total_transactions": total_transactions
                         },
                         "by_category": categories
                     }
@@ -2101,8 +2399,8 @@ class PostgresDatabaseService:
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # 기존 거래내역 조회
-                    cur.execute("SELECT * FROM expenses WHERE id = %s", (expense_id,))
+                    # 기존 거래내역 조회 (월별 집계에서 뺄 수정 전 값, 동시 수정/삭제가 같은 값을 빼지 않도록 행 잠금)
+                    cur.execute("SELECT * FROM expenses WHERE id = %s FOR UPDATE", (expense_id,))
                     expense = cur.fetchone()
 
                     if not expense:
@@ -2169,10 +2467,15 @@ class PostgresDatabaseService:
                         values.append(user_id)
                     else:
                         sql = f"UPDATE expenses SET {', '.join(update_fields)} WHERE id = %s"
+                    sql += " RETURNING user_id, transaction_type, amount, category, subcategory, transaction_date"
 
                     cur.execute(sql, values)
+                    updated = cur.fetchone()
 
-                    if cur.rowcount > 0:
+                    if updated:
+                        # 월별 집계: 수정 전 값을 빼고 수정 후 값을 더함
+                        self._apply_expense_rollup(cur, expense, -1)
+                        self._apply_expense_rollup(cur, updated, 1)
                         conn.commit()
                         return {
                             "status": "success",
@@ -2210,12 +2513,15 @@ class PostgresDatabaseService:
                     expense = dict(expense)
 
                     # 삭제 쿼리 실행 (user_id 조건 추가)
+                    # 월별 집계에서 뺄 값은 실제로 삭제된 행(RETURNING) 기준 (동시 삭제/수정 시 중복 차감 방지)
                     if user_id:
-                        cur.execute("DELETE FROM expenses WHERE id = %s AND user_id = %s", (expense_id, user_id))
+                        cur.execute("DELETE FROM expenses WHERE id = %s AND user_id = %s RETURNING *", (expense_id, user_id))
                     else:
-                        cur.execute("DELETE FROM expenses WHERE id = %s", (expense_id,))
+                        cur.execute("DELETE FROM expenses WHERE id = %s RETURNING *", (expense_id,))
+                    deleted = cur.fetchone()
 
-                    if cur.rowcount > 0:
+                    if deleted:
+                        self._apply_expense_rollup(cur, dict(deleted), -1)
                         conn.commit()
                         return {
                             "status": "success",
@@ -2311,7 +2617,7 @@ class PostgresDatabaseService:
             }
 
     def get_budget_progress(self, user_id: int, year: int, month: int) -> Dict[str, Any]:
-        """예산 진행률 조회 (예산 vs 실제 지출 비교)"""
+        """예산 진행률 조회 (예산 vs 실제 지출 비교, 실제 지출은 월별 집계 테이블에서 조회)"""
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
@@ -2335,14 +2641,14 @@ class PostgresDatabaseService:
                         SELECT
                             category,
                             subcategory,
-                            SUM(amount) as actual_expense
-                        FROM expenses
+                            SUM(total_amount) as actual_expense
+                        FROM expense_monthly_rollup
                         WHERE user_id = %s
                         AND transaction_type = '지출'
-                        AND EXTRACT(YEAR FROM transaction_date) = %s
-                        AND EXTRACT(MONTH FROM transaction_date) = %s
+                        AND year = %s
+                        AND month = %s
                         GROUP BY category, subcategory
-                    ) e ON b.category = e.category AND b.subcategory = e.subcategory
+                    ) e ON b.category = e.category AND COALESCE(b.subcategory, '') = e.subcategory
                     WHERE b.user_id = %s AND b.year = %s AND b.month = %s
                     ORDER BY progress_percentage DESC
                     """
@@ -2381,18 +2687,6 @@ class PostgresDatabaseService:
             print(f"PostgreSQL get_expense_budget_goals called for user: {user_id}")
             with self.get_connection() as conn:
                 with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                    # expense_budget_goals 테이블 존재 확인 및 생성
-                    cur.execute("""
-                        CREATE TABLE IF NOT EXISTS expense_budget_goals (
-                            user_id VARCHAR(100) PRIMARY KEY,
-                            expense_goals JSONB DEFAULT '{}'::jsonb,
-                            income_goals JSONB DEFAULT '{}'::jsonb,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    conn.commit()
-
                     cur.execute("SELECT * FROM expense_budget_goals WHERE user_id = %s", (user_id,))
                     result = cur.fetchone()
 
@@ -2429,17 +2723,6 @@ class PostgresDatabaseService:
 
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # 테이블 존재 확인 및 생성
-                    cur.execute("""
-                        CREATE TABLE IF NOT EXISTS expense_budget_goals (
-                            user_id VARCHAR(100) PRIMARY KEY,
-                            expense_goals JSONB DEFAULT '{}'::jsonb,
-                            income_goals JSONB DEFAULT '{}'::jsonb,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-
                     # UPSERT (INSERT ... ON CONFLICT UPDATE)
                     sql = """
                     INSERT INTO expense_budget_goals (user_id, expense_goals, income_goals, updated_at)
@@ -2820,6 +3103,8 @@ class PostgresDatabaseService:
                 'actual': str/float,
                 'forecast': str/float,
                 'previous': str/float,
+                'actual_value': float, 'forecast_value': float, 'previous_value': float,
+                'unit': str,
                 'latest_release': str,
                 'next_release': str
             } or None
@@ -2833,6 +3118,10 @@ class PostgresDatabaseService:
                             actual,
                             forecast,
                             previous,
+                            actual_value,
+                            forecast_value,
+                            previous_value,
+                            unit,
                             release_date,
                             time
                         FROM latest_releases
@@ -2844,7 +3133,7 @@ class PostgresDatabaseService:
                     result = cur.fetchone()
 
                     if result:
-                        return dict(result)
+                        return {**dict(result), **release_values(result)}
                     else:
                         return None
 
@@ -11,6 +11,8 @@
 from typing import Dict, Optional
 from datetime import datetime
 
+from services.value_normalizer import release_number
+
 
 class SentimentCycleService:
     """심리/밸류에이션 사이클 계산 서비스"""
@@ -142,7 +144,7 @@ class SentimentCycleService:
 
         # VIX (역방향: 높을수록 공포 → 낮은 점수, 낮을수록 탐욕 → 높은 점수)
         if 'vix' in data:
-            vix = self._parse_value(data['vix'].get('actual'))
+            vix = self._release_value(data['vix'])
             scores['vix'] = self._score_vix(vix)
         else:
             scores['vix'] = 50.0
@@ -190,26 +192,10 @@ class SentimentCycleService:
         else:
             return 0
 
-    def _parse_value(self, value) -> float:
-        """지표 값 파싱"""
-        if value is None:
-            return 0.0
-
-        if isinstance(value, (int, float)):
-            return float(value)
-
-        value_str = str(value).strip()
-
-        if value_str.endswith('%'):
-            value_str = value_str[:-1]
-
-        if value_str.endswith('K'):
-            value_str = value_str[:-1]
-
-        try:
-            return float(value_str)
-        except ValueError:
-            return 0.0
+    def _release_value(self, release: Dict) -> float:
+        """지표 최신값 (저장 시 정규화된 actual_value 사용, 없으면 0.0)"""
+        value = release_number(release)
+        return value if value is not None else 0.0
 
     def _error_response(self, message: str) -> Dict:
         """에러 응답"""
@@ -0,0 +1,190 @@
+"""
+날짜 인덱스 시계열 변환 (NumPy 벡터 연산)
+
+크롤러(FRED YoY 변환)와 사이클 엔진(N개월 전 값)이 같이 쓰는 공용 모듈.
+날짜는 datetime64[D] 배열, 값은 float64 배열로 한 번만 변환한 뒤
+YoY %, 기간 변화율(MoM), n기간 차이, 이동 평균/표준편차/z-score, as-of 조회를 배열 단위로 계산한다.
+
+- 날짜 배열은 오름차순 (series_from_rows 가 정렬)
+- 계산할 수 없는 칸은 NaN (기준값 없음, 0 으로 나눔, 창 부족, 창 안의 NaN)
+- as-of 조회는 np.searchsorted (지표당 선형 탐색/날짜 재파싱 없음)
+"""
+
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+NAT = np.datetime64('NaT', 'D')
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+
+def to_dates(values: Iterable[Any]) -> np.ndarray:
+    """'YYYY-MM-DD' 문자열/date 목록 → datetime64[D] 배열 (형식이 다르거나 비어 있으면 NaT)"""
+    items = list(values)
+    try:
+        if all(isinstance(value, str) and len(value) == 10 and value[4] == '-' and value[7] == '-' for value in items):
+            return np.array(items, dtype='datetime64[D]')
+    except ValueError:
+        pass
+    return np.array([_to_date(value) for value in items], dtype='datetime64[D]')
+
+
+def _to_date(value: Any) -> np.datetime64:
+    if isinstance(value, datetime):
+        return np.datetime64(value.date(), 'D')
+    if isinstance(value, date):
+        return np.datetime64(value, 'D')
+    text = str(value).strip() if value is not None else ''
+    if len(text) != 10 or text[4] != '-' or text[7] != '-':
+        return NAT
+    try:
+        return np.datetime64(text, 'D')
+    except ValueError:
+        return NAT
+
+
+def to_date(value: DateLike) -> np.datetime64:
+    """단일 날짜 → datetime64[D] (datetime 은 날짜 부분만)"""
+    if isinstance(value, np.datetime64):
+        return value.astype('datetime64[D]')
+    return _to_date(value)
+
+
+def series_from_rows(rows: List[Dict[str, Any]], date_key: str = 'date',
+                     value: Union[str, Callable[[Dict[str, Any]], Optional[float]]] = 'value') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """dict 행 목록 → (날짜 오름차순, 값, 원래 행 인덱스)
+
+    날짜가 없거나 형식이 잘못된 행은 제외한다. 값이 None 이면 NaN.
+
+    Args:
+        value: 값 키 또는 행 → 숫자 함수 (예: release_number)
+    """
+    getter = value if callable(value) else (lambda row: row.get(value))
+    dates = to_dates(row.get(date_key) for row in rows)
+    values = np.array([_to_float(getter(row)) for row in rows], dtype=float)
+    valid = ~np.isnat(dates)
+    index = np.flatnonzero(valid)
+    order = np.argsort(dates[valid], kind='stable')
+    return dates[valid][order], values[valid][order], index[order]
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value) if value is not None else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+
+# ---------- as-of 조회 ----------
+
+def asof_index(dates: np.ndarray, targets: Union[np.ndarray, DateLike]) -> Union[np.ndarray, int]:
+    """target 이하인 가장 최근 날짜의 인덱스 (없으면 -1), dates 는 오름차순"""
+    if not isinstance(targets, np.ndarray):
+        return int(np.searchsorted(dates, to_date(targets), side='right')) - 1
+    return np.searchsorted(dates, targets, side='right') - 1
+
+
+def asof(dates: np.ndarray, values: np.ndarray, target: DateLike) -> Optional[float]:
+    """target 시점 기준 가장 최근 값 (없으면 None)"""
+    index = asof_index(dates, target)
+    return float(values[index]) if index >= 0 else None
+
+
+def lag_index(dates: np.ndarray, days: int) -> np.ndarray:
+    """각 관측치의 days 일 전 시점 as-of 인덱스 (없으면 -1)"""
+    return asof_index(dates, dates - np.timedelta64(days, 'D'))
+
+
+# ---------- 변화율/차이 ----------
+
+def _ratio_change(values: np.ndarray, base: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = (values - base) / base * 100
+    change[~np.isfinite(change)] = np.nan
+    return change
+
+
+def yoy_pct(dates: np.ndarray, values: np.ndarray, days: int = 365) -> np.ndarray:
+    """전년동기 대비 % (days 일 전 시점 as-of 값 기준, 기준값이 없거나 0 이면 NaN)"""
+    index = lag_index(dates, days)
+    base = np.where(index >= 0, values[np.maximum(index, 0)], np.nan)
+    return _ratio_change(values, base)
+
+
+def pct_change(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """n 기간 전 대비 % (월간 시계열이면 MoM)"""
+    base = shift(values, periods)
+    return _ratio_change(values, base)
+
+
+def diff(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """n 기간 전 대비 차이"""
+    return values - shift(values, periods)
+
+
+def shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """n 기간 뒤로 민 배열 (앞부분 NaN)"""
+    shifted = np.full(values.shape, np.nan)
+    if 0 < periods < len(values):
+        shifted[periods:] = values[:-periods]
+    elif periods == 0:
+        shifted[:] = values
+    return shifted
+
+
+# ---------- 이동 통계 ----------
+# 누적합으로 창 합계를 구해 창 크기와 무관하게 O(n) (분산은 전체 평균을 빼고 계산해 자릿수 손실 완화)
+
+def _window_sums(values: np.ndarray, window: int) -> Optional[np.ndarray]:
+    """창 합계 (창 안에 NaN 이 있으면 NaN)"""
+    if window < 1 or len(values) < window:
+        return None
+    missing = np.isnan(values)
+    cumsum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values))))
+    counts = np.concatenate(([0], np.cumsum(missing)))
+    sums = cumsum[window:] - cumsum[:-window]
+    sums[(counts[window:] - counts[:-window]) > 0] = np.nan
+    return sums
+
+
+def _pad(result: np.ndarray, length: int) -> np.ndarray:
+    padded = np.full(length, np.nan)
+    padded[length - len(result):] = result
+    return padded
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """window 개 이동 평균 (창이 채워지기 전은 NaN)"""
+    sums = _window_sums(values, window)
+    if sums is None:
+        return np.full(len(values), np.nan)
+    return _pad(sums / window, len(values))
+
+
+def rolling_std(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """window 개 이동 표준편차 (표본 표준편차 기본)"""
+    if window <= ddof or len(values) < window:
+        return np.full(len(values), np.nan)
+    centered = values - np.nanmean(values)
+    sums = _window_sums(centered, window)
+    squares = _window_sums(centered * centered, window)
+    variance = np.maximum((squares - sums * sums / window) / (window - ddof), 0.0)
+    return _pad(np.sqrt(variance), len(values))
+
+
+def rolling_zscore(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """(값 - 이동 평균) / 이동 표준편차 (표준편차 0 이면 NaN)"""
+    mean = rolling_mean(values, window)
+    std = rolling_std(values, window, ddof)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zscore = (values - mean) / std
+    zscore[~np.isfinite(zscore) | (std <= 1e-12 * np.abs(mean))] = np.nan
+    return zscore
+
+
+def to_pandas(dates: np.ndarray, values: np.ndarray):
+    """pandas.Series (DatetimeIndex) 로 변환 (resample 등 추가 분석용)"""
+    import pandas as pd
+    return pd.Series(values, index=pd.DatetimeIndex(dates))
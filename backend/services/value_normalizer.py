@@ -0,0 +1,110 @@
+"""지표값 정규화 (문자열 → 숫자 + 단위)
+
+크롤러가 저장하는 actual/forecast/previous 원문 문자열("3.2%", "218K", "-251,300M")을
+저장 시점에 한 번만 파싱하기 위한 공용 모듈.
+
+- 숫자는 표시 배율 그대로 유지한다 (218K → 218.0, 단위 "K")
+- 쉼표 제거, 접미사 %/K/M/B/T 는 단위로 분리
+- 파싱 불가 값은 (None, None)
+"""
+
+import math
+from typing import Any, Dict, Optional, Tuple
+
+UNIT_SUFFIXES = ("%", "K", "M", "B", "T")
+
+VALUE_FIELDS = ("actual", "forecast", "previous")
+
+
+def normalize_value(value: Any) -> Tuple[Optional[float], Optional[str]]:
+    """원문 지표값을 (숫자, 단위) 로 변환
+
+    Args:
+        value: 원본 지표값 (str, int, float, None)
+
+    Returns:
+        (float 또는 None, 단위 문자열 또는 None)
+    """
+    if value is None or isinstance(value, bool):
+        return None, None
+
+    if isinstance(value, (int, float)):
+        number = float(value)
+        if math.isnan(number) or math.isinf(number):
+            return None, None
+        return number, None
+
+    text = str(value).strip().replace(",", "")
+    if not text:
+        return None, None
+
+    unit = None
+    suffix = text[-1].upper()
+    if suffix in UNIT_SUFFIXES:
+        unit = suffix
+        text = text[:-1].strip()
+
+    try:
+        number = float(text)
+    except ValueError:
+        return None, None
+
+    if math.isnan(number) or math.isinf(number):
+        return None, None
+    return number, unit
+
+
+def to_number(value: Any) -> Optional[float]:
+    """원문 지표값을 숫자로 변환 (실패 시 None)"""
+    return normalize_value(value)[0]
+
+
+def normalize_release(actual: Any = None, forecast: Any = None, previous: Any = None) -> Dict[str, Any]:
+    """actual/forecast/previous 를 DB 숫자 컬럼 형태로 정규화
+
+    단위는 actual → forecast → previous 순으로 처음 발견된 것을 사용한다.
+
+    Returns:
+        {"actual_value", "forecast_value", "previous_value", "unit"}
+    """
+    result: Dict[str, Any] = {"unit": None}
+    for field, raw in zip(VALUE_FIELDS, (actual, forecast, previous)):
+        number, unit = normalize_value(raw)
+        result[f"{field}_value"] = number
+        if result["unit"] is None and unit is not None:
+            result["unit"] = unit
+    return result
+
+
+def release_values(row: Dict[str, Any], include_actual: bool = True) -> Dict[str, Any]:
+    """DB 행의 숫자/단위 컬럼을 API 응답 필드로 변환
+
+    숫자 컬럼이 채워지기 전에 저장된 행은 원문을 정규화해서 채운다.
+
+    Returns:
+        {"actual_value", "forecast_value", "previous_value", "unit"}
+        (include_actual=False 이면 actual_value 제외)
+    """
+    fields = VALUE_FIELDS if include_actual else VALUE_FIELDS[1:]
+    if all(row.get(f"{field}_value") is None for field in fields):
+        row = normalize_release(
+            row.get("actual") if include_actual else None,
+            row.get("forecast"),
+            row.get("previous")
+        )
+    values = {f"{field}_value": row.get(f"{field}_value") for field in fields}
+    values["unit"] = row.get("unit")
+    return values
+
+
+def release_number(release: Optional[Dict[str, Any]], field: str = "actual") -> Optional[float]:
+    """API/DB 응답 dict 에서 숫자값 추출
+
+    `<field>_value` 가 있으면 그대로 사용하고, 없으면 (이전 버전 행) 원문을 파싱한다.
+    """
+    if not release:
+        return None
+    number = release.get(f"{field}_value")
+    if number is not None:
+        return float(number)
+    return to_number(release.get(field))